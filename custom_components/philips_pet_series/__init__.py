@@ -3,20 +3,22 @@ from __future__ import annotations
 import asyncio
 import importlib
 import ipaddress
-import json
 import datetime as dt
 import logging
 import os
 import sys
+import time
+from collections.abc import Callable
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.loader import async_get_integration
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -34,14 +36,16 @@ except ImportError as e:
     _LOGGER.error("Failed to import petsseries module: %s", e)
     raise
 
-from petsseries.models import Event
+from petsseries.models import Event, EventType
 
 from petsseries import PetsSeriesClient
 
 from .const import (
+    CONF_CAMERA_MODE,
     CONF_COUNTRY,
     CONF_HOME_IDS,
     CONF_ID_TOKEN,
+    CONF_IDLE_TIMEOUT,
     CONF_LANGUAGE,
     CONF_TIMEZONE,
     COUNTRY_DIAL_CODES,
@@ -49,10 +53,49 @@ from .const import (
     REMOVED_DP_SENSORS,
 )
 from . import websocket
-from .bridge import PhilipsCameraBridgeManager
+from .commands import CommandRouter
+from .bridge import CAMERA_MODE_DISABLED, PhilipsCameraBridgeManager
+from .event_history import EventHistory, EventIndex, async_remove_journal
 from .frontend import JSModuleRegistration
 from .lanbeacon import BeaconListener
-from .datapoints import datapoints
+from .key_inventory import KeyInventory, storage_key as key_inventory_storage_key
+from .live import LiveUpdates
+from .tuya_cloud import TuyaCloudReader, release_signer
+from .tuya_local import LocalTuyaManager
+from .tuya_session import TuyaSessionStore, storage_key as tuya_session_storage_key
+from .datapoints import SCHEMA as DATAPOINT_SCHEMA
+from .definition_cache import (
+    DefinitionCache,
+    firmware_signal,
+    storage_key as definitions_storage_key,
+)
+from .snapshot import (
+    ALL_CHANGED,
+    EMPTY_SNAPSHOT,
+    NOTHING_CHANGED,
+    Snapshot,
+    SnapshotChanges,
+)
+from .snapshot_store import (
+    RESTORED_TIERS,
+    SnapshotStore,
+    dump_datasets,
+    restore_datasets,
+    storage_key as snapshot_storage_key,
+)
+from .schedule import (
+    TIER_DEFINITIONS,
+    TIER_DISCOVERY,
+    TIER_EVENTS,
+    TIER_FIRMWARE,
+    TIER_INVENTORY,
+    TIER_INVITES,
+    TIER_MEALS,
+    TIER_SETTINGS,
+    TIER_STATUS,
+    RefreshSchedule,
+)
+from .throttle import FetchBudget
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -67,42 +110,271 @@ PLATFORMS = [
     Platform.CAMERA,
 ]
 
-SCAN_INTERVAL = timedelta(minutes=5)
-
-# Days of event history to request.  Enough that entities survive a local
+# Days of event history to retain.  Enough that entities survive a local
 # midnight rollover and a fault raised late in the evening stays visible.
 EVENT_HISTORY_DAYS = 7
 
+# Fetch budget for one refresh.  Requests to independent homes, devices and
+# datasets run in parallel, but never more than FETCH_CONCURRENCY at once and
+# never started faster than FETCH_RATE per second (with FETCH_BURST allowed
+# back-to-back).  This replaces the fixed sleep after every call, which made a
+# refresh for a couple of feeders take tens of seconds of wall time.  The Tuya
+# cloud DP calls still queue on petsseries' own session lock, so the overlap
+# comes mostly from the Philips REST calls running alongside them.
+FETCH_CONCURRENCY = 4
+FETCH_RATE = 4.0
+FETCH_BURST = 8
+
+# Marks a fetch that failed, as opposed to one that returned nothing.
+_FAILED = object()
+
+# While datapoint changes are pushed live, polling the status only reconciles
+# what a dropped message may have missed.
+LIVE_STATUS_TIER = (timedelta(minutes=15), timedelta(hours=1))
+
+# How long after a write or a feed the device's cloud status and events are
+# read back; the cloud reflects a change a moment after accepting it.
+CONFIRM_DELAY = timedelta(seconds=3)
+FEED_EVENT_DELAY = timedelta(seconds=10)
+
+# Entry keys the client rewrites on every token refresh, and the options that
+# only the camera bridge reads.
+_TOKEN_KEYS = frozenset({"access_token", "refresh_token", CONF_ID_TOKEN})
+_BRIDGE_SETTINGS = frozenset({CONF_CAMERA_MODE, CONF_IDLE_TIMEOUT})
+
+
+def _event_window(wall_now):
+    """``(retain_from, to_date)`` of the event history as of ``wall_now``.
+
+    Looks back several days rather than only at today: a midnight-only window
+    empties every event-derived entity at local midnight, which made "last
+    event" sensors go unknown and fault conditions clear themselves on the date
+    rollover instead of when actually resolved.
+    """
+    midnight = wall_now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight - timedelta(days=EVENT_HISTORY_DAYS), midnight + timedelta(days=1)
+
 
 class PhilipsPetsSeriesDataUpdateCoordinator(DataUpdateCoordinator):
-    """Coordinator to fetch data for Philips Pets Series sensors."""
+    """Coordinator to fetch data for Philips Pets Series sensors.
+
+    Each dataset belongs to a refresh tier (see ``schedule``).  The latest value
+    of every dataset is kept in ``_datasets`` keyed by tier, and each cycle only
+    re-fetches the tiers that are due before assembling the data the entities
+    read.
+    """
 
     def __init__(
         self,
         hass: HomeAssistant,
         client: PetsSeriesClient,
-        delay_between_calls: float = 1,
+        max_concurrency: int = FETCH_CONCURRENCY,
+        rate_limit: float = FETCH_RATE,
+        rate_burst: int = FETCH_BURST,
         home_ids: list[str] | None = None,
         tuya_device_id: str | None = None,
+        tiers: dict | None = None,
+        entry_id: str | None = None,
     ):
         """Initialize the coordinator."""
+        self.schedule = RefreshSchedule(tiers)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=self.schedule.base_interval,
         )
         self._client = client
-        self.delay_between_calls = delay_between_calls
+        self._budget = FetchBudget(max_concurrency, rate_limit, rate_burst)
+        # Per-device Tuya reads are batched and shared with the camera bridge;
+        # a batch takes one budget slot.
+        self.cloud = TuyaCloudReader(hass, client, self._budget)
+        self.key_inventory = KeyInventory(hass, self.cloud, entry_id)
+        self.definitions = DefinitionCache(hass, entry_id)
+        self._snapshot_store = SnapshotStore(hass, entry_id) if entry_id else None
+        self.tuya_session = TuyaSessionStore(hass, entry_id) if entry_id else None
         self.home_ids = set(home_ids or [])
         self._tuya_device_id = tuya_device_id
         self._ota_store = Store(hass, 1, f"{DOMAIN}.ota_history")
         self.ota_history: dict[str, list[dict]] = {}
+        self._datasets: dict[str, dict] = {name: {} for name in self.schedule.tiers}
+        self.event_history = EventHistory(hass, entry_id)
+        # What the latest refresh changed compared with the one before, for
+        # entities to skip writing state that did not change.
+        self.changes: SnapshotChanges = NOTHING_CHANGED
+        # Whether datapoint changes are currently pushed over MQTT.
+        self.live = False
+        # Datapoints pushed per device since its status was last polled, with
+        # when they arrived, so a poll already in flight cannot undo them.
+        self._pushed: dict[str, dict[str, tuple[float, object]]] = {}
+        # Per device: the cancel callback, loop-time deadline and event type.
+        self._pending_device_refreshes: dict[
+            str, tuple[Callable[[], None], float, str | None]
+        ] = {}
 
     def tuya_device_id(self, device) -> str:
         """Return the Tuya devId associated with a Philips device."""
         return getattr(device, "vendor_id", None) or self._tuya_device_id or device.id
 
+    def local_keys(self) -> dict[str, tuple[str, str]]:
+        """``{Tuya devId: (device id, localKey)}`` for devices whose key is known.
+
+        The localKey decrypts what a device reports over MQTT and keys its LAN
+        sessions.  It comes from the stored key inventory, or from the cloud
+        device definition for a device the inventory does not hold.
+        """
+        keys = {}
+        if self.data is None:
+            return keys
+        for device_id, device_data in self.data.by_device.items():
+            tuya_id = str(self.tuya_device_id(device_data.device))
+            credentials = self.key_inventory.get(tuya_id)
+            if credentials is not None:
+                local_key = credentials.local_key
+            else:
+                definition = device_data.definition
+                local_key = definition.get("localKey") if definition else None
+            if local_key:
+                keys[tuya_id] = (device_id, str(local_key))
+        return keys
+
+    @callback
+    def async_local_key_rejected(self, tuya_id: str) -> None:
+        """A device refused the localKey held for it; look it up again."""
+        _LOGGER.debug("Device %s rejected its localKey; refreshing it", tuya_id)
+        self.key_inventory.invalidate(tuya_id)
+        self.definitions.invalidate(tuya_id)
+        self.cloud.forget(tuya_id)
+        self.hass.async_create_task(self.async_request_tier_refresh(TIER_DEFINITIONS))
+
+    async def _ensure_local_keys(self, devices) -> None:
+        await self.key_inventory.async_ensure(
+            str(self.tuya_device_id(device)) for device in devices
+        )
+
+    async def async_request_tier_refresh(self, *tiers: str) -> None:
+        """Refresh soon, including the given tiers even if they are not due.
+
+        A plain refresh only fetches what is due, so after a write the tiers it
+        affects have to be asked for explicitly to be read back.
+        """
+        self.schedule.request(*tiers)
+        await self.async_request_refresh()
+
+    @callback
+    def async_set_live(self, live: bool) -> None:
+        """Poll the status tier slowly while live pushes keep it current."""
+        if live == self.live:
+            return
+        self.live = live
+        self.schedule.retune(TIER_STATUS, LIVE_STATUS_TIER if live else None)
+        self.update_interval = self.schedule.base_interval
+        if not live:
+            # Whatever was missed while the push channel was down.
+            self.schedule.request(TIER_STATUS)
+
+    @callback
+    def async_apply_dps(self, device_id: str, dps: dict) -> None:
+        """Apply a pushed DP report to the current data without polling.
+
+        Listeners are told directly instead of through
+        ``async_set_updated_data``, which would also push back the next
+        scheduled poll and, with frequent reports, starve the slower tiers.
+        """
+        snapshot = self.data
+        current = snapshot.device(device_id) if snapshot is not None else None
+        if current is None or not dps:
+            return
+        now = time.monotonic()
+        pushed = self._pushed.setdefault(device_id, {})
+        for key, value in dps.items():
+            pushed[str(key)] = (now, value)
+        update = DATAPOINT_SCHEMA.decode(dps, current.device.product_ctn)
+        status = DATAPOINT_SCHEMA.apply(current.status, dps, current.device.product_ctn)
+        if DATAPOINT_SCHEMA.reported(update, "feed_num"):
+            # A feed was just dispensed; fetch the event it produced.
+            self.async_schedule_device_refresh(
+                device_id, EventType.MEAL_DISPENSED.value, FEED_EVENT_DELAY
+            )
+        if status == current.status:
+            return
+        self._datasets[TIER_STATUS][device_id] = status
+        updated = snapshot.with_status(device_id, status)
+        self.changes = updated.changes(snapshot)
+        self.data = updated
+        self.async_update_listeners()
+
+    @callback
+    def async_schedule_device_refresh(
+        self,
+        device_id: str,
+        event_type: str | None = None,
+        delay: timedelta = CONFIRM_DELAY,
+    ) -> None:
+        """Run ``async_refresh_device`` after ``delay``.
+
+        A refresh already pending for the device is merged into this one, so a
+        burst of writes is confirmed by a single read.  The merged refresh runs
+        at the later of the two deadlines: a feed's event fetch waits for the
+        cloud to record the meal even when a quicker write follows it.
+        """
+        deadline = self.hass.loop.time() + delay.total_seconds()
+        pending = self._pending_device_refreshes.pop(device_id, None)
+        if pending is not None:
+            cancel, pending_deadline, pending_type = pending
+            cancel()
+            deadline = max(deadline, pending_deadline)
+            event_type = event_type or pending_type
+
+        @callback
+        def _run(_now) -> None:
+            self._pending_device_refreshes.pop(device_id, None)
+            self.hass.async_create_task(self.async_refresh_device(device_id, event_type))
+
+        cancel = async_call_later(
+            self.hass,
+            deadline - self.hass.loop.time(),
+            HassJob(_run, cancel_on_shutdown=True),
+        )
+        self._pending_device_refreshes[device_id] = (cancel, deadline, event_type)
+
+    async def async_refresh_device(self, device_id: str, event_type: str | None = None) -> None:
+        """Re-fetch one device's live status, and optionally one event type.
+
+        Confirms a write without a full refresh of every home, dataset and
+        device: one status request, plus one event request for the device's
+        home when ``event_type`` is given.
+
+        It runs as a background task, so errors are handled here the way
+        ``_async_update_data`` handles them rather than left unretrieved.
+        """
+        try:
+            await self._async_refresh_device(device_id, event_type)
+        except ConfigEntryAuthFailed:
+            # A regular refresh raises it again, which starts reauthentication.
+            await self.async_request_refresh()
+        except Exception as err:
+            _LOGGER.exception("Error refreshing device %s: %s", device_id, err)
+
+    async def _async_refresh_device(self, device_id: str, event_type: str | None) -> None:
+        current = self.data.device(device_id) if self.data is not None else None
+        if current is None:
+            return
+        fetches = [self._fetch_status(current.device)]
+        if event_type is not None and current.home is not None:
+            fetches.append(self._fetch_event_type(current.home, event_type))
+        status, *_events = await asyncio.gather(*fetches)
+        if status is not _FAILED:
+            self._datasets[TIER_STATUS][device_id] = status
+        # A full refresh may have replaced the data while the requests ran.
+        snapshot = self.data
+        updated = self._assemble(
+            list(snapshot.homes), dict(snapshot.home_devices), snapshot.event_types
+        )
+        self.changes = updated.changes(snapshot)
+        self.data = updated
+        self.async_update_listeners()
+
     async def _load_ota_history(self) -> None:
         """Load previously observed OTA metadata once per coordinator."""
         if self.ota_history:
@@ -111,220 +383,362 @@ class PhilipsPetsSeriesDataUpdateCoordinator(DataUpdateCoordinator):
         if isinstance(stored, dict):
             self.ota_history = stored
 
-    async def _save_ota_records(self, device_id: str, records: list[dict]) -> None:
+    async def _save_ota_records(self, records_by_device: dict[str, list[dict]]) -> None:
         """Persist OTA records so signed URLs are captured when offered."""
-        if not records:
+        changed = False
+        for device_id, records in records_by_device.items():
+            if records and self.ota_history.get(device_id) != records:
+                self.ota_history[device_id] = records
+                changed = True
+        if changed:
+            await self._ota_store.async_save(self.ota_history)
+
+    async def _fetch(self, func, *args, **kwargs):
+        """Run one cloud request inside the shared fetch budget."""
+        async with self._budget:
+            return await func(*args, **kwargs)
+
+    async def _fetch_events(self, home, event_types, retain_from, to_date, now):
+        """Sync one home's events and return its retained history by type.
+
+        The events endpoint takes a comma-separated type filter, so one request
+        per home replaces one per type per home, and the event history narrows
+        that request to what is newer than the last sync.
+        """
+        type_values = [getattr(event_type, "value", event_type) for event_type in event_types]
+        from_date = self.event_history.window_start(home.id, retain_from)
+        try:
+            events = await self._fetch(
+                self._client.events.get_events,
+                home,
+                from_date=from_date,
+                to_date=to_date,
+                types=",".join(type_values),
+            )
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch events for home %s: %s", home.id, e)
+            return _FAILED
+        self.event_history.merge(home.id, events, from_date, now, retain_from)
+        return self.event_history.events_by_type(home.id, type_values)
+
+    async def _fetch_event_type(self, home, type_value: str) -> None:
+        """Sync one event type of one home into the retained history."""
+        wall_now = dt_util.now()
+        retain_from, to_date = _event_window(wall_now)
+        from_date = self.event_history.window_start(home.id, retain_from)
+        try:
+            events = await self._fetch(
+                self._client.events.get_events,
+                home,
+                from_date=from_date,
+                to_date=to_date,
+                types=type_value,
+            )
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch %s events for home %s: %s", type_value, home.id, e)
             return
-        self.ota_history[device_id] = records
-        await self._ota_store.async_save(self.ota_history)
+        self.event_history.merge(
+            home.id, events, from_date, wall_now, retain_from, types={type_value}
+        )
+        self._datasets[TIER_EVENTS][home.id] = self.event_history.events_by_type(
+            home.id, [event_type.value for event_type in Event.get_event_types()]
+        )
+        await self.event_history.async_save()
 
-    async def _async_update_data(self):
-        """Fetch data from API."""
+    async def _fetch_settings(self, home, device):
         try:
-            await self._load_ota_history()
-            try:
-                homes = await self._client.get_homes()
-            except RuntimeError as err:
-                # A config-entry reload can leave the old aiohttp session
-                # closed while the coordinator task is still winding down.
-                if "Session is closed" not in str(err):
-                    raise
-                self._client.session = None
-                homes = await self._client.get_homes()
-            if self.home_ids:
-                homes = [home for home in homes if str(home.id) in self.home_ids]
-            devices = []
-            home_devices_by_home = {}
-            meals = []
-            events_by_home_and_type = {}
-            invites_by_home = {}
-            settings = {}
-            full_settings = {}
-            firmware_info = {}
-            product_firmware_info = {}
-            device_definitions = {}
-            event_types = Event.get_event_types()
-            tuya_status = None
-            use_local_tuya = False
-            if self._client.tuya_client:
-                try:
-                    configured_ip = getattr(self._client.tuya_client.device, "address", None)
-                    use_local_tuya = bool(configured_ip and ipaddress.ip_address(configured_ip).is_private)
-                except (ValueError, AttributeError):
-                    use_local_tuya = False
-            if use_local_tuya:
-                try:
-                    # This is account/device-global; fetching it once avoids one
-                    # blocking LAN request per device on every coordinator cycle.
-                    tuya_status = await asyncio.to_thread(self._client.get_tuya_status)
-                except Exception as err:
-                    _LOGGER.warning("Failed to fetch Tuya status: %s", err)
-            now = dt_util.now()
-            # Look back several days rather than only at today: a midnight-only
-            # window empties every event-derived entity at local midnight, which
-            # made "last event" sensors go unknown and fault conditions clear
-            # themselves on the date rollover instead of when actually resolved.
-            from_date = now.replace(
-                hour=0, minute=0, second=0, microsecond=0
-            ) - timedelta(days=EVENT_HISTORY_DAYS)
-            to_date = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(
-                days=1
-            )
+            return await self._fetch(self._client.get_settings, home, device.id) or {}
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch settings for device %s: %s", device.id, e)
+            return _FAILED
 
-            for home in homes:
-                try:
-                    home_devices = await self._client.get_devices(home)
-                    home_devices_by_home[home.id] = home_devices
-                    devices.extend(home_devices)
-                    _LOGGER.debug("Fetched %d devices for home %s", len(home_devices), home.id)
-                except Exception as e:
-                    _LOGGER.warning("Failed to fetch devices for home %s: %s", home.id, e)
-                    continue
-
-                await asyncio.sleep(self.delay_between_calls)
-
-                # Fetch events
-                for event_type in event_types:
-                    try:
-                        home_events = await self._client.events.get_events(
-                            home,
-                            from_date=from_date,
-                            to_date=to_date,
-                            types=str(event_type),
-                        )
-                        event_type_str = (
-                            event_type
-                            if isinstance(event_type, str)
-                            else (
-                                event_type.value
-                                if hasattr(event_type, "value")
-                                else str(event_type)
-                            )
-                        )
-
-                        key = f"{home.id}_{event_type_str}"
-                        events_by_home_and_type[key] = home_events
-                    except Exception as e:
-                        _LOGGER.warning("Failed to fetch events %s for home %s: %s", event_type, home.id, e)
-
-                    await asyncio.sleep(self.delay_between_calls)
-
-                # Fetch settings for devices
-                for device in home_devices:
-                    try:
-                        device_settings = await self._client.get_settings(home, device.id)
-                        settings[device.id] = device_settings or {}
-                    except Exception as e:
-                        _LOGGER.warning("Failed to fetch settings for device %s: %s", device.id, e)
-                        settings[device.id] = {}
-
-                    # Fetch full settings
-                    try:
-                        device_full_settings = await self._client.devices_manager.get_device_settings(home, device)
-                        full_settings[device.id] = device_full_settings
-                    except Exception as e:
-                        _LOGGER.warning("Failed to fetch full settings for device %s: %s", device.id, e)
-
-                    # Prefer the app-compatible cloud DP status. TinyTuya is
-                    # only a fallback for installations with a real LAN IP.
-                    if device.id in settings:
-                        try:
-                            cloud_device_id = self.tuya_device_id(device)
-                            device_definitions[device.id] = await self._client.get_cloud_device_definition(
-                                cloud_device_id
-                            )
-                            cloud_status = await self._client.get_cloud_device_status(
-                                cloud_device_id
-                            )
-                            if isinstance(cloud_status.get("dps"), str):
-                                cloud_status = {**cloud_status, **json.loads(cloud_status["dps"])}
-                            elif isinstance(cloud_status.get("dps"), dict):
-                                cloud_status = {**cloud_status, **cloud_status["dps"]}
-                            for dp_id, dp_info in datapoints.items():
-                                if str(dp_id) in cloud_status:
-                                    cloud_status[dp_info["dpCode"]] = cloud_status[str(dp_id)]
-                            # The current app uses DP 101 for PAW3300/3320
-                            # quick feeding; older models use DP 201.
-                            if device.product_ctn in {"PAW3300", "PAW3320"} and "101" in cloud_status:
-                                cloud_status["feed_num"] = cloud_status["101"]
-                            settings[device.id]["tuya_status"] = cloud_status
-                        except Exception as err:
-                            _LOGGER.debug("Cloud DP status unavailable for %s: %s", device.id, err)
-                            # Never store None: a present-but-None tuya_status
-                            # makes every entity's .get("tuya_status", {}).get()
-                            # chain crash on add and drop the entity for the
-                            # whole session. Fall back to an empty dict so
-                            # entities load and simply report unavailable until
-                            # the next successful cloud refresh.
-                            settings[device.id]["tuya_status"] = tuya_status or {}
-
-                    try:
-                        firmware_info[device.id] = await self._client.get_cloud_firmware_info(
-                            self.tuya_device_id(device)
-                        )
-                    except Exception as err:
-                        _LOGGER.debug("Cloud OTA metadata unavailable for %s: %s", device.id, err)
-                        firmware_info[device.id] = []
-                    try:
-                        product_firmware_info[device.id] = await self._client.get_product_firmware_info(
-                            str(device.product_id or ""), device.id
-                        )
-                    except Exception as err:
-                        _LOGGER.debug("Product OTA metadata unavailable for %s: %s", device.id, err)
-                        product_firmware_info[device.id] = []
-                    await self._save_ota_records(
-                        device.id,
-                        firmware_info[device.id] or product_firmware_info[device.id],
-                    )
+    async def _fetch_full_settings(self, home, device):
+        try:
+            return await self._fetch(
+                self._client.devices_manager.get_device_settings, home, device
+            )
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch full settings for device %s: %s", device.id, e)
+            return _FAILED
+
+    async def _fetch_definition(self, device):
+        """The device definition, from the cache unless its firmware changed."""
+        tuya_id = str(self.tuya_device_id(device))
+        cached = self.definitions.get(tuya_id)
+        if cached is not None:
+            return cached
+        try:
+            definition = await self.cloud.device_definition(tuya_id)
+        except Exception as err:
+            _LOGGER.debug("Cloud device definition unavailable for %s: %s", device.id, err)
+            return _FAILED
+        if definition:
+            self.definitions.store(
+                tuya_id,
+                definition,
+                firmware_signal(*self._datasets[TIER_FIRMWARE].get(device.id, ())),
+            )
+        return definition
 
-                    await asyncio.sleep(self.delay_between_calls)
+    async def _fetch_status(self, device):
+        """The app-compatible cloud DP status, decoded against the DP schema."""
+        started = time.monotonic()
+        try:
+            cloud_status = await self.cloud.device_status(self.tuya_device_id(device))
+            status = DATAPOINT_SCHEMA.decode(cloud_status, device.product_ctn)
+        except Exception as err:
+            _LOGGER.debug("Cloud DP status unavailable for %s: %s", device.id, err)
+            return _FAILED
+        # Pushes that arrived while the request was out are newer than it.
+        pushed = {
+            key: (at, value)
+            for key, (at, value) in self._pushed.pop(device.id, {}).items()
+            if at >= started
+        }
+        if pushed:
+            self._pushed[device.id] = pushed
+            status = DATAPOINT_SCHEMA.apply(
+                status,
+                {key: value for key, (_at, value) in pushed.items()},
+                device.product_ctn,
+            )
+        return status
+
+    async def _fetch_firmware(self, device):
+        """Cloud and product OTA metadata; either is empty when unauthorised."""
+        tuya_id = self.tuya_device_id(device)
+        firmware_info, product_firmware_info = await asyncio.gather(
+            self.cloud.firmware_info(tuya_id),
+            self.cloud.product_firmware_info(str(device.product_id or ""), device.id),
+            return_exceptions=True,
+        )
+        if isinstance(firmware_info, Exception):
+            _LOGGER.debug("Cloud OTA metadata unavailable for %s: %s", device.id, firmware_info)
+            firmware_info = []
+        if isinstance(product_firmware_info, Exception):
+            _LOGGER.debug(
+                "Product OTA metadata unavailable for %s: %s", device.id, product_firmware_info
+            )
+            product_firmware_info = []
+        return firmware_info, product_firmware_info
 
-                # Fetch meals
-                try:
-                    home_meals = await self._client.meals.get_meals(home)
-                    meals.extend(home_meals)
-                    _LOGGER.debug("Fetched %d meals for home %s", len(home_meals), home.id)
-                except Exception as e:
-                    _LOGGER.warning("Failed to fetch meals for home %s: %s", home.id, e)
+    async def _fetch_meals(self, home):
+        try:
+            home_meals = await self._fetch(self._client.meals.get_meals, home)
+            _LOGGER.debug("Fetched %d meals for home %s", len(home_meals), home.id)
+            return home_meals
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch meals for home %s: %s", home.id, e)
+            return _FAILED
 
-                # Fetch invites
-                try:
-                    home_invites = await self._client.homes_manager.get_invites(home)
-                    invites_by_home[home.id] = home_invites
-                    _LOGGER.debug("Fetched %d invites for home %s", len(home_invites), home.id)
-                except Exception as e:
-                    _LOGGER.warning("Failed to fetch invites for home %s: %s", home.id, e)
+    async def _fetch_invites(self, home):
+        try:
+            home_invites = await self._fetch(self._client.homes_manager.get_invites, home)
+            _LOGGER.debug("Fetched %d invites for home %s", len(home_invites), home.id)
+            return home_invites
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch invites for home %s: %s", home.id, e)
+            return _FAILED
 
-                await asyncio.sleep(self.delay_between_calls)
+    async def _fetch_devices(self, home):
+        try:
+            home_devices = await self._fetch(self._client.get_devices, home)
+            _LOGGER.debug("Fetched %d devices for home %s", len(home_devices), home.id)
+            return home_devices
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch devices for home %s: %s", home.id, e)
+            return _FAILED
 
-            base_data = {}
-            base_data["tuya_status"] = tuya_status
-            base_data["device_definitions"] = device_definitions
+    async def _fetch_discovery_config(self):
+        try:
+            return await self._fetch(self._client.discovery_manager.get_discovery_config)
+        except Exception as e:
+            _LOGGER.warning("Failed to fetch discovery config: %s", e)
+            return _FAILED
 
-            # Fetch discovery config
+    async def _fetch_local_status(self):
+        """LAN TinyTuya status, only for installations with a real LAN IP."""
+        use_local_tuya = False
+        if self._client.tuya_client:
             try:
-                discovery_config = await self._client.discovery_manager.get_discovery_config()
-                base_data["discovery_config"] = discovery_config
-            except Exception as e:
-                _LOGGER.warning("Failed to fetch discovery config: %s", e)
-                base_data["discovery_config"] = None
-
-            return {
-                "homes": homes,
-                "home_devices": home_devices_by_home,
-                "devices": devices,
-                "meals": meals,
-                "invites": invites_by_home,
-                "events_by_home_and_type": events_by_home_and_type,
-                "event_types": event_types,
-                "settings": settings,
-                "full_settings": full_settings,
-                "firmware_info": firmware_info,
-                "device_definitions": device_definitions,
-                "product_firmware_info": product_firmware_info,
-                "ota_history": self.ota_history,
-                "base_data": base_data,
+                configured_ip = getattr(self._client.tuya_client.device, "address", None)
+                use_local_tuya = bool(configured_ip and ipaddress.ip_address(configured_ip).is_private)
+            except (ValueError, AttributeError):
+                use_local_tuya = False
+        if not use_local_tuya:
+            return None
+        try:
+            # This is account/device-global; fetching it once avoids one
+            # blocking LAN request per device on every coordinator cycle.
+            return await asyncio.to_thread(self._client.get_tuya_status)
+        except Exception as err:
+            _LOGGER.warning("Failed to fetch Tuya status: %s", err)
+            return None
+
+    async def _gather_into(self, tier: str, fetches: dict, now: float, failed: set) -> None:
+        """Run ``{key: awaitable}`` concurrently and store the results in a tier.
+
+        A failed fetch keeps the previous value while the tier is within its
+        staleness budget, and drops it once the budget has run out.
+        """
+        if not fetches:
+            return
+        store = self._datasets[tier]
+        results = await asyncio.gather(*fetches.values())
+        for key, value in zip(fetches, results):
+            if value is _FAILED:
+                failed.add(tier)
+                if self.schedule.expired(tier, now):
+                    store.pop(key, None)
+            else:
+                store[key] = value
+
+    def _inventory_device_ids(self) -> set[str]:
+        return {
+            device.id
+            for key, home_devices in self._datasets[TIER_INVENTORY].items()
+            if key != "homes"
+            for device in home_devices
+        }
+
+    async def _refresh_inventory(self, now: float, failed: set) -> None:
+        """Re-list homes and their devices."""
+        inventory = self._datasets[TIER_INVENTORY]
+        try:
+            homes = await self._fetch(self._client.get_homes)
+        except RuntimeError as err:
+            # A config-entry reload can leave the old aiohttp session
+            # closed while the coordinator task is still winding down.
+            if "Session is closed" not in str(err):
+                raise
+            self._client.session = None
+            homes = await self._fetch(self._client.get_homes)
+        if self.home_ids:
+            homes = [home for home in homes if str(home.id) in self.home_ids]
+        inventory["homes"] = homes
+        self.event_history.retain_homes({home.id for home in homes})
+        await self._gather_into(
+            TIER_INVENTORY,
+            {("devices", home.id): self._fetch_devices(home) for home in homes},
+            now,
+            failed,
+        )
+
+    async def _async_update_data(self):
+        """Fetch the datasets that are due and assemble the entity data."""
+        # A failed refresh changes nothing but availability, which entities
+        # track themselves.
+        self.changes = NOTHING_CHANGED
+        try:
+            await self._load_ota_history()
+            await self.event_history.async_load()
+            await self.definitions.async_load()
+            now = time.monotonic()
+            due = self.schedule.due(now)
+            failed: set[str] = set()
+            inventory = self._datasets[TIER_INVENTORY]
+            if TIER_INVENTORY in due or "homes" not in inventory:
+                known = self._inventory_device_ids()
+                await self._refresh_inventory(now, failed)
+                due.add(TIER_INVENTORY)
+                if not self._inventory_device_ids() <= known:
+                    # A new feeder has nothing cached in any tier yet.
+                    due.update(self.schedule.tiers)
+
+            homes = inventory["homes"]
+            home_devices_by_home = {
+                home.id: inventory[("devices", home.id)]
+                for home in homes
+                if ("devices", home.id) in inventory
             }
+            homes_with_devices = [home for home in homes if home.id in home_devices_by_home]
+            device_homes = [
+                (home, device)
+                for home in homes_with_devices
+                for device in home_devices_by_home[home.id]
+            ]
+            event_types = Event.get_event_types()
+
+            fetches: dict[str, dict] = {}
+            if TIER_EVENTS in due:
+                wall_now = dt_util.now()
+                retain_from, to_date = _event_window(wall_now)
+                fetches[TIER_EVENTS] = {
+                    home.id: self._fetch_events(
+                        home, event_types, retain_from, to_date, wall_now
+                    )
+                    for home in homes_with_devices
+                }
+            if TIER_MEALS in due:
+                fetches[TIER_MEALS] = {
+                    home.id: self._fetch_meals(home) for home in homes_with_devices
+                }
+            if TIER_INVITES in due:
+                fetches[TIER_INVITES] = {
+                    home.id: self._fetch_invites(home) for home in homes_with_devices
+                }
+            if TIER_SETTINGS in due:
+                fetches[TIER_SETTINGS] = {
+                    key: fetch
+                    for home, device in device_homes
+                    for key, fetch in (
+                        (("settings", device.id), self._fetch_settings(home, device)),
+                        (("full", device.id), self._fetch_full_settings(home, device)),
+                    )
+                }
+            if TIER_DEFINITIONS in due:
+                fetches[TIER_DEFINITIONS] = {
+                    device.id: self._fetch_definition(device) for _home, device in device_homes
+                }
+            if TIER_STATUS in due:
+                fetches[TIER_STATUS] = {
+                    device.id: self._fetch_status(device) for _home, device in device_homes
+                }
+                fetches[TIER_STATUS]["local"] = self._fetch_local_status()
+            if TIER_FIRMWARE in due:
+                fetches[TIER_FIRMWARE] = {
+                    device.id: self._fetch_firmware(device) for _home, device in device_homes
+                }
+            if TIER_DISCOVERY in due:
+                fetches[TIER_DISCOVERY] = {"config": self._fetch_discovery_config()}
+
+            # Every due tier for every home and device is fetched at once; the
+            # budget keeps the number of requests actually in flight bounded.
+            await asyncio.gather(
+                *(
+                    self._gather_into(tier, tier_fetches, now, failed)
+                    for tier, tier_fetches in fetches.items()
+                ),
+                self._ensure_local_keys(device for _home, device in device_homes),
+            )
+            if TIER_EVENTS in due:
+                await self.event_history.async_save()
+            if TIER_FIRMWARE in due:
+                await self._save_ota_records(
+                    {
+                        device_id: records[0] or records[1]
+                        for device_id, records in self._datasets[TIER_FIRMWARE].items()
+                    }
+                )
+            for tier in due - failed:
+                self.schedule.mark_success(tier, now)
+            if TIER_FIRMWARE in due:
+                for _home, device in device_homes:
+                    records = self._datasets[TIER_FIRMWARE].get(device.id)
+                    if records is not None and self.definitions.check_signal(
+                        str(self.tuya_device_id(device)), firmware_signal(*records)
+                    ):
+                        # New firmware can bring a new DP schema and OTA modules.
+                        self.schedule.request(TIER_DEFINITIONS)
+
+            snapshot = self._assemble(homes, home_devices_by_home, event_types)
+            self.changes = snapshot.changes(self.data)
+            if self._snapshot_store is not None:
+                self._snapshot_store.async_save(lambda: dump_datasets(self._datasets))
+            if self.tuya_session is not None:
+                # Whatever session this refresh logged in with, for the next start.
+                await self.tuya_session.async_capture(self._client)
+            return snapshot
         except ConfigEntryAuthFailed:
             # Re-raise auth failures so they can be handled properly
             raise
@@ -332,6 +746,105 @@ class PhilipsPetsSeriesDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error communicating with API: %s", err)
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
+    async def async_restore(self) -> bool:
+        """Set ``data`` from the snapshot stored by the last refresh, if any.
+
+        The restored tiers keep the staleness budget they had left, and every
+        tier is still due, so the next refresh fetches all of it and replaces
+        what was restored.
+        """
+        if self._snapshot_store is None:
+            return False
+        stored = await self._snapshot_store.async_load()
+        if stored is None:
+            return False
+        await self._load_ota_history()
+        await self.event_history.async_load()
+        await self.definitions.async_load()
+        datasets = {tier: {} for tier in RESTORED_TIERS}
+        try:
+            age = restore_datasets(stored, datasets)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Stored snapshot is unusable, refreshing instead: %s", err)
+            return False
+        for tier, values in datasets.items():
+            self._datasets[tier].update(values)
+            self.schedule.restore(tier, age)
+
+        inventory = self._datasets[TIER_INVENTORY]
+        homes = inventory["homes"]
+        home_devices_by_home = {
+            home.id: inventory[("devices", home.id)]
+            for home in homes
+            if ("devices", home.id) in inventory
+        }
+        event_types = Event.get_event_types()
+        type_values = [getattr(event_type, "value", event_type) for event_type in event_types]
+        for home_id, home_devices in home_devices_by_home.items():
+            self._datasets[TIER_EVENTS][home_id] = self.event_history.events_by_type(
+                home_id, type_values
+            )
+            for device in home_devices:
+                definition = self.definitions.get(str(self.tuya_device_id(device)))
+                if definition is not None:
+                    self._datasets[TIER_DEFINITIONS][device.id] = definition
+        self.data = self._assemble(homes, home_devices_by_home, event_types)
+        self.changes = ALL_CHANGED
+        _LOGGER.debug("Restored a snapshot from %d seconds ago", age)
+        return True
+
+    @staticmethod
+    def _decode_local_status(local_status, device):
+        """The LAN status in the schema's shape, for devices without cloud DPs."""
+        if not local_status:
+            return None
+        try:
+            return DATAPOINT_SCHEMA.decode(local_status, device.product_ctn)
+        except ValueError:
+            return None
+
+    def _assemble(self, homes, home_devices_by_home, event_types) -> Snapshot:
+        """Build the snapshot entities read from the per-tier datasets."""
+        datasets = self._datasets
+        local_status = datasets[TIER_STATUS].get("local")
+        meals = []
+        invites_by_home = {}
+        events_by_home = {}
+        device_data = {}
+        for home in homes:
+            if home.id not in home_devices_by_home:
+                continue
+            meals.extend(datasets[TIER_MEALS].get(home.id, []))
+            if home.id in datasets[TIER_INVITES]:
+                invites_by_home[home.id] = datasets[TIER_INVITES][home.id]
+            events_by_home[home.id] = datasets[TIER_EVENTS].get(home.id, {})
+            for device in home_devices_by_home[home.id]:
+                firmware_info, product_firmware_info = datasets[TIER_FIRMWARE].get(
+                    device.id, ([], [])
+                )
+                device_data[device.id] = {
+                    "status": datasets[TIER_STATUS].get(device.id)
+                    or self._decode_local_status(local_status, device),
+                    "settings": datasets[TIER_SETTINGS].get(("settings", device.id)),
+                    "full_settings": datasets[TIER_SETTINGS].get(("full", device.id)),
+                    "definition": datasets[TIER_DEFINITIONS].get(device.id),
+                    "firmware_info": firmware_info,
+                    "product_firmware_info": product_firmware_info,
+                    "ota_history": self.ota_history.get(device.id),
+                }
+
+        return Snapshot.build(
+            homes=homes,
+            home_devices=home_devices_by_home,
+            device_data=device_data,
+            meals=meals,
+            invites=invites_by_home,
+            events=EventIndex.build(events_by_home, home_devices_by_home),
+            event_types=event_types,
+            local_status=local_status,
+            discovery_config=datasets[TIER_DISCOVERY].get("config"),
+        )
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Philips Pets Series from a config entry."""
@@ -391,11 +904,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coordinator = PhilipsPetsSeriesDataUpdateCoordinator(
         hass,
         client,
-        delay_between_calls=0.5,
         home_ids=data.get(CONF_HOME_IDS),
+        entry_id=entry.entry_id,
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # A saved Tuya mobile session saves a login before the first cloud call.
+    await coordinator.tuya_session.async_restore(client)
+
+    # Entities are set up from the last run's data when it was stored, and
+    # the first refresh reconciles in the background; otherwise setup waits
+    # for it as before.
+    if await coordinator.async_restore():
+        hass.async_create_background_task(
+            coordinator.async_refresh(), name="philips-pet-series-first-refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
@@ -421,8 +945,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await beacons.async_start()
     hass.data[DOMAIN][entry.entry_id]["beacons"] = beacons
 
-    # Camera streaming mode is read at bridge start, so apply option changes by
-    # reloading the entry.
+    # Direct LAN sessions with the feeders the beacons reveal, for status and
+    # writes that do not depend on the cloud.
+    local = LocalTuyaManager(hass, coordinator, beacons)
+    local.async_start()
+    hass.data[DOMAIN][entry.entry_id]["local"] = local
+    hass.data[DOMAIN][entry.entry_id]["commands"] = CommandRouter(
+        client, coordinator, local
+    )
+
+    # Datapoint changes pushed over the Tuya mobile MQTT channel; polling keeps
+    # working, only slower, whenever the channel is unavailable.
+    live = LiveUpdates(hass, client, coordinator)
+    live.async_start()
+    hass.data[DOMAIN][entry.entry_id]["live"] = live
+
+    # Token refreshes and option changes both update the entry; the listener
+    # tells them apart by comparing against the settings applied here.
+    hass.data[DOMAIN][entry.entry_id]["settings"] = _entry_settings(entry)
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     _async_migrate_unique_ids(hass, entry)
@@ -500,7 +1040,7 @@ async def async_setup_services(hass: HomeAssistant, client: PetsSeriesClient):
             for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
                 coordinator = entry_data.get("coordinator")
                 if coordinator:
-                    await coordinator.async_request_refresh()
+                    await coordinator.async_request_tier_refresh(TIER_INVENTORY)
         except Exception as e:
             _LOGGER.exception("Failed to create home: %s", e)
 
@@ -536,7 +1076,7 @@ async def async_setup_services(hass: HomeAssistant, client: PetsSeriesClient):
             for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
                 coordinator = entry_data.get("coordinator")
                 if coordinator:
-                    await coordinator.async_request_refresh()
+                    await coordinator.async_request_tier_refresh(TIER_INVITES)
         except Exception as e:
             _LOGGER.exception("Failed to send invite: %s", e)
 
@@ -563,7 +1103,7 @@ async def async_setup_services(hass: HomeAssistant, client: PetsSeriesClient):
             for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
                 coordinator = entry_data.get("coordinator")
                 if coordinator:
-                    await coordinator.async_request_refresh()
+                    await coordinator.async_request_tier_refresh(TIER_INVENTORY)
         except Exception as e:
             _LOGGER.exception("Failed to add device: %s", e)
 
@@ -627,15 +1167,11 @@ def _async_remove_stale_entities(hass: HomeAssistant, entry: ConfigEntry) -> Non
     # module, so drop it for devices that do not -- but leave it untouched on
     # devices where it is still provided.
     coordinator = (hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}).get("coordinator")
-    data = getattr(coordinator, "data", None) or {}
-    for device in data.get("devices", []):
-        definition = data.get("device_definitions", {}).get(device.id)
-        module_map = {}
-        if isinstance(definition, dict) and isinstance(definition.get("otaInfo"), dict):
-            module_map = definition["otaInfo"].get("otaModuleMap") or {}
-        mcu = module_map.get("mcu") if isinstance(module_map, dict) else None
-        if not (isinstance(mcu, dict) and mcu.get("verSw")):
-            stale_unique_ids.add(f"{device.id}_mcu_firmware_version")
+    snapshot = getattr(coordinator, "data", None) or EMPTY_SNAPSHOT
+    for device_data in snapshot.by_device.values():
+        # Without a definition (not fetched or restored yet) it is unknown.
+        if device_data.definition is not None and not device_data.has_ota_module("mcu"):
+            stale_unique_ids.add(f"{device_data.device.id}_mcu_firmware_version")
 
     for registry_entry in list(registry.entities.values()):
         if registry_entry.config_entry_id != entry.entry_id:
@@ -652,8 +1188,49 @@ def _async_remove_stale_entities(hass: HomeAssistant, entry: ConfigEntry) -> Non
             registry.async_remove(registry_entry.entity_id)
 
 
+def _entry_settings(entry: ConfigEntry) -> dict:
+    """The entry's data and options, less the tokens the client keeps current."""
+    return {
+        key: value
+        for key, value in {**entry.data, **entry.options}.items()
+        if key not in _TOKEN_KEYS
+    }
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload the entry when its options change."""
+    """Apply an entry update, restarting only what the changed settings affect.
+
+    The client saves every token refresh to the entry, and the client already
+    uses the new tokens, so an update that changes nothing else is left alone.
+    Camera options only need the bridge restarted, unless streaming is turned
+    on or off: camera entities advertise streaming from the mode they were
+    created under.  Anything else reloads the entry.
+    """
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    applied = entry_data["settings"]
+    settings = _entry_settings(entry)
+    changed = {
+        key for key in applied.keys() | settings.keys() if applied.get(key) != settings.get(key)
+    }
+    if not changed:
+        return
+    entry_data["settings"] = settings
+
+    toggled = (applied.get(CONF_CAMERA_MODE) == CAMERA_MODE_DISABLED) != (
+        settings.get(CONF_CAMERA_MODE) == CAMERA_MODE_DISABLED
+    )
+    bridge = entry_data.get("bridge")
+    if changed <= _BRIDGE_SETTINGS and not toggled and bridge is not None:
+        _LOGGER.debug("Camera options changed; restarting the camera bridge")
+        try:
+            await bridge.async_restart()
+        except Exception as err:  # noqa: BLE001 - setup retries a failed bridge
+            _LOGGER.warning("Unable to restart the camera bridge (%s); reloading", err)
+        else:
+            return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -664,11 +1241,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         bridge = entry_data.get("bridge")
         if bridge is not None:
             await bridge.async_stop()
+        local = entry_data.get("local")
+        if local is not None:
+            await local.async_stop()
+        live = entry_data.get("live")
+        if live is not None:
+            await live.async_stop()
         beacons = entry_data.get("beacons")
         if beacons is not None:
             beacons.async_stop()
         client = entry_data["client"]
+        # client.close() drops the mobile session without stopping its signer.
+        mobile = client._tuya_mobile
         await client.close()
+        release_signer(mobile)
         hass.data[DOMAIN].pop(entry.entry_id)
         global_keys = {"services_registered", "frontend_registered"}
         if not any(key not in global_keys for key in hass.data[DOMAIN]):
@@ -682,7 +1268,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Drop the cards' Lovelace resource when the last entry is removed."""
+    """Drop the entry's stored data, and the cards with the last entry."""
+    await Store(hass, 1, snapshot_storage_key(entry.entry_id)).async_remove()
+    await Store(hass, 1, tuya_session_storage_key(entry.entry_id)).async_remove()
+    await Store(hass, 1, key_inventory_storage_key(entry.entry_id)).async_remove()
+    await Store(hass, 1, definitions_storage_key(entry.entry_id)).async_remove()
+    await async_remove_journal(hass, entry.entry_id)
     if any(
         other.entry_id != entry.entry_id
         for other in hass.config_entries.async_entries(DOMAIN)
@@ -12,6 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PhilipsPetsSeriesDataUpdateCoordinator
+from .datapoints import SCHEMA as DATAPOINT_SCHEMA
 from .entity import PhilipsPetsSeriesEntity, iter_home_devices
 from .meals import device_meals
 
@@ -35,8 +36,7 @@ _FAULT_CONDITIONS = ("food_level_low", "food_outlet_stuck", "filter_replacement_
 # "device reports no fault"; the meaning of individual bits is not known, so a
 # non-zero value only prevents an automatic clear, it never raises a condition
 # on its own.
-_FEED_ABNORMAL_DP = "255"
-_FEED_ABNORMAL_CODE = "feed_abnormal"
+_FEED_ABNORMAL_SLOT = DATAPOINT_SCHEMA.slot("feed_abnormal")
 
 # How long a fault notification is trusted when no live datapoint and no
 # subsequent activity can confirm the device recovered.  Only a fallback: with
@@ -79,6 +79,7 @@ class PhilipsPetsSeriesOnLanSensor(PhilipsPetsSeriesEntity, BinarySensorEntity):
     which is the case for a container on Docker's bridge network.
     """
 
+    _always_update = True
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
     def __init__(self, coordinator, home, device, beacons) -> None:
@@ -112,6 +113,8 @@ class PhilipsPetsSeriesScheduledFeedingSensor(PhilipsPetsSeriesEntity, BinarySen
     schedule at all?
     """
 
+    _update_parts = frozenset({"meals"})
+
     def __init__(self, coordinator, home, device) -> None:
         super().__init__(coordinator, device, home)
         self._attr_unique_id = f"{device.id}_scheduled_feeding"
@@ -136,6 +139,8 @@ class PhilipsPetsSeriesScheduledFeedingSensor(PhilipsPetsSeriesEntity, BinarySen
 class PhilipsPetsSeriesConditionSensor(PhilipsPetsSeriesEntity, BinarySensorEntity):
     """Expose alarm/connectivity conditions separately from last-event sensors."""
 
+    _always_update = True
+
     def __init__(self, coordinator, home, device, event_type: str) -> None:
         super().__init__(coordinator, device, home)
         self._event_type = event_type
@@ -145,43 +150,25 @@ class PhilipsPetsSeriesConditionSensor(PhilipsPetsSeriesEntity, BinarySensorEnti
 
     def _tuya_status(self) -> dict:
         """Return the device's live Tuya datapoint snapshot (may be empty)."""
-        return (
-            self.coordinator.data.get("settings", {})
-            .get(self._device.id, {})
-            .get("tuya_status", {})
-        ) or {}
+        return self.device_data.status
 
     def _latest_event_time(self, event_type: str):
         """Latest timestamp for ``event_type`` *on this device*.
 
-        The coordinator indexes events per home, but this entity represents a
-        single device, so events belonging to other devices in the same home
-        must be filtered out.  Events that do not carry a device id are treated
-        as belonging to the device (single-device homes report them that way).
+        Events that do not carry a device id count as this device's (single-
+        device homes report them that way).
         """
-        events = self.coordinator.data.get("events_by_home_and_type", {}).get(
-            f"{self._home.id}_{event_type}", []
-        )
-        times = []
-        for event in events:
-            device_id = getattr(event, "device_id", None)
-            if device_id is not None and str(device_id) != str(self._device.id):
-                continue
-            parsed = dt_util.parse_datetime(event.time or "")
-            if parsed is not None:
-                times.append(parsed)
-        return max(times, default=None)
+        return self.latest_event_time(event_type)
 
     def _feed_abnormal(self) -> int | None:
         """Live Tuya fault bitmask, or None when the datapoint is unavailable."""
-        status = self._tuya_status()
-        for key in (_FEED_ABNORMAL_DP, _FEED_ABNORMAL_CODE):
-            if key in status:
-                try:
-                    return int(status[key])
-                except (TypeError, ValueError):
-                    return None
-        return None
+        value = self._tuya_status().at(_FEED_ABNORMAL_SLOT)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
 
     @property
     def is_on(self) -> bool | None:
@@ -117,6 +117,47 @@ def _is_usable_host(host: str) -> bool:
     return address not in ipaddress.ip_network("172.16.0.0/12")
 
 
+def mqtt_broker(mobile: Any) -> str:
+    """Derive the regional MQTT broker from the session's API endpoint.
+
+    Tuya assigns each account to a regional data centre and the mobile API
+    host tracks it ("a1.tuyaeu.com", "a1.tuyaus.com", ...).  The signing
+    client rewrites its endpoint from the login response, so the MQTT broker
+    has to follow it -- pinning the EU broker breaks every other region.
+    """
+    host = ""
+    try:
+        host = urlsplit(getattr(mobile, "mobile_url", "") or "").hostname or ""
+    except ValueError:
+        host = ""
+    labels = host.split(".")
+    if len(labels) >= 2 and labels[-1] and labels[-2]:
+        # Swap only the leading service label ("a1" -> "m1"), keeping the
+        # regional domain intact.
+        broker_host = ".".join(["m1", *labels[1:]])
+    else:
+        broker_host = _DEFAULT_MQTT_HOST
+    return f"ssl://{broker_host}:{_MQTT_PORT}"
+
+
+def mobile_mqtt_session(mobile: Any) -> dict[str, Any]:
+    """MQTT broker and credentials for a logged-in Tuya mobile session.
+
+    Shared by the camera bridge and the live DP subscriber.  Blocking: the
+    signer may call into native code.
+    """
+    if mobile is None or not mobile.uid or not mobile.sid or not mobile.ecode:
+        raise RuntimeError("Tuya mobile session has no MQTT fields")
+    mqtt = mqtt_credentials(
+        mobile.signer,
+        uid=mobile.uid,
+        sid=mobile.sid,
+        ecode=mobile.ecode,
+        partner_id=BRIDGE_PARTNER_ID,
+    )
+    return {**mqtt, "broker": mqtt_broker(mobile), "uid": mobile.uid}
+
+
 @dataclass(slots=True)
 class BridgeProcess:
     """One RTSP process and its stable device mapping."""
@@ -256,7 +297,7 @@ class PhilipsCameraBridgeManager:
         """
         devices = [
             device
-            for device in self.coordinator.data.get("devices", [])
+            for device in self.coordinator.data.devices
             if self._is_camera(device)
         ]
         if not devices:
@@ -287,6 +328,17 @@ class PhilipsCameraBridgeManager:
             await self.async_stop()
             raise
 
+    async def async_restart(self) -> None:
+        """Stop every bridge and start again under the current options.
+
+        Used when only the camera options change, so the rest of the entry
+        keeps running.
+        """
+        await self.async_stop()
+        self._stopping = False
+        self._cameras.clear()
+        await self.async_start()
+
     async def async_get_stream_url(self, device: Any) -> str | None:
         """Return an RTSP URL, minting an on-demand session when required."""
         if self._stopping or self.camera_mode == CAMERA_MODE_DISABLED:
@@ -415,61 +467,36 @@ class PhilipsCameraBridgeManager:
         try:
             async with self._credential_lock:
                 await self.client.ensure_token_valid()
-                webrtc = await self.client.get_cloud_webrtc_config(device_id)
+                # Shared with any identical read in flight, so copied before
+                # anything is added to it.
+                webrtc = dict(await self.coordinator.cloud.device_webrtc_config(device_id))
                 if not webrtc:
                     raise RuntimeError("Tuya returned an empty WebRTC configuration")
-                definition = await self.client.get_cloud_device_definition(device_id)
-                local_key = definition.get("localKey") if isinstance(definition, dict) else None
+                credentials = self.coordinator.key_inventory.get(device_id)
+                if credentials is not None:
+                    local_key = credentials.local_key
+                else:
+                    definition = await self.coordinator.cloud.device_definition(device_id)
+                    local_key = (
+                        definition.get("localKey") if isinstance(definition, dict) else None
+                    )
                 if local_key:
                     webrtc["localKey"] = local_key
 
-                mobile = self.client._tuya_mobile
-                if mobile is None or not mobile.uid or not mobile.sid or not mobile.ecode:
-                    raise RuntimeError("Tuya mobile session has no MQTT fields")
                 mqtt = await asyncio.to_thread(
-                    mqtt_credentials,
-                    mobile.signer,
-                    uid=mobile.uid,
-                    sid=mobile.sid,
-                    ecode=mobile.ecode,
-                    partner_id=BRIDGE_PARTNER_ID,
+                    mobile_mqtt_session, self.client._tuya_mobile
                 )
                 mqtt["publish_topic"] = f"smart/mb/out/{device_id}"
                 mqtt["subscribe_topic"] = f"smart/mb/in/{device_id}"
                 webrtc["mqtt"] = {
                     **mqtt,
-                    "broker": self._mqtt_broker(mobile),
                     "client_id": mqtt_client_id(BRIDGE_PACKAGE),
-                    "uid": mobile.uid,
                 }
             return web.json_response(webrtc)
         except Exception as err:
             _LOGGER.error("Unable to prepare camera bridge credentials: %s", err)
             return web.json_response({"error": "credential refresh failed"}, status=502)
 
-    @staticmethod
-    def _mqtt_broker(mobile: Any) -> str:
-        """Derive the regional MQTT broker from the session's API endpoint.
-
-        Tuya assigns each account to a regional data centre and the mobile API
-        host tracks it ("a1.tuyaeu.com", "a1.tuyaus.com", ...).  The signing
-        client rewrites its endpoint from the login response, so the MQTT broker
-        has to follow it -- pinning the EU broker breaks every other region.
-        """
-        host = ""
-        try:
-            host = urlsplit(getattr(mobile, "mobile_url", "") or "").hostname or ""
-        except ValueError:
-            host = ""
-        labels = host.split(".")
-        if len(labels) >= 2 and labels[-1] and labels[-2]:
-            # Swap only the leading service label ("a1" -> "m1"), keeping the
-            # regional domain intact.
-            broker_host = ".".join(["m1", *labels[1:]])
-        else:
-            broker_host = _DEFAULT_MQTT_HOST
-        return f"ssl://{broker_host}:{_MQTT_PORT}"
-
     def _authorized(self, request: web.Request) -> bool:
         expected = f"Bearer {self._token}"
         return secrets.compare_digest(request.headers.get("Authorization", ""), expected)
@@ -9,7 +9,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import DOMAIN, PhilipsPetsSeriesDataUpdateCoordinator
+from .datapoints import feed_datapoint
 from .entity import PhilipsPetsSeriesEntity, iter_home_devices
+from .schedule import TIER_EVENTS, TIER_SETTINGS, TIER_STATUS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,16 +23,19 @@ async def async_setup_entry(
     """Set up the Philips Pets Series button entities."""
     coordinator: PhilipsPetsSeriesDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     client = hass.data[DOMAIN][config_entry.entry_id]["client"]
+    commands = hass.data[DOMAIN][config_entry.entry_id]["commands"]
 
     buttons = []
 
     for home, device in iter_home_devices(coordinator):
             # Assuming you want one feed button per device
             if client.tuya_client or getattr(client.auth, "id_token", None):
-                buttons.append(PhilipsPetsSeriesFeedButton(coordinator, client, home, device))
+                buttons.append(
+                    PhilipsPetsSeriesFeedButton(coordinator, client, commands, home, device)
+                )
 
             # Check for filter settings to add Reset Filter button
-            full_settings = coordinator.data.get("full_settings", {}).get(device.id)
+            full_settings = coordinator.data.device(device.id).full_settings
             if full_settings and (
                 getattr(full_settings, "filter_replacement_time", None)
                 or getattr(full_settings, "filter_application_time", None)
@@ -51,10 +56,13 @@ class PhilipsPetsSeriesFeedButton(PhilipsPetsSeriesEntity, ButtonEntity):
     once, set the "Dispense portions now" number instead.
     """
 
-    def __init__(self, coordinator, client, home, device):
+    _update_parts = frozenset()
+
+    def __init__(self, coordinator, client, commands, home, device):
         """Initialize the feed button."""
         super().__init__(coordinator, device, home)
         self._client = client
+        self._commands = commands
         self._attr_unique_id = f"{device.id}_feed_button"
         self._attr_name = "Feed one portion"
         self._attr_icon = "mdi:food-drumstick"
@@ -66,17 +74,21 @@ class PhilipsPetsSeriesFeedButton(PhilipsPetsSeriesEntity, ButtonEntity):
         try:
             # The mobile app uses DP 101 for PAW3300/feeder-essential and
             # DP 201 for the legacy feeder path. Keep this at one portion.
-            dp_id = "101" if self._device.product_ctn in {"PAW3300", "PAW3320"} else "201"
-            if getattr(self._client.auth, "id_token", None):
-                await self._client.publish_cloud_dps(
-                    self.coordinator.tuya_device_id(self._device),
-                    {dp_id: 1.0},
-                )
+            dp_id = feed_datapoint(self._device.product_ctn)
+            if self._commands.available(self._device):
+                # The write is applied to the coordinator's data on success,
+                # which also fetches the feed event it produces.
+                route = await self._commands.async_publish(self._device, {dp_id: 1.0})
             else:
                 await self.hass.async_add_executor_job(self._client.feed_num, 1)
-            _LOGGER.info("Successfully triggered feed DP %s for device %s", dp_id, self._device.id)
-
-            await self.coordinator.async_request_refresh()
+                route = "tinytuya"
+                await self.coordinator.async_request_tier_refresh(TIER_STATUS, TIER_EVENTS)
+            _LOGGER.info(
+                "Successfully triggered feed DP %s for device %s over %s",
+                dp_id,
+                self._device.id,
+                route,
+            )
         except Exception as e:
             raise HomeAssistantError(f"Failed to dispense food: {e}") from e
 
@@ -84,6 +96,8 @@ class PhilipsPetsSeriesFeedButton(PhilipsPetsSeriesEntity, ButtonEntity):
 class PhilipsPetsSeriesResetFilterButton(PhilipsPetsSeriesEntity, ButtonEntity):
     """Representation of a Philips Pets Series reset filter button."""
 
+    _update_parts = frozenset()
+
     def __init__(self, coordinator, client, home, device):
         """Initialize the reset filter button."""
         super().__init__(coordinator, device, home)
@@ -98,6 +112,6 @@ class PhilipsPetsSeriesResetFilterButton(PhilipsPetsSeriesEntity, ButtonEntity):
         try:
             await self._client.devices_manager.reset_filter(self._home, self._device)
             _LOGGER.info(f"Successfully reset filter for device {self._device.id}")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_request_tier_refresh(TIER_SETTINGS, TIER_STATUS)
         except Exception as e:
             raise HomeAssistantError(f"Failed to reset the filter: {e}") from e
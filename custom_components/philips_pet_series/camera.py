@@ -48,6 +48,8 @@ class PhilipsPetsSeriesCamera(PhilipsPetsSeriesEntity, Camera):
     image fallback.
     """
 
+    _always_update = True
+
     def __init__(
         self,
         coordinator: PhilipsPetsSeriesDataUpdateCoordinator,
@@ -81,23 +83,8 @@ class PhilipsPetsSeriesCamera(PhilipsPetsSeriesEntity, Camera):
         return bridge is not None and bridge.process.returncode is None
 
     def _get_latest_event(self):
-        """Return this device's most recent motion event, if any.
-
-        The coordinator indexes events per home, so entries belonging to other
-        devices in the same home have to be filtered out, and the newest event
-        picked explicitly rather than assuming the API returns them sorted.
-        """
-        key = f"{self._home.id}_motion_detected"
-        events = self.coordinator.data.get("events_by_home_and_type", {}).get(key, [])
-        mine = [
-            event
-            for event in events
-            if getattr(event, "device_id", None) is None
-            or str(event.device_id) == str(self._device.id)
-        ]
-        if not mine:
-            return None
-        return max(mine, key=lambda event: event.time or "")
+        """Return this device's most recent motion event, if any."""
+        return self.latest_event("motion_detected")
 
     async def async_camera_image(
         self, width: int | None = None, height: int | None = None
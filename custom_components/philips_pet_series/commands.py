@@ -0,0 +1,144 @@
+"""Route datapoint writes over the LAN when possible, the cloud otherwise.
+
+Every control used to publish through the cloud and then refresh the whole
+coordinator to read the result back: a cloud round trip plus a refresh of
+every home and device for one toggle.  Writes now go over the device's LAN
+session when it is connected, falling back to the cloud, and the written
+values are applied to the coordinator's data straight away.  The device's own
+report (over the LAN session or the MQTT channel) confirms or corrects them.
+
+Writes to one device that arrive within ``COALESCE_WINDOW`` of each other (a
+slider being dragged, a script flipping several switches) are sent as one
+multi-datapoint write, keeping only the latest value per datapoint, with one
+read-back for the batch.
+
+A feed is different: writing a feed datapoint dispenses food, so it must never
+be sent twice, merged with another write, or dropped as superseded.  Feeds
+bypass the batching, and if a LAN feed write fails after it may have reached
+the device, it is reported as failed rather than retried through the cloud.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+from typing import Any
+
+from petsseries import PetsSeriesClient
+
+from .datapoints import FEED_DATAPOINTS
+from .tuya_local import LocalTuyaManager, TuyaLocalNotSent
+
+_LOGGER = logging.getLogger(__name__)
+
+ROUTE_LAN = "lan"
+ROUTE_CLOUD = "cloud"
+
+# How long a write waits for further writes to the same device to join it.
+COALESCE_WINDOW = 0.25
+
+
+@dataclass(slots=True)
+class _Batch:
+    """Writes to one device waiting to be sent together."""
+
+    device: Any
+    dps: dict[str, Any] = field(default_factory=dict)
+    waiters: list[asyncio.Future[str]] = field(default_factory=list)
+
+
+class CommandRouter:
+    """Send datapoint writes local-first and apply them optimistically."""
+
+    def __init__(
+        self, client: PetsSeriesClient, coordinator: Any, local: LocalTuyaManager
+    ) -> None:
+        self._client = client
+        self._coordinator = coordinator
+        self._local = local
+        self._batches: dict[str, _Batch] = {}
+        # Batches for one device go out in order, one at a time.
+        self._send_locks: dict[str, asyncio.Lock] = {}
+
+    def available(self, device) -> bool:
+        """Whether there is any route to write this device's datapoints."""
+        return self._local.device(device.id) is not None or bool(
+            getattr(self._client.auth, "id_token", None)
+        )
+
+    async def async_publish(self, device, dps: dict[str, Any]) -> str:
+        """Write ``dps`` to a device and return the route that carried them."""
+        dps = {str(key): value for key, value in dps.items()}
+        if FEED_DATAPOINTS.intersection(dps):
+            return await self._async_write(device, dps)
+        batch = self._batches.get(device.id)
+        if batch is None:
+            batch = self._batches[device.id] = _Batch(device)
+            asyncio.get_running_loop().call_later(
+                COALESCE_WINDOW, self._flush, device.id
+            )
+        # A later value for the same datapoint supersedes the queued one.
+        batch.dps.update(dps)
+        waiter = asyncio.get_running_loop().create_future()
+        batch.waiters.append(waiter)
+        return await waiter
+
+    def _flush(self, device_id: str) -> None:
+        batch = self._batches.pop(device_id, None)
+        if batch is not None:
+            self._coordinator.hass.async_create_task(self._async_flush(batch))
+
+    async def _async_flush(self, batch: _Batch) -> None:
+        if len(batch.waiters) > 1:
+            _LOGGER.debug(
+                "Coalesced %d writes to %s into %s",
+                len(batch.waiters),
+                batch.device.id,
+                batch.dps,
+            )
+        try:
+            route = await self._async_write(batch.device, batch.dps)
+        except Exception as err:
+            for waiter in batch.waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+        for waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_result(route)
+
+    async def _async_write(self, device, dps: dict[str, Any]) -> str:
+        lock = self._send_locks.setdefault(device.id, asyncio.Lock())
+        async with lock:
+            route = await self._async_send(device, dps)
+        self._coordinator.async_apply_dps(device.id, dps)
+        if route == ROUTE_CLOUD and not self._coordinator.live:
+            # Nothing will push the device's own report, so read this device's
+            # status back rather than trusting the optimistic value for a poll
+            # interval.
+            self._coordinator.async_schedule_device_refresh(device.id)
+        return route
+
+    async def _async_send(self, device, dps: dict[str, Any]) -> str:
+        session = self._local.device(device.id)
+        if session is not None:
+            try:
+                await session.async_set_dps(dps)
+                return ROUTE_LAN
+            except TuyaLocalNotSent:
+                pass
+            except Exception as err:
+                if FEED_DATAPOINTS.intersection(dps):
+                    raise RuntimeError(
+                        "feed command was not confirmed by the device; not "
+                        "retrying, as it may already have dispensed"
+                    ) from err
+                _LOGGER.debug(
+                    "LAN write to %s failed, using the cloud: %s", device.id, err
+                )
+        if not await self._client.publish_cloud_dps(
+            self._coordinator.tuya_device_id(device), dps
+        ):
+            raise RuntimeError("device is not on the LAN and the cloud is not authorised")
+        return ROUTE_CLOUD
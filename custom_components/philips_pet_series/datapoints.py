@@ -2,6 +2,15 @@
 Datapoints
 """
 
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import json
+
+# Marks a schema slot the device did not report.
+MISSING = object()
+
 datapoints = {
     "103": {
         "dpCode": "recorded_image_flip", "standardType": "Boolean", "path": "tuya_status",
@@ -74,3 +83,172 @@ datapoints = {
         "path": "tuya_status",
     },
 }
+
+
+class DeviceStatus(Mapping):
+    """One device's datapoint status, decoded against ``SCHEMA``.
+
+    Known datapoints sit in fixed slots, so an entity that knows its slot reads
+    its value with one tuple index; anything the schema does not describe is
+    kept as-is in ``extras``.  As a mapping it answers to both the numeric id
+    and the dpCode of a known datapoint, like the aliased dict it replaces.
+    """
+
+    __slots__ = ("_values", "_extras")
+
+    def __init__(self, values: tuple, extras: dict) -> None:
+        self._values = values
+        self._extras = extras
+
+    def at(self, slot: int, default=None):
+        """The value in a schema slot, or ``default`` when it was not reported."""
+        value = self._values[slot]
+        return default if value is MISSING else value
+
+    @property
+    def extras(self) -> Mapping:
+        return self._extras
+
+    def as_payload(self) -> dict:
+        """The datapoints by dpCode plus the extras; ``decode`` reads it back."""
+        payload = {
+            spec.code: value
+            for spec, value in zip(SCHEMA.specs, self._values)
+            if value is not MISSING
+        }
+        payload.update(self._extras)
+        return payload
+
+    def __getitem__(self, key):
+        slot = SCHEMA.slots.get(str(key))
+        if slot is not None and self._values[slot] is not MISSING:
+            return self._values[slot]
+        return self._extras[key]
+
+    def __iter__(self):
+        for spec, value in zip(SCHEMA.specs, self._values):
+            if value is not MISSING:
+                yield spec.dp_id
+                yield spec.code
+        yield from self._extras
+
+    def __len__(self) -> int:
+        present = sum(1 for value in self._values if value is not MISSING)
+        return 2 * present + len(self._extras)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DeviceStatus):
+            return self._values == other._values and self._extras == other._extras
+        return Mapping.__eq__(self, other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"DeviceStatus({dict(self)!r})"
+
+
+@dataclass(frozen=True, slots=True)
+class DatapointSpec:
+    dp_id: str
+    code: str
+    slot: int
+
+
+class DatapointSchema:
+    """The ``datapoints`` table compiled once into slot lookups.
+
+    Replaces copying every cloud status and looping over the table to alias
+    numeric ids to dpCodes on each refresh, and probing three keys per read.
+    """
+
+    def __init__(self, table: dict) -> None:
+        self.specs = tuple(
+            DatapointSpec(str(dp_id), info["dpCode"], slot)
+            for slot, (dp_id, info) in enumerate(table.items())
+        )
+        # Numeric ids and dpCodes share one namespace; they never collide.
+        self.slots = {spec.dp_id: spec.slot for spec in self.specs}
+        self.slots.update({spec.code: spec.slot for spec in self.specs})
+        self._id_slots = {spec.dp_id: spec.slot for spec in self.specs}
+        self._code_slots = {spec.code: spec.slot for spec in self.specs}
+        self.empty = DeviceStatus((MISSING,) * len(self.specs), {})
+
+    def slot(self, key) -> int | None:
+        """The slot of a datapoint, by numeric id or dpCode."""
+        return self.slots.get(str(key))
+
+    def decode(self, raw, product_ctn: str | None = None) -> DeviceStatus:
+        """Decode a raw status payload into a ``DeviceStatus``.
+
+        Accepts the cloud shape (a mapping, possibly with the datapoints nested
+        under "dps" as a dict or JSON string) and the LAN shape (a list of
+        ``{"code": ..., "value": ...}``).  A numeric id wins over its dpCode
+        when a payload carries both.  Raises ValueError when "dps" is a string
+        that is not valid JSON.
+        """
+        if isinstance(raw, list):
+            raw = {
+                item["code"]: item.get("value")
+                for item in raw
+                if isinstance(item, dict) and "code" in item
+            }
+        if not isinstance(raw, Mapping) or not raw:
+            return self.empty
+        payload = dict(raw)
+        dps = payload.pop("dps", None)
+        if isinstance(dps, str):
+            dps = json.loads(dps)
+        if isinstance(dps, Mapping):
+            payload.update(dps)
+        values = [MISSING] * len(self.specs)
+        extras = {}
+        for key, value in payload.items():
+            slot = self._code_slots.get(key)
+            if slot is not None:
+                if values[slot] is MISSING:
+                    values[slot] = value
+                continue
+            extras[key] = value
+        for key in list(extras):
+            slot = self._id_slots.get(str(key))
+            if slot is not None:
+                values[slot] = extras.pop(key)
+        # The current app uses DP 101 for PAW3300/3320 quick feeding; older
+        # models use DP 201.
+        if product_ctn in _DP101_FEEDERS and "101" in extras:
+            values[self._code_slots["feed_num"]] = extras["101"]
+        return DeviceStatus(tuple(values), extras)
+
+    def apply(
+        self, status: DeviceStatus, dps, product_ctn: str | None = None
+    ) -> DeviceStatus:
+        """``status`` with a partial report (e.g. a pushed DP change) on top."""
+        update = self.decode(dps, product_ctn)
+        values = tuple(
+            old if new is MISSING else new
+            for old, new in zip(status._values, update._values)
+        )
+        extras = {**status._extras, **update._extras} if update._extras else status._extras
+        return DeviceStatus(values, extras)
+
+    def reported(self, status: DeviceStatus, key) -> bool:
+        """Whether ``status`` carries a value for a datapoint (id or dpCode)."""
+        slot = self.slots.get(str(key))
+        return slot is not None and status._values[slot] is not MISSING
+
+
+# Feeders whose quick-feed datapoint is 101 rather than feed_num (201).
+_DP101_FEEDERS = frozenset({"PAW3300", "PAW3320"})
+
+# Datapoints that dispense food when written.  A write to one of these must
+# never be sent twice, so it is not retried over another route.
+FEED_DATAPOINTS = frozenset({"101", "201", "feed_num"})
+
+
+def feed_datapoint(product_ctn: str | None) -> str:
+    """The datapoint that dispenses food on this model."""
+    return "101" if product_ctn in _DP101_FEEDERS else "201"
+
+
+SCHEMA = DatapointSchema(datapoints)
+EMPTY_STATUS = SCHEMA.empty
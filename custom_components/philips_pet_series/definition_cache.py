@@ -0,0 +1,146 @@
+"""Cloud device definitions, kept across restarts until the firmware changes.
+
+A device's definition (DP schema, ``otaInfo`` module map, software version,
+localKey) is only ever different after a firmware update or a re-pairing, yet
+it is a full encrypted round trip per device.  Definitions are kept here in
+memory and under ``.storage`` with the firmware versions they were fetched
+under, which the OTA metadata reports anyway.  A definition is fetched again
+only when those versions change, when the device rejects its localKey, or
+after ``DEFINITION_TTL`` as a backstop.
+
+Each config entry keeps its own cache.  The stored copies leave the localKey
+out: ``KeyInventory`` keeps it, sealed, and a definition restored from storage
+is only used for its schema and module map.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFINITION_TTL = timedelta(days=7)
+
+_SAVE_DELAY = 10
+
+# Definition fields that are secrets and stay out of storage.
+_UNSTORED_FIELDS = frozenset({"localKey"})
+
+
+def storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.definitions.{entry_id}"
+
+
+def firmware_signal(*record_lists) -> str | None:
+    """The installed firmware versions in OTA records, or None if none are known."""
+    versions = sorted(
+        {
+            (str(record.get("type", "")), str(version))
+            for records in record_lists
+            for record in records or ()
+            if isinstance(record, dict)
+            and (version := record.get("currentVersion") or record.get("current_version"))
+        }
+    )
+    if not versions:
+        return None
+    return ",".join(f"{module}:{version}" for module, version in versions)
+
+
+@dataclass(slots=True)
+class _Entry:
+    definition: dict[str, Any]
+    fetched: datetime
+    signal: str | None
+
+
+class DefinitionCache:
+    """Tuya devId -> definition, with the firmware signal it was fetched under."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str | None = None) -> None:
+        # Without an entry the cache is kept in memory only.
+        self._store = Store(hass, 1, storage_key(entry_id)) if entry_id else None
+        self._entries: dict[str, _Entry] = {}
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Restore the stored definitions once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._store is None:
+            return
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict):
+            return
+        for tuya_id, record in stored.items():
+            if not isinstance(record, dict) or not isinstance(record.get("definition"), dict):
+                continue
+            fetched = dt_util.parse_datetime(str(record.get("fetched") or ""))
+            if fetched is not None:
+                self._entries[tuya_id] = _Entry(
+                    record["definition"], fetched, record.get("signal")
+                )
+
+    def _data(self) -> dict:
+        return {
+            tuya_id: {
+                "definition": {
+                    key: value
+                    for key, value in entry.definition.items()
+                    if key not in _UNSTORED_FIELDS
+                },
+                "fetched": entry.fetched.isoformat(),
+                "signal": entry.signal,
+            }
+            for tuya_id, entry in self._entries.items()
+        }
+
+    @callback
+    def _save(self) -> None:
+        if self._store is not None:
+            self._store.async_delay_save(self._data, _SAVE_DELAY)
+
+    def get(self, tuya_id: str) -> dict[str, Any] | None:
+        """The cached definition, unless it has outlived ``DEFINITION_TTL``."""
+        entry = self._entries.get(tuya_id)
+        if entry is None or dt_util.utcnow() - entry.fetched > DEFINITION_TTL:
+            return None
+        return entry.definition
+
+    @callback
+    def store(self, tuya_id: str, definition: dict[str, Any], signal: str | None) -> None:
+        self._entries[tuya_id] = _Entry(definition, dt_util.utcnow(), signal)
+        self._save()
+
+    @callback
+    def check_signal(self, tuya_id: str, signal: str | None) -> bool:
+        """Compare the current firmware signal; True if the definition is outdated.
+
+        An outdated definition is dropped, so the next read fetches it.  One
+        cached before the signal was known adopts it instead.
+        """
+        entry = self._entries.get(tuya_id)
+        if entry is None or signal is None or entry.signal == signal:
+            return False
+        if entry.signal is None:
+            entry.signal = signal
+            self._save()
+            return False
+        _LOGGER.debug("Firmware of %s changed; refetching its definition", tuya_id)
+        self.invalidate(tuya_id)
+        return True
+
+    @callback
+    def invalidate(self, tuya_id: str) -> None:
+        if self._entries.pop(tuya_id, None) is not None:
+            self._save()
@@ -80,6 +80,8 @@ async def async_get_config_entry_diagnostics(
         coordinator_info = {
             "last_update_success": coordinator.last_update_success,
             "update_interval": str(coordinator.update_interval),
+            "refresh_tiers": coordinator.schedule.as_dict(),
+            "live_updates": coordinator.live,
         }
         # Check if last_update_time exists (it may not be available in all HA versions)
         if hasattr(coordinator, "last_update_time") and coordinator.last_update_time:
@@ -88,12 +90,13 @@ async def async_get_config_entry_diagnostics(
 
         if coordinator.data:
             # Include summary of coordinator data (redacted)
+            snapshot = coordinator.data
             coordinator_summary = {
-                "homes_count": len(coordinator.data.get("homes", [])),
-                "devices_count": len(coordinator.data.get("devices", [])),
-                "meals_count": len(coordinator.data.get("meals", [])),
-                "event_types_count": len(coordinator.data.get("event_types", [])),
-                "settings_devices_count": len(coordinator.data.get("settings", {})),
+                "homes_count": len(snapshot.homes),
+                "devices_count": len(snapshot.devices),
+                "meals_count": len(snapshot.meals),
+                "event_types_count": len(snapshot.event_types),
+                "settings_devices_count": len(snapshot.by_device),
             }
             data["coordinator"]["data_summary"] = coordinator_summary
 
@@ -103,7 +106,7 @@ async def async_get_config_entry_diagnostics(
         # part to discover, and the loopback form shown inside Home Assistant
         # does not work from a separate recorder.
         cameras = []
-        for device in (coordinator.data.get("devices", []) if coordinator else []):
+        for device in (coordinator.data.devices if coordinator and coordinator.data else []):
             endpoint = bridge.stream_endpoint(device)
             if endpoint and endpoint.get("url"):
                 entry_info = {"name": device.name, "stream_url": endpoint["url"],
@@ -1,14 +1,29 @@
 """Base entity for Philips Pets Series integration."""
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from . import PhilipsPetsSeriesDataUpdateCoordinator
+from .snapshot import EMPTY_SNAPSHOT, DeviceSnapshot, Snapshot
 
 
 class PhilipsPetsSeriesEntity(CoordinatorEntity):
-    """Base entity class for Philips Pets Series devices."""
+    """Base entity class for Philips Pets Series devices.
+
+    A coordinator refresh only writes this entity's state when something it
+    reads changed (see ``SnapshotChanges``), or when its availability did.
+    Subclasses narrow what they read with ``_update_parts`` (snapshot parts),
+    ``_update_dps`` (datapoints within "status") and ``_update_event_types``
+    (event types within "events"); entities that also depend on the clock or
+    on state outside the coordinator set ``_always_update``.
+    """
+
+    _update_parts: frozenset[str] | None = None
+    _update_dps: frozenset[str] | None = None
+    _update_event_types: frozenset[str] | None = None
+    _always_update = False
 
     def __init__(
         self, coordinator: PhilipsPetsSeriesDataUpdateCoordinator, device, home
@@ -17,21 +32,67 @@ class PhilipsPetsSeriesEntity(CoordinatorEntity):
         super().__init__(coordinator)
         self._device = device
         self._home = home
+        self._written_available: bool | None = None
+
+    def _inputs_changed(self) -> bool:
+        """Whether the latest refresh changed anything this entity reads."""
+        changes = self.coordinator.changes
+        if changes.everything:
+            return True
+        change = changes.device(self._device.id)
+        if change is None:
+            return False
+        parts = change.parts if self._update_parts is None else change.parts & self._update_parts
+        if not parts:
+            return False
+        if parts == {"status"} and self._update_dps is not None:
+            return not change.dps.isdisjoint(self._update_dps)
+        if parts == {"events"} and self._update_event_types is not None:
+            return not change.event_types.isdisjoint(self._update_event_types)
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when this entity's inputs or availability changed."""
+        available = self.available
+        if (
+            self._always_update
+            or available != self._written_available
+            or self._inputs_changed()
+        ):
+            self._written_available = available
+            super()._handle_coordinator_update()
+
+    @property
+    def snapshot(self) -> Snapshot:
+        """The coordinator's latest snapshot (empty before the first refresh)."""
+        return getattr(self.coordinator, "data", None) or EMPTY_SNAPSHOT
+
+    @property
+    def device_data(self) -> DeviceSnapshot:
+        """Everything the latest refresh knows about this entity's device."""
+        device_data = self.snapshot.device(self._device.id)
+        if device_data is None:
+            return DeviceSnapshot(home=self._home, device=self._device)
+        return device_data
 
     def _definition_version(self):
         """Firmware version from the Tuya device record, when available."""
-        data = getattr(self.coordinator, "data", None) or {}
-        definition = data.get("device_definitions", {}).get(self._device.id)
-        if not isinstance(definition, dict):
+        device_data = self.device_data
+        if not isinstance(device_data.definition, dict):
             return None
-        ota_info = definition.get("otaInfo")
-        if isinstance(ota_info, dict):
-            module_map = ota_info.get("otaModuleMap")
-            if isinstance(module_map, dict):
-                wifi = module_map.get("wifi")
-                if isinstance(wifi, dict) and wifi.get("verSw"):
-                    return wifi["verSw"]
-        return definition.get("verSw")
+        wifi = device_data.ota_modules.get("wifi")
+        if isinstance(wifi, dict) and wifi.get("verSw"):
+            return wifi["verSw"]
+        return device_data.definition.get("verSw")
+
+    def latest_event(self, event_type: str):
+        """This device's newest event of ``event_type``, if any."""
+        return self.snapshot.events.latest(self._home.id, event_type, self._device.id)
+
+    def latest_event_time(self, event_type: str):
+        """Parsed time of this device's newest event of ``event_type``."""
+        return self.snapshot.events.latest_time(self._home.id, event_type, self._device.id)
 
     @property
     def device_info(self):
@@ -65,8 +126,8 @@ class PhilipsPetsSeriesEntity(CoordinatorEntity):
 
 def iter_home_devices(coordinator):
     """Yield each API home/device relationship exactly once."""
-    homes = {home.id: home for home in coordinator.data.get("homes", [])}
-    for home_id, devices in coordinator.data.get("home_devices", {}).items():
+    homes = {home.id: home for home in coordinator.data.homes}
+    for home_id, devices in coordinator.data.home_devices.items():
         home = homes.get(home_id)
         if home is not None:
             yield from ((home, device) for device in devices)
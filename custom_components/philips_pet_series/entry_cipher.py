@@ -0,0 +1,60 @@
+"""Encryption for secrets a config entry keeps under ``.storage``.
+
+The Tuya mobile session and the devices' localKeys grant access to the
+account and to the feeders on the LAN, so the stores holding them are sealed
+with AES-GCM under a key derived from this Home Assistant instance's ID and
+the entry ID.  The stored files alone then do not reveal them, for instance in
+a diagnostics dump or a file copied off the machine.  It is not meant to hold
+up against someone who can read the instance's whole configuration directory.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+from typing import Any
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import instance_id
+
+from .const import DOMAIN
+
+
+class EntryCipher:
+    """Seal and open JSON values for one config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._entry_id = entry_id
+        self._aes: AESGCM | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether ``async_setup`` has derived the key."""
+        return self._aes is not None
+
+    async def async_setup(self) -> None:
+        """Derive the key; the instance ID is read from storage once."""
+        if self._aes is None:
+            instance = await instance_id.async_get(self.hass)
+            self._aes = AESGCM(
+                hashlib.sha256(f"{DOMAIN}:{instance}:{self._entry_id}".encode()).digest()
+            )
+
+    def seal(self, value: Any) -> str:
+        nonce = os.urandom(12)
+        plain = json.dumps(value).encode()
+        return base64.b64encode(nonce + self._aes.encrypt(nonce, plain, None)).decode()
+
+    def unseal(self, sealed: Any) -> Any:
+        """The sealed value; raises ValueError or TypeError if it does not open."""
+        raw = base64.b64decode(sealed)
+        try:
+            plain = self._aes.decrypt(raw[:12], raw[12:], None)
+        except InvalidTag as err:
+            raise ValueError("sealed value does not open under this entry's key") from err
+        return json.loads(plain)
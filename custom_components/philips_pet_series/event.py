@@ -32,7 +32,7 @@ async def async_setup_entry(
     ]["coordinator"]
     event_types = [
         getattr(event_type, "value", event_type)
-        for event_type in coordinator.data.get("event_types", [])
+        for event_type in coordinator.data.event_types
     ]
     async_add_entities(
         PhilipsPetsSeriesEventEntity(coordinator, home, device, event_type)
@@ -45,9 +45,12 @@ async def async_setup_entry(
 class PhilipsPetsSeriesEventEntity(PhilipsPetsSeriesEntity, EventEntity):
     """Fire when this device raises a given Philips event."""
 
+    _update_parts = frozenset({"events"})
+
     def __init__(self, coordinator, home, device, event_type) -> None:
         super().__init__(coordinator, device, home)
         self._event_type = getattr(event_type, "value", event_type)
+        self._update_event_types = frozenset({self._event_type})
         self._attr_unique_id = f"{device.id}_{self._event_type}_event"
         self._attr_name = self._event_type.replace("_", " ").capitalize()
         self._attr_event_types = [self._event_type]
@@ -65,23 +68,8 @@ class PhilipsPetsSeriesEventEntity(PhilipsPetsSeriesEntity, EventEntity):
             self._last_event_id = str(latest.id)
 
     def _latest_event(self):
-        """This device's newest event of this type, if any.
-
-        Events are indexed per home, so occurrences belonging to other devices
-        have to be filtered out.
-        """
-        events = self.coordinator.data.get("events_by_home_and_type", {}).get(
-            f"{self._home.id}_{self._event_type}", []
-        )
-        mine = [
-            event
-            for event in events
-            if getattr(event, "device_id", None) is None
-            or str(event.device_id) == str(self._device.id)
-        ]
-        if not mine:
-            return None
-        return max(mine, key=lambda event: event.time or "")
+        """This device's newest event of this type, if any."""
+        return self.latest_event(self._event_type)
 
     @callback
     def _handle_coordinator_update(self) -> None:
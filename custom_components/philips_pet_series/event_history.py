@@ -0,0 +1,372 @@
+"""Retained event history, synced incrementally and journaled to disk.
+
+Entities look back over several days of events, but only the last few minutes
+of that window can change between refreshes.  Re-downloading the whole window
+every time makes each refresh's payload and parse time grow with the length of
+the history, so instead the history is kept here and each refresh asks the
+cloud only for what is newer than its high-water mark.
+
+The high-water mark is the time up to which a home's events were last fetched
+completely, not the newest event time: a type that fires once a week would
+otherwise hold the window open for days, and upcoming meals are dated in the
+future.  Each fetch reaches back ``overlap`` past the mark for events the cloud
+records late, and the fetched window replaces what was cached for it, so an
+event that disappears upstream (a cancelled upcoming meal) disappears here too.
+
+The history is journaled under ``.storage``, per config entry, as one segment
+per UTC day plus a manifest holding the segment list and the high-water marks.
+A sync only rewrites the segments it touched (normally just today's) and
+retention drops whole segments, so a restart resumes from the mark instead of
+re-downloading the window, without rewriting a week of events on every
+refresh.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# How far before the high-water mark each incremental fetch starts.
+SYNC_OVERLAP = timedelta(hours=1)
+
+
+def storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.event_journal.{entry_id}"
+
+
+def parse_time(value) -> datetime | None:
+    """An event time as an aware datetime, or None if it does not parse."""
+    parsed = dt_util.parse_datetime(str(value or ""))
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed
+
+
+def _segment(at: datetime) -> str:
+    return dt_util.as_utc(at).strftime("%Y%m%d")
+
+
+@dataclass(frozen=True, slots=True)
+class EventRecord:
+    """One event, normalised once when it is fetched or restored.
+
+    ``time`` is kept as the cloud sent it; ``at`` is the parsed aware datetime
+    and ``epoch`` its Unix time for sorting and comparison, both None when the
+    time does not parse.  Only the fields entities actually read are kept, from
+    whichever petsseries event class the type maps to.
+    """
+
+    id: str
+    type: str
+    time: str
+    at: datetime | None
+    epoch: int | None
+    source: str | None = None
+    url: str | None = None
+    device_id: str | None = None
+    device_name: str | None = None
+    product_ctn: str | None = None
+    thumbnail_url: str | None = None
+    thumbnail_key: str | None = None
+    meal_name: str | None = None
+    meal_amount: int | None = None
+
+    @classmethod
+    def from_event(cls, event) -> EventRecord:
+        """Normalise a petsseries event, or a journaled record's dict."""
+        get = event.get if isinstance(event, dict) else lambda name: getattr(event, name, None)
+        at = parse_time(get("time"))
+        device_id = get("device_id")
+        return cls(
+            id=str(get("id")),
+            type=str(get("type")),
+            time=str(get("time") or ""),
+            at=at,
+            epoch=int(at.timestamp()) if at is not None else None,
+            device_id=str(device_id) if device_id is not None else None,
+            **{name: get(name) for name in _OPTIONAL_FIELDS if name != "device_id"},
+        )
+
+    def as_dict(self) -> dict:
+        """The journaled form; ``at`` and ``epoch`` are derived on load."""
+        return {
+            field.name: getattr(self, field.name)
+            for field in fields(self)
+            if field.name not in ("at", "epoch")
+        }
+
+
+_OPTIONAL_FIELDS = tuple(
+    field.name
+    for field in fields(EventRecord)
+    if field.name not in ("id", "type", "time", "at", "epoch")
+)
+
+
+def _sort_key(record: EventRecord) -> tuple[bool, int]:
+    # Unparseable times sort first, so they never win "latest".
+    return (record.epoch is not None, record.epoch or 0)
+
+
+class EventHistory:
+    """Per-home event history bounded to a retention window.
+
+    Entities do not read it directly: each refresh builds an ``EventIndex``
+    from ``events_by_type``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str | None = None,
+        overlap: timedelta = SYNC_OVERLAP,
+    ) -> None:
+        self.overlap = overlap
+        self._hass = hass
+        self._events: dict[str, dict[str, EventRecord]] = {}
+        self._high_water: dict[str, datetime] = {}
+        # Without an entry the history is kept in memory only.
+        self._key = storage_key(entry_id) if entry_id else None
+        self._manifest = Store(hass, 1, self._key) if self._key else None
+        self._segments: set[str] = set()
+        self._dirty: set[str] = set()
+        self._marks_changed = False
+        self._loaded = False
+        self._save_lock = asyncio.Lock()
+
+    def high_water(self, home_id: str) -> datetime | None:
+        return self._high_water.get(home_id)
+
+    def window_start(self, home_id: str, retain_from: datetime) -> datetime:
+        """Where the next fetch for a home should start."""
+        mark = self._high_water.get(home_id)
+        if mark is None:
+            return retain_from
+        return max(retain_from, mark - self.overlap)
+
+    def merge(
+        self,
+        home_id: str,
+        events: list,
+        fetched_from: datetime,
+        fetched_at: datetime,
+        retain_from: datetime,
+        types: set[str] | None = None,
+    ) -> None:
+        """Fold one fetch into the history and move the high-water mark.
+
+        ``events`` must be everything the cloud returned from ``fetched_from``
+        onwards; cached events inside that range are replaced by it.  Each is
+        normalised into an ``EventRecord`` here, once.
+
+        A fetch limited to some ``types`` only replaces cached events of those
+        types and leaves the mark alone, since the other types were not synced.
+        """
+        kept = {}
+        for event_id, record in self._events.get(home_id, {}).items():
+            if record.at is not None and (
+                retain_from <= record.at < fetched_from
+                or (types is not None and record.type not in types and record.at >= retain_from)
+            ):
+                kept[event_id] = record
+            elif record.at is not None:
+                self._dirty.add(_segment(record.at))
+        for event in events:
+            record = EventRecord.from_event(event)
+            kept[record.id] = record
+            if record.at is not None:
+                self._dirty.add(_segment(record.at))
+        self._events[home_id] = kept
+        if types is None:
+            self._high_water[home_id] = fetched_at
+            self._marks_changed = True
+        _LOGGER.debug(
+            "Event history for home %s: %d new, %d retained since %s",
+            home_id,
+            len(events),
+            len(kept),
+            retain_from,
+        )
+
+    def events_by_type(
+        self, home_id: str, type_values: list[str]
+    ) -> dict[str, list[EventRecord]]:
+        """The retained events of a home, split by type, oldest first."""
+        by_type: dict[str, list] = {type_value: [] for type_value in type_values}
+        for record in sorted(self._events.get(home_id, {}).values(), key=_sort_key):
+            if record.type in by_type:
+                by_type[record.type].append(record)
+        return by_type
+
+    def retain_homes(self, home_ids: set[str]) -> None:
+        """Drop the history of homes that are no longer configured."""
+        for home_id in set(self._events) - home_ids:
+            for record in self._events.pop(home_id).values():
+                if record.at is not None:
+                    self._dirty.add(_segment(record.at))
+            self._high_water.pop(home_id, None)
+            self._marks_changed = True
+
+    def _segment_store(self, segment: str) -> Store:
+        return _segment_store(self._hass, self._key, segment)
+
+    async def async_load(self) -> None:
+        """Restore the journal once, before the first sync."""
+        if self._loaded or self._manifest is None:
+            return
+        self._loaded = True
+        manifest = await self._manifest.async_load()
+        if not isinstance(manifest, dict):
+            return
+        for home_id, mark in (manifest.get("high_water") or {}).items():
+            parsed = dt_util.parse_datetime(str(mark))
+            if parsed is not None:
+                self._high_water[home_id] = parsed
+        for segment in manifest.get("segments") or []:
+            stored = await self._segment_store(segment).async_load()
+            if not isinstance(stored, dict):
+                # A segment the manifest lists but that cannot be read leaves a
+                # gap the mark would skip over; re-sync from scratch instead.
+                self._high_water.clear()
+                continue
+            self._segments.add(segment)
+            for home_id, events in (stored.get("homes") or {}).items():
+                for data in events:
+                    if isinstance(data, dict) and data.get("id") is not None:
+                        record = EventRecord.from_event(data)
+                        self._events.setdefault(home_id, {})[record.id] = record
+        _LOGGER.debug(
+            "Restored %d journaled events for %d homes",
+            sum(len(events) for events in self._events.values()),
+            len(self._events),
+        )
+
+    async def async_save(self) -> None:
+        """Write the segments touched since the last save, then the manifest.
+
+        The full and the single-device refresh both merge and save.  The dirty
+        set is taken before the first await, so a merge during a save is kept
+        for the next one, and saves run one at a time.
+        """
+        if not self._dirty and not self._marks_changed:
+            return
+        if self._manifest is None:
+            self._dirty.clear()
+            self._marks_changed = False
+            return
+        async with self._save_lock:
+            dirty, self._dirty = self._dirty, set()
+            self._marks_changed = False
+            by_segment: dict[str, dict[str, list[dict]]] = {}
+            for home_id, events in self._events.items():
+                for record in events.values():
+                    if record.at is not None and _segment(record.at) in dirty:
+                        by_segment.setdefault(_segment(record.at), {}).setdefault(
+                            home_id, []
+                        ).append(record.as_dict())
+            try:
+                for segment in dirty:
+                    store = self._segment_store(segment)
+                    if segment in by_segment:
+                        await store.async_save({"homes": by_segment[segment]})
+                        self._segments.add(segment)
+                    elif segment in self._segments:
+                        await store.async_remove()
+                        self._segments.discard(segment)
+            except BaseException:
+                # Whatever was not written is written by the next save.
+                self._dirty |= dirty
+                self._marks_changed = True
+                raise
+            await self._manifest.async_save(
+                {
+                    "segments": sorted(self._segments),
+                    "high_water": {
+                        home_id: mark.isoformat()
+                        for home_id, mark in self._high_water.items()
+                    },
+                }
+            )
+
+
+def _segment_store(hass: HomeAssistant, key: str, segment: str) -> Store:
+    return Store(hass, 1, f"{key}.{segment}")
+
+
+async def async_remove_journal(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete a config entry's journal: its segments, then the manifest."""
+    key = storage_key(entry_id)
+    manifest = Store(hass, 1, key)
+    stored = await manifest.async_load()
+    if isinstance(stored, dict):
+        for segment in stored.get("segments") or []:
+            await _segment_store(hass, key, segment).async_remove()
+    await manifest.async_remove()
+
+
+class EventIndex:
+    """Each device's events by type, built once per coordinator refresh.
+
+    This is the one index entities read events through.  Entities read their
+    newest event on every state evaluation; looking it up here replaces a scan
+    and a per-event device-id comparison of the whole home's history on each
+    read.  Events that carry no device id belong to every device of the home,
+    which is how single-device homes report them.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str, str], list[EventRecord]] = {}
+
+    @classmethod
+    def build(cls, events_by_home: dict, home_devices: dict) -> EventIndex:
+        """Index each home's ``events_by_type`` for the devices of that home."""
+        index = cls()
+        for home_id, devices in home_devices.items():
+            device_ids = [str(device.id) for device in devices]
+            for type_value, records in events_by_home.get(home_id, {}).items():
+                if not records:
+                    continue
+                shared = []
+                by_device: dict[str, list] = {}
+                for record in records:
+                    if record.device_id is None:
+                        shared.append(record)
+                    else:
+                        by_device.setdefault(record.device_id, []).append(record)
+                for device_id in device_ids:
+                    entries = shared + by_device.get(device_id, [])
+                    if entries:
+                        entries.sort(key=_sort_key)
+                        index._entries[(str(home_id), type_value, device_id)] = entries
+        return index
+
+    def events(self, home_id, type_value: str, device_id) -> list[EventRecord]:
+        """A device's events of one type, oldest first."""
+        return list(self._entries.get((str(home_id), type_value, str(device_id)), ()))
+
+    def latest(self, home_id, type_value: str, device_id) -> EventRecord | None:
+        entries = self._entries.get((str(home_id), type_value, str(device_id)))
+        return entries[-1] if entries else None
+
+    def latest_time(self, home_id, type_value: str, device_id) -> datetime | None:
+        latest = self.latest(home_id, type_value, device_id)
+        return latest.at if latest is not None else None
+
+    def changes(self, previous: EventIndex) -> dict[str, set[str]]:
+        """Event types whose events differ from ``previous``, by device id."""
+        changed: dict[str, set[str]] = {}
+        for key in self._entries.keys() | previous._entries.keys():
+            if self._entries.get(key) != previous._entries.get(key):
+                _home_id, type_value, device_id = key
+                changed.setdefault(device_id, set()).add(type_value)
+        return changed
@@ -3,7 +3,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.util import dt as dt_util
 
 import logging
 from . import DOMAIN, PhilipsPetsSeriesDataUpdateCoordinator
@@ -32,6 +31,9 @@ async def async_setup_entry(
 class PhilipsPetsSeriesMotionImage(PhilipsPetsSeriesEntity, ImageEntity):
     """Representation of a Philips Pets Series Motion Snapshot."""
 
+    _update_parts = frozenset({"events"})
+    _update_event_types = frozenset({"motion_detected"})
+
     def __init__(self, coordinator: PhilipsPetsSeriesDataUpdateCoordinator, home, device):
         """Initialize the image entity."""
         PhilipsPetsSeriesEntity.__init__(self, coordinator, device, home)
@@ -43,10 +45,7 @@ class PhilipsPetsSeriesMotionImage(PhilipsPetsSeriesEntity, ImageEntity):
     @property
     def image_last_updated(self):
         """The time when the image was last updated."""
-        latest_event = self._get_latest_event()
-        if latest_event:
-             return dt_util.parse_datetime(latest_event.time)
-        return None
+        return self.latest_event_time("motion_detected")
 
     @property
     def available(self) -> bool:
@@ -56,22 +55,10 @@ class PhilipsPetsSeriesMotionImage(PhilipsPetsSeriesEntity, ImageEntity):
     def _get_latest_event(self):
         """Return this device's newest motion event, if any.
 
-        Events are indexed per home, so entries from other devices in the same
-        home have to be filtered out -- otherwise this entity would serve
-        another camera's snapshot.  The API does not guarantee ordering, so pick
-        the newest explicitly instead of trusting the first element.
+        Only this device's events count -- otherwise this entity would serve
+        another camera's snapshot.
         """
-        key = f"{self._home.id}_motion_detected"
-        events = self.coordinator.data.get("events_by_home_and_type", {}).get(key, [])
-        mine = [
-            event
-            for event in events
-            if getattr(event, "device_id", None) is None
-            or str(event.device_id) == str(self._device.id)
-        ]
-        if not mine:
-            return None
-        return max(mine, key=lambda event: event.time or "")
+        return self.latest_event("motion_detected")
 
     async def async_image(self) -> bytes | None:
         """Fetch and decrypt the image."""
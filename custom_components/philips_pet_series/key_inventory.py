@@ -0,0 +1,166 @@
+"""LAN credentials for every device, kept across restarts.
+
+A device's ``localKey`` keys its LAN session and decrypts what it reports over
+MQTT, and it only changes when the device is re-paired.  Reading it means
+walking every home's device list, so the inventory is kept in memory and under
+``.storage`` and walked again only when it is older than ``INVENTORY_TTL``, a
+device turns up that the last walk did not cover, or a device rejects the key
+held for it.  LAN sessions and the camera bridge can then start from the
+stored keys without waiting for a cloud round trip.
+
+Each config entry keeps its own inventory, since a walk replaces everything
+held with what one account can see.  A localKey lets anyone on the LAN talk
+to the feeder, so the stored inventory is sealed with the entry's
+``EntryCipher``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .entry_cipher import EntryCipher
+from .tuya_cloud import TuyaCloudReader
+
+_LOGGER = logging.getLogger(__name__)
+
+INVENTORY_TTL = timedelta(days=7)
+
+_SAVE_DELAY = 5
+
+
+def storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.key_inventory.{entry_id}"
+
+
+@dataclass(frozen=True, slots=True)
+class LocalCredentials:
+    """What the cloud inventory says about one device's LAN identity."""
+
+    local_key: str
+    gw_id: str | None = None
+    uuid: str | None = None
+    ip: str | None = None
+
+
+class KeyInventory:
+    """Tuya devId -> LAN credentials, refreshed only when it has to be."""
+
+    def __init__(
+        self, hass: HomeAssistant, reader: TuyaCloudReader, entry_id: str | None = None
+    ) -> None:
+        # Without an entry the inventory is kept in memory only.
+        self._store = Store(hass, 1, storage_key(entry_id)) if entry_id else None
+        self._cipher = EntryCipher(hass, entry_id) if entry_id else None
+        self._reader = reader
+        self._devices: dict[str, LocalCredentials] = {}
+        # Devices the last walk found without a key (not Tuya devices, or
+        # shared without LAN access); asking again would not change that.
+        self._absent: set[str] = set()
+        self._fetched: datetime | None = None
+        self._loaded = False
+
+    def get(self, tuya_id: str | None) -> LocalCredentials | None:
+        return self._devices.get(str(tuya_id)) if tuya_id else None
+
+    async def async_load(self) -> None:
+        """Restore the stored inventory once."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._store is None:
+            return
+        await self._cipher.async_setup()
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict):
+            return
+        try:
+            stored = self._cipher.unseal(stored["sealed"])
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Stored key inventory is unusable; walking afresh: %s", err)
+            return
+        if not isinstance(stored, dict):
+            return
+        for tuya_id, record in (stored.get("devices") or {}).items():
+            if isinstance(record, dict) and record.get("local_key"):
+                self._devices[tuya_id] = LocalCredentials(
+                    local_key=str(record["local_key"]),
+                    gw_id=record.get("gw_id"),
+                    uuid=record.get("uuid"),
+                    ip=record.get("ip"),
+                )
+        self._absent = set(stored.get("absent") or ())
+        self._fetched = dt_util.parse_datetime(str(stored.get("fetched") or ""))
+
+    def _data(self) -> dict:
+        return {
+            "sealed": self._cipher.seal(
+                {
+                    "devices": {
+                        tuya_id: asdict(record) for tuya_id, record in self._devices.items()
+                    },
+                    "absent": sorted(self._absent),
+                    "fetched": self._fetched.isoformat() if self._fetched else None,
+                }
+            )
+        }
+
+    def _needs_walk(self, tuya_ids: set[str]) -> bool:
+        if self._fetched is None or dt_util.utcnow() - self._fetched > INVENTORY_TTL:
+            return True
+        return not tuya_ids <= self._devices.keys() | self._absent
+
+    async def async_ensure(self, tuya_ids: Iterable[str]) -> bool:
+        """Walk the inventory if it does not cover ``tuya_ids``; True if it did.
+
+        A failed walk keeps the keys already known.
+        """
+        await self.async_load()
+        wanted = {str(tuya_id) for tuya_id in tuya_ids}
+        if not self._needs_walk(wanted):
+            return False
+        try:
+            await self.async_refresh(wanted)
+        except Exception as err:  # noqa: BLE001 - keep the keys we have
+            _LOGGER.debug("Local key inventory unavailable: %s", err)
+            return False
+        return True
+
+    async def async_refresh(self, tuya_ids: Iterable[str] = ()) -> None:
+        """Walk the inventory now, replacing what is held."""
+        records = await self._reader.local_keys(refresh=True)
+        self._devices = {
+            str(record["device_id"]): LocalCredentials(
+                local_key=str(record["local_key"]),
+                gw_id=str(record["gw_id"]) if record.get("gw_id") else None,
+                uuid=record.get("uuid"),
+                ip=record.get("ip"),
+            )
+            for record in records
+            if record.get("device_id") and record.get("local_key")
+        }
+        self._absent = {str(tuya_id) for tuya_id in tuya_ids} - self._devices.keys()
+        self._fetched = dt_util.utcnow()
+        _LOGGER.debug("Local key inventory holds %d devices", len(self._devices))
+        if self._store is not None:
+            await self._cipher.async_setup()
+            await self._store.async_save(self._data())
+
+    @callback
+    def invalidate(self, tuya_id: str) -> None:
+        """Drop a key the device rejected; the next ``async_ensure`` walks again."""
+        self._absent.discard(str(tuya_id))
+        if self._devices.pop(str(tuya_id), None) is not None and self._cipher_ready():
+            self._store.async_delay_save(self._data, _SAVE_DELAY)
+
+    def _cipher_ready(self) -> bool:
+        # The key is derived on load; an inventory that was never loaded has
+        # nothing stored to update.
+        return self._cipher is not None and self._cipher.ready
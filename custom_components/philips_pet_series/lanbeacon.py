@@ -19,6 +19,7 @@ callers must treat :meth:`BeaconListener.seen` returning ``None`` as unknown.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 from dataclasses import dataclass
 import hashlib
 import json
@@ -104,21 +105,34 @@ class BeaconListener:
     def __init__(self) -> None:
         self._beacons: dict[str, Beacon] = {}
         self._transport: asyncio.BaseTransport | None = None
+        self._listeners: list[Callable[[str, Beacon], None]] = []
 
     @property
     def listening(self) -> bool:
         """Whether the socket is open. False means we know nothing at all."""
         return self._transport is not None
 
+    def add_listener(self, listener: Callable[[str, Beacon], None]) -> Callable[[], None]:
+        """Call ``listener(device_id, beacon)`` when a device appears or moves.
+
+        Not called for every repeat announcement, only when a device is first
+        seen, changes address, or comes back after going stale.
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
     def _record(self, device_id: str, ip: str, protocol) -> None:
         previous = self._beacons.get(device_id)
-        if previous is None or previous.ip != ip:
-            _LOGGER.debug("Feeder %s announced itself at %s", device_id, ip)
-        self._beacons[device_id] = Beacon(
+        beacon = Beacon(
             ip=ip,
             at=time.monotonic(),
             protocol=str(protocol) if protocol is not None else None,
         )
+        self._beacons[device_id] = beacon
+        if previous is None or previous.ip != ip or not previous.fresh:
+            _LOGGER.debug("Feeder %s announced itself at %s", device_id, ip)
+            for listener in list(self._listeners):
+                listener(device_id, beacon)
 
     @property
     def any_seen(self) -> bool:
@@ -160,3 +174,4 @@ class BeaconListener:
             self._transport.close()
             self._transport = None
         self._beacons.clear()
+        self._listeners.clear()
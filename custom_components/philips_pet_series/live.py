@@ -0,0 +1,359 @@
+"""Live datapoint updates pushed over Tuya's mobile MQTT channel.
+
+The Tuya app does not poll its devices: every datapoint change a device
+reports is relayed to the app over MQTT on ``smart/mb/in/{devId}``.  The camera
+bridge already derives working credentials for that broker, so the same
+session is used here to subscribe to every configured device and apply each
+report to the coordinator's data as it arrives.  Switches, selects, numbers
+and the fault sensor then follow the device within a second, and the polled
+status tier only has to reconcile.
+
+Device reports are encrypted with the device's ``localKey`` (from its cloud
+definition) in one of two framings:
+
+* ``2.1``: ``"2.1"`` + 16 signature characters + base64(AES-ECB(json))
+* ``2.2``: ``"2.2"`` + CRC32, sequence and source (4 bytes each) + AES-ECB(json)
+
+Only the small subset of MQTT 3.1.1 this needs is implemented (connect,
+subscribe, QoS 0/1 publishes in, keepalive), on plain asyncio streams, so the
+integration does not take a dependency on an MQTT client library for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Callable
+import json
+import logging
+import struct
+from typing import Any
+from urllib.parse import urlsplit
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.ssl import client_context
+from tuya_mobile import mqtt_client_id
+
+from .bridge import BRIDGE_PACKAGE, mobile_mqtt_session
+
+_LOGGER = logging.getLogger(__name__)
+
+# Tuya's "DP report" message; everything else on the channel is ignored.
+_PROTOCOL_DP_REPORT = 4
+
+_KEEPALIVE = 60
+# Reconnect backoff.  A broker refusal usually means the mobile session needs
+# renewing, which the client only does on its next API call, so do not hammer.
+_BACKOFF_START = 5
+_BACKOFF_MAX = 300
+
+_CONNECT = 0x10
+_CONNACK = 0x20
+_PUBLISH = 0x30
+_PUBACK = 0x40
+_SUBSCRIBE = 0x82
+_SUBACK = 0x90
+_PINGREQ = 0xC0
+_DISCONNECT = 0xE0
+
+
+class MqttError(Exception):
+    """The broker refused us or broke the protocol."""
+
+
+def _string(value: str | bytes) -> bytes:
+    raw = value.encode() if isinstance(value, str) else value
+    return struct.pack("!H", len(raw)) + raw
+
+
+def _packet(header: int, body: bytes = b"") -> bytes:
+    length = len(body)
+    encoded = bytearray()
+    while True:
+        digit, length = length % 128, length // 128
+        encoded.append(digit | (0x80 if length else 0))
+        if not length:
+            break
+    return bytes([header]) + bytes(encoded) + body
+
+
+async def _read_packet(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    header = (await reader.readexactly(1))[0]
+    length, multiplier = 0, 1
+    for _ in range(4):
+        digit = (await reader.readexactly(1))[0]
+        length += (digit & 0x7F) * multiplier
+        if not digit & 0x80:
+            break
+        multiplier *= 128
+    else:
+        raise MqttError("malformed remaining length")
+    return header, await reader.readexactly(length)
+
+
+def _aes_ecb_decrypt(local_key: str, data: bytes) -> bytes | None:
+    if not data or len(data) % 16:
+        return None
+    try:
+        decryptor = Cipher(algorithms.AES(local_key.encode()), modes.ECB()).decryptor()
+        plain = decryptor.update(data) + decryptor.finalize()
+    except ValueError:
+        return None
+    if plain and 0 < plain[-1] <= 16:
+        plain = plain[: -plain[-1]]
+    return plain
+
+
+def decode_message(payload: bytes, local_key: str | None) -> dict | None:
+    """The JSON body of a device message, or None if it cannot be read."""
+    if payload.startswith(b"{"):
+        plain = payload
+    elif not local_key:
+        return None
+    elif payload.startswith(b"2.1"):
+        try:
+            encrypted = base64.b64decode(payload[19:])
+        except ValueError:
+            return None
+        plain = _aes_ecb_decrypt(local_key, encrypted)
+    elif payload.startswith(b"2.2"):
+        plain = _aes_ecb_decrypt(local_key, payload[15:])
+    else:
+        return None
+    if plain is None:
+        return None
+    try:
+        message = json.loads(plain.decode("utf-8", "replace"))
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+def report_dps(message: dict) -> tuple[str | None, dict] | None:
+    """``(devId, dps)`` of a DP report message, else None."""
+    if message.get("protocol") != _PROTOCOL_DP_REPORT:
+        return None
+    data = message.get("data")
+    if not isinstance(data, dict) or not isinstance(data.get("dps"), dict):
+        return None
+    return data.get("devId"), data["dps"]
+
+
+class MqttConnection:
+    """One connected, subscribed session with the broker."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._packet_id = 0
+
+    @classmethod
+    async def connect(
+        cls, broker: str, client_id: str, username: str, password: str
+    ) -> MqttConnection:
+        url = urlsplit(broker)
+        reader, writer = await asyncio.open_connection(
+            url.hostname,
+            url.port or 8883,
+            ssl=client_context() if url.scheme in ("ssl", "mqtts") else None,
+        )
+        connection = cls(reader, writer)
+        try:
+            # Clean session, username and password flags.
+            body = (
+                _string("MQTT")
+                + bytes([4, 0xC2])
+                + struct.pack("!H", _KEEPALIVE)
+                + _string(client_id)
+                + _string(username)
+                + _string(password)
+            )
+            writer.write(_packet(_CONNECT, body))
+            await writer.drain()
+            header, body = await asyncio.wait_for(_read_packet(reader), _KEEPALIVE)
+            if header & 0xF0 != _CONNACK or len(body) < 2:
+                raise MqttError("no CONNACK from broker")
+            if body[1]:
+                raise MqttError(f"broker refused the connection (code {body[1]})")
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    async def subscribe(self, topics: list[str]) -> None:
+        """Ask for ``topics`` at QoS 1; the SUBACK arrives through ``listen``."""
+        if not topics:
+            return
+        self._packet_id = self._packet_id % 0xFFFF + 1
+        body = struct.pack("!H", self._packet_id) + b"".join(
+            _string(topic) + b"\x01" for topic in topics
+        )
+        self._writer.write(_packet(_SUBSCRIBE, body))
+        await self._writer.drain()
+
+    async def listen(self, on_message: Callable[[str, bytes], None]) -> None:
+        """Deliver publishes until the connection drops, keeping it alive."""
+        pinger = asyncio.create_task(self._ping())
+        try:
+            while True:
+                header, body = await asyncio.wait_for(
+                    _read_packet(self._reader), _KEEPALIVE * 1.5
+                )
+                kind = header & 0xF0
+                if kind == _PUBLISH:
+                    qos = (header >> 1) & 0x03
+                    (topic_length,) = struct.unpack_from("!H", body)
+                    topic = body[2 : 2 + topic_length].decode("utf-8", "replace")
+                    offset = 2 + topic_length
+                    if qos:
+                        packet_id = body[offset : offset + 2]
+                        offset += 2
+                        self._writer.write(_packet(_PUBACK, packet_id))
+                    on_message(topic, body[offset:])
+                elif kind == _SUBACK and b"\x80" in body[2:]:
+                    _LOGGER.debug("Broker refused a live update subscription")
+        finally:
+            pinger.cancel()
+            try:
+                await pinger
+            except asyncio.CancelledError:
+                pass
+            except Exception as err:  # noqa: BLE001 - the read side reports the drop
+                _LOGGER.debug("Live update keepalive failed: %s", err)
+
+    async def _ping(self) -> None:
+        while True:
+            await asyncio.sleep(_KEEPALIVE / 2)
+            self._writer.write(_packet(_PINGREQ))
+            await self._writer.drain()
+
+    def close(self) -> None:
+        if not self._writer.is_closing():
+            try:
+                self._writer.write(_packet(_DISCONNECT))
+            except Exception:  # noqa: BLE001 - already broken, just close
+                pass
+            self._writer.close()
+
+
+class LiveUpdates:
+    """Keep an MQTT subscription for every configured device's DP reports."""
+
+    def __init__(self, hass: HomeAssistant, client: Any, coordinator: Any) -> None:
+        self.hass = hass
+        self.client = client
+        self.coordinator = coordinator
+        self._client_id = mqtt_client_id(BRIDGE_PACKAGE)
+        self._task: asyncio.Task[None] | None = None
+        self._connection: MqttConnection | None = None
+        self._subscribed: set[str] = set()
+        self._remove_listener: Callable[[], None] | None = None
+        # Delay before the next reconnect; reset once a session is subscribed.
+        self._backoff = _BACKOFF_START
+        # Set on every coordinator update, for a run waiting on its first key.
+        self._keys_changed = asyncio.Event()
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    @staticmethod
+    def _topic(tuya_id: str) -> str:
+        return f"smart/mb/in/{tuya_id}"
+
+    def async_start(self) -> None:
+        if self._task is not None:
+            return
+        self._remove_listener = self.coordinator.async_add_listener(
+            self._async_coordinator_updated
+        )
+        self._task = self.hass.async_create_background_task(
+            self._async_run(), name="philips-pet-series-live-updates"
+        )
+
+    async def async_stop(self) -> None:
+        if self._remove_listener is not None:
+            self._remove_listener()
+            self._remove_listener = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @callback
+    def _async_coordinator_updated(self) -> None:
+        # A newly added device, or a definition that only now carries its
+        # localKey, needs subscribing on the open connection.
+        self._keys_changed.set()
+        connection = self._connection
+        if connection is None:
+            return
+        topics = [
+            self._topic(tuya_id)
+            for tuya_id in self.coordinator.local_keys()
+            if self._topic(tuya_id) not in self._subscribed
+        ]
+        if topics:
+            self._subscribed.update(topics)
+            self.hass.async_create_task(connection.subscribe(topics))
+
+    async def _async_run(self) -> None:
+        while True:
+            self._keys_changed.clear()
+            topics = [self._topic(tuya_id) for tuya_id in self.coordinator.local_keys()]
+            if not topics:
+                # Nothing to subscribe to, which is not a failure: wait for a
+                # refresh to bring a localKey rather than backing off.
+                await self._keys_changed.wait()
+                continue
+            try:
+                await self._async_session(topics)
+            except asyncio.CancelledError:
+                raise
+            except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Live update connection lost: %s", err)
+            except Exception as err:  # noqa: BLE001 - keep retrying
+                _LOGGER.debug("Live updates unavailable: %s", err)
+            finally:
+                if self._connection is not None:
+                    self._connection.close()
+                    self._connection = None
+                self._subscribed.clear()
+                self.coordinator.async_set_live(False)
+            await asyncio.sleep(self._backoff)
+            self._backoff = min(self._backoff * 2, _BACKOFF_MAX)
+
+    async def _async_session(self, topics: list[str]) -> None:
+        await self.client.ensure_token_valid()
+        mqtt = await asyncio.to_thread(mobile_mqtt_session, self.client._tuya_mobile)
+        connection = await MqttConnection.connect(
+            mqtt["broker"], self._client_id, mqtt["username"], mqtt["password"]
+        )
+        self._connection = connection
+        self._subscribed = set(topics)
+        await connection.subscribe(topics)
+        _LOGGER.debug("Receiving live updates for %d devices", len(topics))
+        # A session only ever ends by raising, so a drop after a healthy
+        # session must not inherit the backoff of earlier failed attempts.
+        self._backoff = _BACKOFF_START
+        self.coordinator.async_set_live(True)
+        await connection.listen(self._handle_message)
+
+    def _handle_message(self, topic: str, payload: bytes) -> None:
+        tuya_id = topic.rsplit("/", 1)[-1]
+        device_id, local_key = self.coordinator.local_keys().get(tuya_id, (None, None))
+        if device_id is None:
+            return
+        message = decode_message(payload, local_key)
+        report = report_dps(message) if message is not None else None
+        if report is None:
+            return
+        reported_id, dps = report
+        if reported_id and str(reported_id) != tuya_id:
+            return
+        _LOGGER.debug("Live DP report for %s: %s", device_id, dps)
+        self.coordinator.async_apply_dps(device_id, dps)
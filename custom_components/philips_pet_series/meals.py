@@ -33,14 +33,10 @@ class MealOccurrence:
 
 def device_meals(coordinator, device_id) -> list:
     """Return the enabled meals belonging to one device."""
-    meals = []
-    for meal in coordinator.data.get("meals", []):
-        if not getattr(meal, "enabled", False):
-            continue
-        if str(getattr(meal, "device_id", "")) != str(device_id):
-            continue
-        meals.append(meal)
-    return meals
+    device_data = coordinator.data.device(device_id)
+    if device_data is None:
+        return []
+    return [meal for meal in device_data.meals if getattr(meal, "enabled", False)]
 
 
 def _parse_feed_time(meal):
@@ -11,7 +11,7 @@ from petsseries.api import PetsSeriesClient
 
 from . import DOMAIN, PhilipsPetsSeriesDataUpdateCoordinator
 from .entity import PhilipsPetsSeriesEntity, iter_home_devices
-from .datapoints import datapoints
+from .datapoints import SCHEMA as DATAPOINT_SCHEMA, DeviceStatus, datapoints
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +42,7 @@ async def async_setup_entry(
     """Set up the Philips Pets Series number entities."""
     coordinator: PhilipsPetsSeriesDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     client: PetsSeriesClient = hass.data[DOMAIN][config_entry.entry_id]["client"]
+    commands = hass.data[DOMAIN][config_entry.entry_id]["commands"]
 
     numbers = []
 
@@ -50,9 +51,6 @@ async def async_setup_entry(
         return
 
     for home, device in iter_home_devices(coordinator):
-            device_id = device.id
-            device_settings = coordinator.data["settings"].get(device_id, {})
-
             # Iterate through all datapoints
             for dp_id, dp_info in datapoints.items():
                 dp_code = dp_info["dpCode"]
@@ -68,11 +66,11 @@ async def async_setup_entry(
                         # An action rather than a setting: writing it feeds the
                         # pet straight away, so it belongs with the controls.
                         number_entitiy = PhilipsPetsSeriesNumber(
-                            coordinator, client, home, device, str(dp_id), dp_code, dp_info["properties"], dp_path
+                            coordinator, client, commands, home, device, str(dp_id), dp_code, dp_info["properties"], dp_path
                         )
                     else:
                         number_entitiy = PhilipsPetsSeriesNumber(
-                            coordinator, client, home, device, str(dp_id), dp_code, dp_info["properties"], dp_path, EntityCategory.CONFIG
+                            coordinator, client, commands, home, device, str(dp_id), dp_code, dp_info["properties"], dp_path, EntityCategory.CONFIG
                         )
                     numbers.append(number_entitiy)
 
@@ -81,12 +79,17 @@ async def async_setup_entry(
 class PhilipsPetsSeriesNumber(PhilipsPetsSeriesEntity, NumberEntity):
     """Representation of a Philips Pets Series number entity for Integer datapoints."""
 
-    def __init__(self, coordinator, client, home, device, dp_id, dp_code, properties, dp_path, category=None):
+    _update_parts = frozenset({"status", "settings"})
+
+    def __init__(self, coordinator, client, commands, home, device, dp_id, dp_code, properties, dp_path, category=None):
         """Initialize the number entity."""
         super().__init__(coordinator, device, home)
         self._client = client
+        self._commands = commands
         self._dp_id = dp_id
         self._dp_code = dp_code
+        self._update_dps = frozenset({str(dp_id), dp_code})
+        self._dp_slot = DATAPOINT_SCHEMA.slot(dp_id)
         self._properties = properties
         self._dp_path = dp_path
         self._attr_unique_id = f"{device.id}_number_{dp_code}"
@@ -132,30 +135,22 @@ class PhilipsPetsSeriesNumber(PhilipsPetsSeriesEntity, NumberEntity):
     def _dp_lookup(self, settings):
         """Return the datapoint value, or ``_MISSING`` when absent.
 
-        The cloud status is keyed by numeric datapoint id and only gains the
-        readable dpCode aliases when the alias pass runs, so a lookup by code
-        alone reports the entity unavailable whenever the fallback status dict
-        is in use.  Accept either key.
+        A decoded Tuya status is read straight from the datapoint's schema
+        slot; the Philips settings are a plain mapping keyed by dpCode or id.
         """
-        for key in (self._dp_code, self._dp_id, str(self._dp_id)):
+        if isinstance(settings, DeviceStatus) and self._dp_slot is not None:
+            return settings.at(self._dp_slot, self._MISSING)
+        for key in (self._dp_code, str(self._dp_id)):
             if key in settings:
                 return settings[key]
         return self._MISSING
 
     def _get_settings(self):
-        """Retrieve the correct settings dictionary based on dp_path."""
-        device_settings = self.coordinator.data["settings"].get(self._device.id, {})
+        """Retrieve the correct settings mapping based on dp_path."""
+        device_data = self.device_data
         if self._dp_path == "tuya_status":
-            tuya_status = device_settings.get("tuya_status", {})
-            if isinstance(tuya_status, list):
-                # Convert list of {'code': ..., 'value': ...} dicts to a mapping
-                status_dict = {item['code']: item['value'] for item in tuya_status}
-                return status_dict
-            elif isinstance(tuya_status, dict):
-                return tuya_status
-            else:
-                return {}
-        return device_settings
+            return device_data.status
+        return device_data.settings
 
     @property
     def available(self) -> bool:
@@ -190,12 +185,7 @@ class PhilipsPetsSeriesNumber(PhilipsPetsSeriesEntity, NumberEntity):
                 self._attr_name,
                 int_value,
             )
-            dp_code = self._dp_id
-            await self._client.publish_cloud_dps(
-                self.coordinator.tuya_device_id(self._device),
-                {dp_code: int_value},
-            )
-            await self.coordinator.async_request_refresh()
+            await self._commands.async_publish(self._device, {self._dp_id: int_value})
         except Exception as e:
             raise HomeAssistantError(
                 f"Failed to set {self._attr_name} to {value}: {e}"
@@ -0,0 +1,148 @@
+"""Per-dataset refresh tiers for the coordinator.
+
+The coordinator wakes up at the pace of its fastest tier, but most of what it
+fetches changes far more slowly than the live datapoints: OTA metadata and
+device definitions change with a firmware release, the discovery config with an
+app release, invites when somebody is invited.  Each dataset therefore has its
+own interval, and a cycle only fetches the tiers that are due.
+
+Every tier also carries a staleness budget.  When a fetch fails, the previous
+value keeps being served until the budget runs out; after that it is dropped,
+so a dataset the cloud has stopped returning reads as absent rather than as a
+value that merely looks current.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+import time
+
+TIER_INVENTORY = "inventory"
+TIER_STATUS = "status"
+TIER_EVENTS = "events"
+TIER_MEALS = "meals"
+TIER_SETTINGS = "settings"
+TIER_FIRMWARE = "firmware"
+TIER_DEFINITIONS = "definitions"
+TIER_DISCOVERY = "discovery"
+TIER_INVITES = "invites"
+
+
+@dataclass(slots=True)
+class RefreshTier:
+    """How often one dataset is refreshed, and how long it may be served stale."""
+
+    name: str
+    interval: timedelta
+    max_age: timedelta
+    last_success: float | None = None
+    requested: bool = False
+
+    def due(self, now: float) -> bool:
+        # A small slack keeps a tier whose interval is a multiple of the
+        # coordinator's from slipping a whole cycle on timer jitter.
+        return (
+            self.requested
+            or self.last_success is None
+            or now - self.last_success >= self.interval.total_seconds() - 5
+        )
+
+    def expired(self, now: float) -> bool:
+        return (
+            self.last_success is None
+            or now - self.last_success > self.max_age.total_seconds()
+        )
+
+
+# (interval, staleness budget) per tier.  The live datapoint tier drives the
+# coordinator's own update interval; everything else is fetched on a multiple
+# of it.  It keeps the integration's original five-minute poll, so the fastest
+# tier makes no more cloud requests than every dataset used to; writes are
+# confirmed by a targeted read instead.  Inventory (homes and their devices) is
+# refreshed often enough that a newly added feeder is noticed within the hour.
+DEFAULT_TIERS = {
+    TIER_STATUS: (timedelta(minutes=5), timedelta(minutes=30)),
+    TIER_EVENTS: (timedelta(minutes=5), timedelta(minutes=30)),
+    TIER_MEALS: (timedelta(minutes=15), timedelta(hours=2)),
+    TIER_SETTINGS: (timedelta(minutes=15), timedelta(hours=2)),
+    TIER_INVENTORY: (timedelta(minutes=30), timedelta(hours=6)),
+    TIER_INVITES: (timedelta(hours=1), timedelta(hours=12)),
+    TIER_DEFINITIONS: (timedelta(hours=6), timedelta(days=2)),
+    TIER_FIRMWARE: (timedelta(hours=6), timedelta(days=2)),
+    TIER_DISCOVERY: (timedelta(hours=24), timedelta(days=7)),
+}
+
+
+class RefreshSchedule:
+    """Track which tiers are due and which have outlived their budget."""
+
+    def __init__(self, tiers: dict[str, tuple[timedelta, timedelta]] | None = None) -> None:
+        self._configured = dict(tiers or DEFAULT_TIERS)
+        self.tiers = {
+            name: RefreshTier(name, interval, max_age)
+            for name, (interval, max_age) in self._configured.items()
+        }
+
+    @property
+    def base_interval(self) -> timedelta:
+        """The coordinator interval: the fastest tier's."""
+        return min(tier.interval for tier in self.tiers.values())
+
+    def due(self, now: float | None = None) -> set[str]:
+        now = time.monotonic() if now is None else now
+        return {name for name, tier in self.tiers.items() if tier.due(now)}
+
+    def expired(self, name: str, now: float | None = None) -> bool:
+        now = time.monotonic() if now is None else now
+        return self.tiers[name].expired(now)
+
+    def mark_success(self, name: str, now: float | None = None) -> None:
+        tier = self.tiers[name]
+        tier.last_success = time.monotonic() if now is None else now
+        tier.requested = False
+
+    def restore(self, name: str, age: float) -> None:
+        """Count a tier as fetched ``age`` seconds ago, from stored data.
+
+        The tier is still due on the next cycle; restoring only gives the
+        stored data the staleness budget it has left.
+        """
+        tier = self.tiers[name]
+        tier.last_success = time.monotonic() - age
+        tier.requested = True
+
+    def retune(
+        self, name: str, timing: tuple[timedelta, timedelta] | None = None
+    ) -> None:
+        """Change a tier's (interval, staleness budget), or restore the default.
+
+        Used when another source keeps a dataset current, e.g. live datapoint
+        pushes, so polling it only has to reconcile.  The tier's last success
+        is kept, so the change applies from the next cycle.
+        """
+        tier = self.tiers[name]
+        tier.interval, tier.max_age = timing or self._configured[name]
+
+    def request(self, *names: str) -> None:
+        """Make tiers due on the next cycle, e.g. after a user action.
+
+        Unlike forgetting the last success, this leaves the staleness budget
+        alone: a failed forced fetch still falls back to the previous value.
+        """
+        for name in names or self.tiers:
+            self.tiers[name].requested = True
+
+    def as_dict(self) -> dict[str, dict]:
+        """Tier state for diagnostics."""
+        now = time.monotonic()
+        return {
+            name: {
+                "interval": str(tier.interval),
+                "max_age": str(tier.max_age),
+                "age_seconds": (
+                    round(now - tier.last_success) if tier.last_success is not None else None
+                ),
+            }
+            for name, tier in self.tiers.items()
+        }
@@ -1,4 +1,5 @@
 import base64
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 import json
 
@@ -54,21 +55,6 @@ _READ_ONLY_TUYA_DPS = {
 # the device page unless somebody deliberately turns them on.
 _DISABLED_BY_DEFAULT_DPS = ("206",)
 
-def _has_ota_module(coordinator, device, module: str) -> bool:
-    """Whether the device's metadata reports an OTA module by this name."""
-    definition = coordinator.data.get("device_definitions", {}).get(device.id)
-    if not isinstance(definition, dict):
-        return False
-    ota_info = definition.get("otaInfo")
-    if not isinstance(ota_info, dict):
-        return False
-    module_map = ota_info.get("otaModuleMap")
-    if not isinstance(module_map, dict):
-        return False
-    entry = module_map.get(module)
-    return isinstance(entry, dict) and bool(entry.get("verSw"))
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -81,7 +67,7 @@ async def async_setup_entry(
     beacons = hass.data[DOMAIN][config_entry.entry_id].get("beacons")
     bridge = hass.data[DOMAIN][config_entry.entry_id].get("bridge")
 
-    event_types = coordinator.data.get("event_types", [])
+    event_types = coordinator.data.event_types
 
     # Convert event_types to strings if they are objects
     event_types_str = []
@@ -98,7 +84,7 @@ async def async_setup_entry(
         # Only offer an MCU version where the hardware reports one; feeders
         # without a separate microcontroller list a wireless module only, and a
         # permanently empty sensor is worse than no sensor.
-        if _has_ota_module(coordinator, device, "mcu"):
+        if coordinator.data.device(device.id).has_ota_module("mcu"):
             sensors.append(PhilipsPetsSeriesFirmwareSensor(coordinator, home, device, "mcu"))
         sensors.append(PhilipsPetsSeriesFirmwareSensor(coordinator, home, device, "wifi"))
         sensors.extend(
@@ -130,7 +116,7 @@ async def async_setup_entry(
             )
 
     # Add Invites Sensor
-    for home in coordinator.data.get("homes", []):
+    for home in coordinator.data.homes:
         sensors.append(PhilipsPetsSeriesInvitesSensor(coordinator, home))
 
     # Add Discovery Sensor
@@ -152,9 +138,7 @@ class PhilipsPetsSeriesFirmwareSensor(PhilipsPetsSeriesEntity, SensorEntity):
 
     def _device_definition(self) -> dict:
         """Tuya device metadata (``thing.m.device.get``) for this device."""
-        definition = self.coordinator.data.get("device_definitions", {}).get(
-            self._device.id
-        )
+        definition = self.device_data.definition
         return definition if isinstance(definition, dict) else {}
 
     def _ota_module(self) -> dict:
@@ -164,24 +148,15 @@ class PhilipsPetsSeriesFirmwareSensor(PhilipsPetsSeriesEntity, SensorEntity):
         "mcu").  Feeders without a separate microcontroller only list "wifi",
         in which case there is genuinely no MCU version to report.
         """
-        ota_info = self._device_definition().get("otaInfo")
-        if not isinstance(ota_info, dict):
-            return {}
-        module_map = ota_info.get("otaModuleMap")
-        if not isinstance(module_map, dict):
-            return {}
-        module = module_map.get(self._component)
+        module = self.device_data.ota_modules.get(self._component)
         return module if isinstance(module, dict) else {}
 
     @property
     def native_value(self):
         ota_type = 9 if self._component == "mcu" else 0
-        records = (
-            self.coordinator.data.get("firmware_info", {}).get(self._device.id, [])
-            + self.coordinator.data.get("product_firmware_info", {}).get(self._device.id, [])
-        )
+        records = self.device_data.ota_records
         if not records:
-            records = self.coordinator.data.get("ota_history", {}).get(self._device.id, [])
+            records = self.device_data.ota_history
         for record in records:
             try:
                 if int(record.get("type", -1)) == ota_type:
@@ -204,7 +179,7 @@ class PhilipsPetsSeriesFirmwareSensor(PhilipsPetsSeriesEntity, SensorEntity):
         value = getattr(self._device, f"{self._component}_version", None)
         if value:
             return value
-        status = self.coordinator.data.get("settings", {}).get(self._device.id, {}).get("tuya_status", {})
+        status = self.device_data.status
         for key in (f"{self._component}Version", f"{self._component}_version", self._component):
             if status.get(key) is not None:
                 return str(status[key])
@@ -213,13 +188,10 @@ class PhilipsPetsSeriesFirmwareSensor(PhilipsPetsSeriesEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         ota_type = 9 if self._component == "mcu" else 0
-        records = (
-            self.coordinator.data.get("firmware_info", {}).get(self._device.id, [])
-            + self.coordinator.data.get("product_firmware_info", {}).get(self._device.id, [])
-        )
+        records = self.device_data.ota_records
         captured = not records
         if not records:
-            records = self.coordinator.data.get("ota_history", {}).get(self._device.id, [])
+            records = self.device_data.ota_history
         for record in records:
             try:
                 if int(record.get("type", -1)) == ota_type:
@@ -250,10 +222,13 @@ class PhilipsPetsSeriesFirmwareSensor(PhilipsPetsSeriesEntity, SensorEntity):
 class PhilipsPetsSeriesRawDpSensor(PhilipsPetsSeriesEntity, SensorEntity):
     """Expose a read-only Tuya datapoint without allowing control."""
 
+    _update_parts = frozenset({"status"})
+
     def __init__(self, coordinator, home, device, dp_id: str, name: str, unit: str | None) -> None:
         super().__init__(coordinator, device, home)
         self._dp_id = dp_id
         self._attr_unique_id = f"{device.id}_tuya_dp_{dp_id}"
+        self._update_dps = frozenset({dp_id})
         self._attr_name = name
         self._attr_native_unit_of_measurement = unit
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
@@ -266,12 +241,7 @@ class PhilipsPetsSeriesRawDpSensor(PhilipsPetsSeriesEntity, SensorEntity):
 
     @property
     def _raw_value(self):
-        value = (
-            self.coordinator.data.get("settings", {})
-            .get(self._device.id, {})
-            .get("tuya_status", {})
-            .get(self._dp_id)
-        )
+        value = self.device_data.status.get(self._dp_id)
         # Several datapoints report an empty string when they hold nothing;
         # that is an absent value, not a state of "".
         if isinstance(value, str) and not value.strip():
@@ -314,6 +284,9 @@ class PhilipsPetsSeriesRawDpSensor(PhilipsPetsSeriesEntity, SensorEntity):
 class PhilipsPetsSeriesCameraOrientationSensor(PhilipsPetsSeriesEntity, SensorEntity):
     """Expose the camera transform reported by Tuya DP 241."""
 
+    _update_parts = frozenset({"status"})
+    _update_dps = frozenset({"241"})
+
     def __init__(self, coordinator, home, device) -> None:
         super().__init__(coordinator, device, home)
         self._attr_unique_id = f"{device.id}_camera_orientation"
@@ -323,12 +296,7 @@ class PhilipsPetsSeriesCameraOrientationSensor(PhilipsPetsSeriesEntity, SensorEn
 
     @property
     def native_value(self):
-        return (
-            self.coordinator.data.get("settings", {})
-            .get(self._device.id, {})
-            .get("tuya_status", {})
-            .get("241")
-        )
+        return self.device_data.status.get("241")
 
     @property
     def available(self) -> bool:
@@ -338,6 +306,9 @@ class PhilipsPetsSeriesCameraOrientationSensor(PhilipsPetsSeriesEntity, SensorEn
 class PhilipsPetsSeriesMotionSnapshotSensor(PhilipsPetsSeriesEntity, SensorEntity):
     """Expose safe metadata from Tuya DP 212 motion-image notifications."""
 
+    _update_parts = frozenset({"status"})
+    _update_dps = frozenset({"212"})
+
     def __init__(self, coordinator, home, device) -> None:
         super().__init__(coordinator, device, home)
         self._attr_unique_id = f"{device.id}_motion_snapshot_metadata"
@@ -347,12 +318,7 @@ class PhilipsPetsSeriesMotionSnapshotSensor(PhilipsPetsSeriesEntity, SensorEntit
 
     @property
     def _metadata(self) -> dict:
-        value = (
-            self.coordinator.data.get("settings", {})
-            .get(self._device.id, {})
-            .get("tuya_status", {})
-            .get("212")
-        )
+        value = self.device_data.status.get("212")
         if not isinstance(value, str) or not value:
             return {}
         try:
@@ -391,6 +357,8 @@ class PhilipsPetsSeriesStreamUrlSensor(PhilipsPetsSeriesEntity, SensorEntity):
     is the usual reason an NVR cannot connect.
     """
 
+    _always_update = True
+
     def __init__(self, coordinator, home, device, bridge) -> None:
         super().__init__(coordinator, device, home)
         self._bridge = bridge
@@ -426,6 +394,8 @@ class PhilipsPetsSeriesLanAddressSensor(PhilipsPetsSeriesEntity, SensorEntity):
     changes without anything being configured.
     """
 
+    _always_update = True
+
     def __init__(self, coordinator, home, device, beacons) -> None:
         super().__init__(coordinator, device, home)
         self._beacons = beacons
@@ -467,6 +437,8 @@ class PhilipsPetsSeriesNextMealSensor(PhilipsPetsSeriesEntity, SensorEntity):
     scheduled.  This sensor always shows the next feeding time instead.
     """
 
+    _always_update = True
+
     def __init__(self, coordinator, home, device) -> None:
         super().__init__(coordinator, device, home)
         self._attr_unique_id = f"{device.id}_next_meal"
@@ -522,6 +494,8 @@ class PhilipsPetsSeriesEventSensor(PhilipsPetsSeriesEntity, RestoreSensor):
     of the query window.
     """
 
+    _update_parts = frozenset({"events"})
+
     def __init__(
         self,
         coordinator: PhilipsPetsSeriesDataUpdateCoordinator,
@@ -533,6 +507,7 @@ class PhilipsPetsSeriesEventSensor(PhilipsPetsSeriesEntity, RestoreSensor):
         super().__init__(coordinator, device, home)
         self._event_type = event_type
         self._attr_unique_id = f"{device.id}_last_{self._event_type}_event"
+        self._update_event_types = frozenset({event_type})
 
         self._attr_name = f"Last {self._event_type.replace('eventtype.', ' ').replace('_', ' ').title()} Event"
 
@@ -549,31 +524,17 @@ class PhilipsPetsSeriesEventSensor(PhilipsPetsSeriesEntity, RestoreSensor):
     def _latest_event(self):
         """Return this device's newest event of this type, if any.
 
-        The coordinator indexes events per home, so events raised by other
-        devices in the same home must be filtered out -- otherwise this sensor
-        reports another feeder's timestamp, name and thumbnail.
+        Only this device's events count -- otherwise this sensor reports
+        another feeder's timestamp, name and thumbnail.
         """
-        key = f"{self._home.id}_{self._event_type}"
-        events = self.coordinator.data.get("events_by_home_and_type", {}).get(key, [])
-        mine = [
-            event
-            for event in events
-            if getattr(event, "device_id", None) is None
-            or str(event.device_id) == str(self._device.id)
-        ]
-        if not mine:
-            return None
-        return max(
-            mine,
-            key=lambda event: dt_util.parse_datetime(event.time) or dt_util.utcnow(),
-        )
+        return self.latest_event(self._event_type)
 
     @property
     def native_value(self):
         latest_event = self._latest_event()
         parsed_time = None
         if latest_event is not None:
-            parsed_time = dt_util.parse_datetime(latest_event.time)
+            parsed_time = latest_event.at
             if parsed_time is None:
                 _LOGGER.warning("Failed to parse event time for %s", self._event_type)
         # Never regress: an event dropping out of the API's history window does
@@ -595,14 +556,13 @@ class PhilipsPetsSeriesEventSensor(PhilipsPetsSeriesEntity, RestoreSensor):
         latest_event = self._latest_event()
         if latest_event is not None:
             _LOGGER.debug(f"Latest event: {latest_event}")
-            parsed_time = dt_util.parse_datetime(latest_event.time)
             attributes["source"] = latest_event.source
             attributes["event_id"] = latest_event.id
             attributes["original_time"] = (
                 latest_event.time
             )
-            if parsed_time:
-                attributes["timestamp"] = parsed_time.timestamp()
+            if latest_event.at is not None:
+                attributes["timestamp"] = latest_event.at.timestamp()
             if latest_event.type == "motion_detected":
                 attributes.update(
                     {
@@ -679,13 +639,13 @@ class PhilipsPetsSeriesInvitesSensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self):
         """Return the number of invites."""
-        invites = self.coordinator.data.get("invites", {}).get(self.home.id, [])
+        invites = self.coordinator.data.invites.get(self.home.id, ())
         return len(invites)
 
     @property
     def extra_state_attributes(self):
         """Return extra attributes."""
-        invites = self.coordinator.data.get("invites", {}).get(self.home.id, [])
+        invites = self.coordinator.data.invites.get(self.home.id, ())
         return {
             "invites": [
                 {
@@ -713,6 +673,8 @@ class PhilipsPetsSeriesTuyaStatusSensor(PhilipsPetsSeriesEntity, SensorEntity):
     ``tuya_cloud_connected`` binary sensor; this entity exists for the payload.
     """
 
+    _update_parts = frozenset({"status"})
+
     def __init__(
         self,
         coordinator: PhilipsPetsSeriesDataUpdateCoordinator,
@@ -740,17 +702,13 @@ class PhilipsPetsSeriesTuyaStatusSensor(PhilipsPetsSeriesEntity, SensorEntity):
 
     @property
     def _status(self):
-        return (
-            self.coordinator.data.get("settings", {})
-            .get(self.device.id, {})
-            .get("tuya_status", {})
-        )
+        return self.device_data.status
 
     @property
     def extra_state_attributes(self):
         """Return cloud DPs without credential material."""
         status = self._status
-        if not isinstance(status, dict):
+        if not isinstance(status, Mapping):
             return {}
         return {
             "raw_dps": {key: value for key, value in status.items() if str(key).isdigit()},
@@ -787,7 +745,7 @@ class PhilipsPetsSeriesDiscoverySensor(CoordinatorEntity, SensorEntity):
     @property
     def state(self):
         """Return the current android version as a proxy for API version."""
-        config = self.coordinator.data.get("base_data", {}).get("discovery_config")
+        config = self.coordinator.data.discovery_config
         if config and config.android_release:
             # Report unknown rather than a literal "Unknown"/"" so templates can
             # test the state properly.
@@ -797,7 +755,7 @@ class PhilipsPetsSeriesDiscoverySensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self):
         """Return extra attributes."""
-        config = self.coordinator.data.get("base_data", {}).get("discovery_config")
+        config = self.coordinator.data.discovery_config
         if config:
             return {
                 "api_url": config.api_url,
@@ -0,0 +1,243 @@
+"""Immutable view of one coordinator refresh.
+
+Entities used to navigate a nested dict of dicts on every state read
+(``data.get("settings", {}).get(device.id, {}).get("tuya_status", {})``), and
+each refresh built several parallel per-device dicts that all had to be kept in
+step.  A refresh now produces one ``Snapshot``: a ``DeviceSnapshot`` per device
+holding everything fetched for it, reached by a single lookup and plain
+attribute access.
+
+Snapshots are never modified once built; the next refresh builds a new one.
+Comparing consecutive snapshots (``Snapshot.changes``) tells which devices,
+and which of their datapoints, actually changed, so entities whose inputs did
+not change can skip their state write.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields, replace
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from .datapoints import EMPTY_STATUS, SCHEMA as DATAPOINT_SCHEMA, DeviceStatus
+from .event_history import EventIndex
+
+_EMPTY: Mapping = MappingProxyType({})
+_MISSING = object()
+
+
+def _as_status(status) -> DeviceStatus:
+    """A status as a ``DeviceStatus``, decoding any payload still raw."""
+    if isinstance(status, DeviceStatus):
+        return status
+    try:
+        return DATAPOINT_SCHEMA.decode(status)
+    except ValueError:
+        return EMPTY_STATUS
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceSnapshot:
+    """Everything one refresh knows about one device.
+
+    ``status`` is the Tuya datapoint status decoded against the DP schema,
+    empty when no status is known; ``settings`` the Philips settings.  Absent cloud
+    data is None or empty, never a made-up default.
+    """
+
+    home: Any
+    device: Any
+    # DeviceStatus is an unhashable Mapping, which dataclasses reject as a
+    # plain default.
+    status: DeviceStatus = field(default_factory=lambda: EMPTY_STATUS)
+    settings: Mapping = _EMPTY
+    full_settings: Any = None
+    definition: Mapping | None = None
+    firmware_info: tuple = ()
+    product_firmware_info: tuple = ()
+    ota_history: tuple = ()
+    meals: tuple = ()
+
+    @property
+    def ota_records(self) -> tuple:
+        """OTA records offered this refresh, cloud first then product."""
+        return self.firmware_info + self.product_firmware_info
+
+    @property
+    def ota_modules(self) -> Mapping:
+        """``otaInfo.otaModuleMap`` from the device definition, keyed by module."""
+        definition = self.definition
+        if not isinstance(definition, Mapping):
+            return _EMPTY
+        ota_info = definition.get("otaInfo")
+        if not isinstance(ota_info, Mapping):
+            return _EMPTY
+        module_map = ota_info.get("otaModuleMap")
+        return module_map if isinstance(module_map, Mapping) else _EMPTY
+
+    def has_ota_module(self, module: str) -> bool:
+        """Whether the device's metadata reports an OTA module by this name."""
+        entry = self.ota_modules.get(module)
+        return isinstance(entry, Mapping) and bool(entry.get("verSw"))
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceChange:
+    """What differs for one device between two snapshots.
+
+    ``parts`` names the changed ``DeviceSnapshot`` fields, plus "events" when
+    any of the device's events changed; ``dps`` the status keys whose value
+    changed; ``event_types`` the event types whose events changed.
+    """
+
+    parts: frozenset[str] = frozenset()
+    dps: frozenset[str] = frozenset()
+    event_types: frozenset[str] = frozenset()
+
+
+@dataclass(frozen=True, slots=True)
+class SnapshotChanges:
+    """Per-device changes between two snapshots.
+
+    ``everything`` is set when there is nothing to compare against, or when
+    something outside any one device changed (homes, the device list, the
+    event types); every entity should then update.
+    """
+
+    everything: bool = False
+    devices: Mapping[str, DeviceChange] = _EMPTY
+
+    def device(self, device_id) -> DeviceChange | None:
+        return self.devices.get(device_id)
+
+
+ALL_CHANGED = SnapshotChanges(everything=True)
+NOTHING_CHANGED = SnapshotChanges()
+
+_DEVICE_FIELDS = tuple(
+    field.name for field in fields(DeviceSnapshot) if field.name != "status"
+)
+
+
+def _status_changes(old: Mapping, new: Mapping) -> frozenset[str]:
+    if old is new:
+        return frozenset()
+    return frozenset(
+        str(key)
+        for key in old.keys() | new.keys()
+        if old.get(key, _MISSING) != new.get(key, _MISSING)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """One refresh: homes, their devices, and per-device and per-home data."""
+
+    homes: tuple = ()
+    home_devices: Mapping[str, tuple] = _EMPTY
+    devices: tuple = ()
+    by_device: Mapping[str, DeviceSnapshot] = _EMPTY
+    meals: tuple = ()
+    invites: Mapping[str, tuple] = _EMPTY
+    events: EventIndex = field(default_factory=EventIndex)
+    event_types: tuple = ()
+    local_status: Any = None
+    discovery_config: Any = None
+
+    def device(self, device_id) -> DeviceSnapshot | None:
+        return self.by_device.get(device_id)
+
+    def with_status(self, device_id, status: DeviceStatus) -> Snapshot:
+        """This snapshot with one device's status replaced, e.g. by a push."""
+        by_device = dict(self.by_device)
+        by_device[device_id] = replace(by_device[device_id], status=status)
+        return replace(self, by_device=MappingProxyType(by_device))
+
+    def changes(self, previous: Snapshot | None) -> SnapshotChanges:
+        """What changed since ``previous``, device by device."""
+        if (
+            previous is None
+            or previous.homes != self.homes
+            or previous.by_device.keys() != self.by_device.keys()
+            or previous.event_types != self.event_types
+        ):
+            return ALL_CHANGED
+        event_changes = self.events.changes(previous.events)
+        devices = {}
+        for device_id, current in self.by_device.items():
+            before = previous.by_device[device_id]
+            parts = {
+                name
+                for name in _DEVICE_FIELDS
+                if getattr(current, name) is not getattr(before, name)
+                and getattr(current, name) != getattr(before, name)
+            }
+            dps = _status_changes(before.status, current.status)
+            if dps:
+                parts.add("status")
+            event_types = event_changes.get(str(device_id), set())
+            if event_types:
+                parts.add("events")
+            if parts:
+                devices[device_id] = DeviceChange(
+                    frozenset(parts), dps, frozenset(event_types)
+                )
+        return SnapshotChanges(devices=MappingProxyType(devices))
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        homes,
+        home_devices: dict,
+        device_data: dict[str, dict],
+        meals,
+        invites: dict,
+        events: EventIndex,
+        event_types,
+        local_status,
+        discovery_config,
+    ) -> Snapshot:
+        """Assemble a snapshot; ``device_data`` holds DeviceSnapshot fields by id."""
+        meals = tuple(meals)
+        meals_by_device: dict[str, list] = {}
+        for meal in meals:
+            meals_by_device.setdefault(str(getattr(meal, "device_id", "")), []).append(meal)
+        homes_by_id = {home.id: home for home in homes}
+        devices = []
+        by_device = {}
+        for home_id, home_device_list in home_devices.items():
+            for device in home_device_list:
+                devices.append(device)
+                data = device_data.get(device.id, {})
+                by_device[device.id] = DeviceSnapshot(
+                    home=homes_by_id.get(home_id),
+                    device=device,
+                    status=_as_status(data.get("status")),
+                    settings=data.get("settings") or _EMPTY,
+                    full_settings=data.get("full_settings"),
+                    definition=data.get("definition"),
+                    firmware_info=tuple(data.get("firmware_info") or ()),
+                    product_firmware_info=tuple(data.get("product_firmware_info") or ()),
+                    ota_history=tuple(data.get("ota_history") or ()),
+                    meals=tuple(meals_by_device.get(str(device.id), ())),
+                )
+        return cls(
+            homes=tuple(homes),
+            home_devices=MappingProxyType(
+                {home_id: tuple(device_list) for home_id, device_list in home_devices.items()}
+            ),
+            devices=tuple(devices),
+            by_device=MappingProxyType(by_device),
+            meals=meals,
+            invites=MappingProxyType(
+                {home_id: tuple(home_invites) for home_id, home_invites in invites.items()}
+            ),
+            events=events,
+            event_types=tuple(event_types),
+            local_status=local_status,
+            discovery_config=discovery_config,
+        )
+
+
+EMPTY_SNAPSHOT = Snapshot()
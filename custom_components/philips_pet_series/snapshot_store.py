@@ -0,0 +1,142 @@
+"""The last refresh's data, kept so a restart can set entities up at once.
+
+Setting an entry up used to wait for a first refresh of every home, device
+and dataset before a single entity existed, so Home Assistant's startup waited
+on the cloud.  After each refresh the datasets that make up a snapshot are
+saved here in compact form -- homes, devices, DP status, settings, OTA
+metadata and meals, as plain JSON.  Definitions and events are already kept by
+``DefinitionCache`` and ``EventHistory`` and are not duplicated.  On the next
+start the coordinator rebuilds its data from them and refreshes in the
+background.
+
+Only what can be restored faithfully is kept: the Philips full device settings
+and the discovery config are left out, and read as absent until the first
+refresh fetches them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import asdict, fields
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from petsseries.models import Device, Home, Meal
+
+from .const import DOMAIN
+from .datapoints import SCHEMA as DATAPOINT_SCHEMA, DeviceStatus
+from .schedule import TIER_FIRMWARE, TIER_INVENTORY, TIER_MEALS, TIER_SETTINGS, TIER_STATUS
+
+_LOGGER = logging.getLogger(__name__)
+
+_SAVE_DELAY = 30
+
+# The tiers a stored snapshot restores.
+RESTORED_TIERS = (TIER_INVENTORY, TIER_STATUS, TIER_SETTINGS, TIER_FIRMWARE, TIER_MEALS)
+
+
+def storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.snapshot.{entry_id}"
+
+
+def _model(cls, data: dict):
+    # Ignore fields a newer or older petsseries does not have.
+    names = {field.name for field in fields(cls)}
+    return cls(**{key: value for key, value in data.items() if key in names})
+
+
+def dump_datasets(datasets: dict[str, dict]) -> dict[str, Any]:
+    """The restorable part of the coordinator's datasets, as JSON."""
+    inventory = datasets[TIER_INVENTORY]
+    return {
+        "saved": dt_util.utcnow().isoformat(),
+        "homes": [asdict(home) for home in inventory.get("homes", ())],
+        "devices": {
+            key[1]: [asdict(device) for device in devices]
+            for key, devices in inventory.items()
+            if key != "homes"
+        },
+        "status": {
+            device_id: status.as_payload()
+            for device_id, status in datasets[TIER_STATUS].items()
+            if isinstance(status, DeviceStatus)
+        },
+        "settings": {
+            key[1]: settings
+            for key, settings in datasets[TIER_SETTINGS].items()
+            if key[0] == "settings" and isinstance(settings, dict)
+        },
+        "firmware": {
+            device_id: [list(records[0]), list(records[1])]
+            for device_id, records in datasets[TIER_FIRMWARE].items()
+        },
+        "meals": {
+            home_id: [asdict(meal) for meal in meals]
+            for home_id, meals in datasets[TIER_MEALS].items()
+        },
+    }
+
+
+def restore_datasets(stored: dict[str, Any], datasets: dict[str, dict]) -> float:
+    """Fill the datasets from a stored snapshot; returns its age in seconds.
+
+    Raises KeyError, TypeError or ValueError if the stored data is malformed,
+    in which case nothing is restored.
+    """
+    saved = dt_util.parse_datetime(stored["saved"])
+    if saved is None:
+        raise ValueError("snapshot has no save time")
+    homes = [_model(Home, home) for home in stored["homes"]]
+    devices = {
+        home_id: [_model(Device, device) for device in home_devices]
+        for home_id, home_devices in stored["devices"].items()
+    }
+    product_ctns = {
+        device.id: device.product_ctn
+        for home_devices in devices.values()
+        for device in home_devices
+    }
+    restored = {
+        TIER_INVENTORY: {
+            "homes": homes,
+            **{("devices", home_id): home_devices for home_id, home_devices in devices.items()},
+        },
+        TIER_STATUS: {
+            device_id: DATAPOINT_SCHEMA.decode(payload, product_ctns.get(device_id))
+            for device_id, payload in stored["status"].items()
+        },
+        TIER_SETTINGS: {
+            ("settings", device_id): settings
+            for device_id, settings in stored["settings"].items()
+        },
+        TIER_FIRMWARE: {
+            device_id: (list(records[0]), list(records[1]))
+            for device_id, records in stored["firmware"].items()
+        },
+        TIER_MEALS: {
+            home_id: [_model(Meal, meal) for meal in meals]
+            for home_id, meals in stored["meals"].items()
+        },
+    }
+    for tier, values in restored.items():
+        datasets[tier].update(values)
+    return max(0.0, (dt_util.utcnow() - saved).total_seconds())
+
+
+class SnapshotStore:
+    """One config entry's stored snapshot."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._store = Store(hass, 1, storage_key(entry_id))
+
+    async def async_load(self) -> dict[str, Any] | None:
+        stored = await self._store.async_load()
+        return stored if isinstance(stored, dict) else None
+
+    @callback
+    def async_save(self, data: Callable[[], dict[str, Any]]) -> None:
+        """Save soon; consecutive refreshes within the delay write once."""
+        self._store.async_delay_save(data, _SAVE_DELAY)
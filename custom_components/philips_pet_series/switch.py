@@ -12,7 +12,7 @@ from petsseries.api import PetsSeriesClient
 
 from . import DOMAIN, PhilipsPetsSeriesDataUpdateCoordinator
 from .entity import PhilipsPetsSeriesEntity, iter_home_devices
-from .datapoints import datapoints
+from .datapoints import SCHEMA as DATAPOINT_SCHEMA, DeviceStatus, datapoints
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +24,7 @@ async def async_setup_entry(
     """Set up the Philips Pets Series switches."""
     coordinator: PhilipsPetsSeriesDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     client: PetsSeriesClient = hass.data[DOMAIN][config_entry.entry_id]["client"]
+    commands = hass.data[DOMAIN][config_entry.entry_id]["commands"]
     _attr_entity_registry_enabled_default = True  # Add this line
 
     switches = []
@@ -33,9 +34,6 @@ async def async_setup_entry(
         return
 
     for home, device in iter_home_devices(coordinator):
-            device_id = device.id
-            device_settings = coordinator.data["settings"].get(device_id, {})
-
             # Iterate through all datapoints
             for dp_id, dp_info in datapoints.items():
                 dp_code = dp_info["dpCode"]
@@ -44,7 +42,7 @@ async def async_setup_entry(
 
                 if dp_type == "Boolean":
                     switches.append(PhilipsPetsSeriesSwitch(
-                        coordinator, client, home, device, str(dp_id), dp_code, dp_path
+                        coordinator, client, commands, home, device, str(dp_id), dp_code, dp_path
                     ))
 
     async_add_entities(switches)
@@ -52,12 +50,17 @@ async def async_setup_entry(
 class PhilipsPetsSeriesSwitch(PhilipsPetsSeriesEntity, SwitchEntity):
     """Representation of a Philips Pets Series switch."""
 
-    def __init__(self, coordinator, client, home, device, dp_id, dp_code, dp_path):
+    _update_parts = frozenset({"status", "settings"})
+
+    def __init__(self, coordinator, client, commands, home, device, dp_id, dp_code, dp_path):
         """Initialize the switch."""
         super().__init__(coordinator, device, home)
         self._client = client
+        self._commands = commands
         self._dp_id = dp_id
         self._dp_code = dp_code
+        self._update_dps = frozenset({str(dp_id), dp_code})
+        self._dp_slot = DATAPOINT_SCHEMA.slot(dp_id)
         self._dp_path = dp_path
         self._attr_unique_id = f"{device.id}_switch_{dp_code}"
         # Home Assistant already prefixes the device name, so repeating it
@@ -70,22 +73,22 @@ class PhilipsPetsSeriesSwitch(PhilipsPetsSeriesEntity, SwitchEntity):
     def _dp_lookup(self, settings):
         """Return the datapoint value, or ``_MISSING`` when absent.
 
-        The cloud status is keyed by numeric datapoint id and only gains the
-        readable dpCode aliases when the alias pass runs, so a lookup by code
-        alone reports the entity unavailable whenever the fallback status dict
-        is in use.  Accept either key.
+        A decoded Tuya status is read straight from the datapoint's schema
+        slot; the Philips settings are a plain mapping keyed by dpCode or id.
         """
-        for key in (self._dp_code, self._dp_id, str(self._dp_id)):
+        if isinstance(settings, DeviceStatus) and self._dp_slot is not None:
+            return settings.at(self._dp_slot, self._MISSING)
+        for key in (self._dp_code, str(self._dp_id)):
             if key in settings:
                 return settings[key]
         return self._MISSING
 
     def _get_settings(self):
-        """Retrieve the correct settings dictionary based on dp_path."""
-        device_settings = self.coordinator.data["settings"].get(self._device.id, {})
+        """Retrieve the correct settings mapping based on dp_path."""
+        device_data = self.device_data
         if self._dp_path == "tuya_status":
-            return device_settings.get("tuya_status", {})
-        return device_settings
+            return device_data.status
+        return device_data.settings
 
     @property
     def is_on(self) -> bool | None:
@@ -118,21 +121,13 @@ class PhilipsPetsSeriesSwitch(PhilipsPetsSeriesEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the switch on."""
         try:
-            await self._client.publish_cloud_dps(
-                self.coordinator.tuya_device_id(self._device),
-                {self._dp_id: True},
-            )
-            await self.coordinator.async_request_refresh()
+            await self._commands.async_publish(self._device, {self._dp_id: True})
         except Exception as e:
             raise HomeAssistantError(f"Failed to turn on {self._attr_name}: {e}") from e
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
         try:
-            await self._client.publish_cloud_dps(
-                self.coordinator.tuya_device_id(self._device),
-                {self._dp_id: False},
-            )
-            await self.coordinator.async_request_refresh()
+            await self._commands.async_publish(self._device, {self._dp_id: False})
         except Exception as e:
             raise HomeAssistantError(f"Failed to turn off {self._attr_name}: {e}") from e
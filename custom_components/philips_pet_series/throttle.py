@@ -0,0 +1,66 @@
+"""Bounded concurrency and rate limiting for cloud fetches.
+
+A refresh touches the Philips cloud once per home, per device and per dataset,
+so issuing those calls one after another makes a refresh as slow as the sum of
+every round trip.  Running them all at once instead would hammer an API that
+already rate-limits aggressively.  The budget here sits between the two: at most
+``concurrency`` requests in flight, started no faster than the token bucket
+allows, so a refresh takes roughly as long as its slowest call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens per second, holding up to ``burst``."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it.
+
+        The lock makes waiters queue in arrival order, so a burst of callers is
+        released at the configured rate rather than all retrying at once.
+        """
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class FetchBudget:
+    """A concurrency cap and a rate limit shared by every request in a refresh."""
+
+    def __init__(self, concurrency: int, rate: float, burst: int) -> None:
+        self.concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._bucket = TokenBucket(rate, burst)
+
+    async def __aenter__(self) -> FetchBudget:
+        await self._semaphore.acquire()
+        try:
+            await self._bucket.acquire()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
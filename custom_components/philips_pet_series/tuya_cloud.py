@@ -0,0 +1,286 @@
+"""Batch the coordinator's per-device Tuya cloud reads.
+
+Definitions, DP status and OTA metadata are read per device, and every such
+read through ``PetsSeriesClient`` is its own signed round trip, made one at a
+time behind the client's Tuya session lock.  A refresh asks for all of them at
+once, so reads issued within ``BATCH_WINDOW`` of each other are collected here
+and sent together with :meth:`TuyaMobileClient.call_many`: prepared in one
+pass, then posted concurrently.  DP status for several devices is read from
+the homes' device lists instead, one request per home rather than per device.
+
+The coordinator and the camera bridge both read through here, so identical
+reads -- same action, same arguments -- share one request: a caller asking
+for what is already queued or in flight awaits that request instead of
+sending its own, and slow-changing data (definitions, OTA metadata) is then
+served for ``_CACHE_TTL`` seconds.  A DP status read only joins one that has
+not been sent yet, since one already on the wire may predate a write the
+caller needs to see.
+
+Results are shaped as the matching ``PetsSeriesClient`` getters shape them,
+and the session rules are the same: log in when there is no session, re-log
+in once when a whole batch fails, and never when Tuya reports a rate limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from petsseries import PetsSeriesClient
+from tuya_mobile import status_dps
+
+from .throttle import FetchBudget
+
+_LOGGER = logging.getLogger(__name__)
+
+# How long a read waits for the rest of a refresh's reads to join it.
+BATCH_WINDOW = 0.05
+
+_STATUS_ACTION = "s.m.dev.dp.get"
+
+# Seconds a result is reused for, by action; others are shared in flight only.
+_CACHE_TTL = {
+    "thing.m.device.get": 60,
+    "thing.m.device.upgrade.info": 300,
+    "s.m.upgrade.info": 300,
+}
+
+
+def _definition(response: dict) -> dict:
+    result = response.get("result")
+    return result if isinstance(result, dict) else response
+
+
+def _upgrades(response: dict) -> list[dict]:
+    value = response.get("result", response)
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    if isinstance(value, dict):
+        for key in ("list", "data", "upgradeInfo"):
+            if isinstance(value.get(key), list):
+                return [item for item in value[key] if isinstance(item, dict)]
+    return []
+
+
+def release_signer(mobile: Any) -> None:
+    """Stop the external signer worker of a mobile session being dropped.
+
+    The in-process signer has nothing to stop.
+    """
+    close = getattr(getattr(mobile, "signer", None), "close", None)
+    if close is not None:
+        close()
+
+
+@dataclass(slots=True)
+class _Read:
+    """One queued read and the caller waiting for it."""
+
+    action: str
+    payload: dict[str, Any]
+    version: str
+    parse: Callable[[dict], Any]
+    future: asyncio.Future
+    key: tuple
+
+
+class TuyaCloudReader:
+    """Coalesce per-device cloud reads into batched mobile API calls."""
+
+    def __init__(
+        self, hass: HomeAssistant, client: PetsSeriesClient, budget: FetchBudget
+    ) -> None:
+        self.hass = hass
+        self._client = client
+        self._budget = budget
+        self._pending: list[_Read] = []
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._cache: dict[tuple, tuple[float, Any]] = {}
+
+    async def device_definition(self, tuya_id: str) -> dict:
+        """The device's metadata and DP schema, as ``get_cloud_device_definition``."""
+        return await self._read("thing.m.device.get", {"devId": tuya_id}, "1.0", _definition, {})
+
+    async def device_status(self, tuya_id: str) -> dict:
+        """The device's DPs, as ``get_cloud_device_status``."""
+        return await self._read(
+            _STATUS_ACTION, {"devId": tuya_id, "gwId": tuya_id}, "1.0", status_dps, {}
+        )
+
+    async def device_webrtc_config(self, tuya_id: str) -> dict:
+        """A camera's WebRTC signalling config, as ``get_cloud_webrtc_config``.
+
+        The config carries rotating credentials, so it is never cached; only
+        concurrent requests share one read.
+        """
+        return await self._read(
+            "thing.m.ipc.rtc.config.get", {"devId": tuya_id}, "1.0", _definition, {}
+        )
+
+    async def firmware_info(self, tuya_id: str) -> list[dict]:
+        """Device OTA metadata, as ``get_cloud_firmware_info``."""
+        return await self._read(
+            "thing.m.device.upgrade.info", {"devId": tuya_id}, "1.2", _upgrades, []
+        )
+
+    async def product_firmware_info(self, product_key: str, tuya_id: str) -> list[dict]:
+        """Product OTA metadata, as ``get_product_firmware_info``."""
+        if not product_key:
+            return []
+        return await self._read(
+            "s.m.upgrade.info",
+            {"productKey": product_key, "devId": tuya_id},
+            "2.0",
+            _upgrades,
+            [],
+        )
+
+    async def local_keys(self, refresh: bool = False) -> list[dict]:
+        """Every device's LAN credentials, as ``TuyaMobileClient.get_local_keys``."""
+        if not self._client.auth.id_token:
+            return []
+        async with self._budget:
+            mobile = await self._session()
+            return await mobile.get_local_keys([], refresh=refresh)
+
+    @callback
+    def forget(self, tuya_id: str) -> None:
+        """Drop every cached result for one device."""
+        for key in [key for key in self._cache if ("devId", tuya_id) in key[2]]:
+            del self._cache[key]
+
+    async def _read(self, action, payload, version, parse, empty):
+        if not self._client.auth.id_token:
+            return empty
+        key = (action, version, tuple(sorted(payload.items())))
+        cached = self._cache.get(key)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                return cached[1]
+            del self._cache[key]
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_later(BATCH_WINDOW, self._flush)
+            read = _Read(action, payload, version, parse, loop.create_future(), key)
+            self._pending.append(read)
+            future = self._in_flight[key] = read.future
+            future.add_done_callback(partial(self._async_done, key))
+        # One caller giving up must not cancel the read for the others.
+        return await asyncio.shield(future)
+
+    @callback
+    def _async_done(self, key: tuple, future: asyncio.Future) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if future.cancelled() or future.exception() is not None:
+            return
+        ttl = _CACHE_TTL.get(key[0])
+        if ttl:
+            self._cache[key] = (time.monotonic() + ttl, future.result())
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        for read in batch:
+            if read.action == _STATUS_ACTION and self._in_flight.get(read.key) is read.future:
+                del self._in_flight[read.key]
+        if batch:
+            self.hass.async_create_task(self._async_send(batch))
+
+    async def _async_send(self, batch: list[_Read]) -> None:
+        try:
+            try:
+                results = await self._async_read(batch)
+            except Exception as err:
+                results = [err] * len(batch)
+            for read, result in zip(batch, results):
+                if read.future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    read.future.set_exception(result)
+                else:
+                    read.future.set_result(result)
+        finally:
+            # A cancelled batch (e.g. on shutdown) must not leave its callers
+            # waiting forever.
+            for read in batch:
+                if not read.future.done():
+                    read.future.cancel()
+
+    async def _async_read(self, batch: list[_Read]) -> list[Any]:
+        async with self._budget:
+            mobile = await self._session()
+            results = await self._async_call(mobile, batch)
+            errors = [result for result in results if isinstance(result, Exception)]
+            if len(errors) == len(results) and not any(
+                "LIMIT" in str(error).upper() for error in errors
+            ):
+                # Likely an expired session: re-login once and retry.
+                _LOGGER.debug(
+                    "Tuya batch of %d reads failed (%s); re-logging in once",
+                    len(batch),
+                    errors[0],
+                )
+                mobile = await self._session(stale=mobile)
+                results = await self._async_call(mobile, batch)
+        return results
+
+    async def _session(self, stale: Any = None) -> Any:
+        """The client's logged-in mobile session, replacing ``stale`` if given.
+
+        Shares the client's lock and session with its own Tuya calls, so the
+        account never logs in twice for one expiry.
+        """
+        client = self._client
+        async with client._tuya_lock:
+            if client._tuya_mobile is None:
+                await client._tuya_login()
+            elif stale is not None and client._tuya_mobile is stale:
+                await client._tuya_login(force=True)
+                release_signer(stale)
+            return client._tuya_mobile
+
+    async def _async_call(self, mobile: Any, batch: list[_Read]) -> list[Any]:
+        """One parsed result or exception per read, in order."""
+        results: list[Any] = [None] * len(batch)
+        statuses = [index for index, read in enumerate(batch) if read.action == _STATUS_ACTION]
+        if len(statuses) < 2:
+            statuses = []
+        calls = [index for index in range(len(batch)) if index not in statuses]
+
+        async def read_statuses() -> None:
+            if not statuses:
+                return
+            dps = await mobile.get_devices_dps(
+                batch[index].payload["devId"] for index in statuses
+            )
+            for index in statuses:
+                # Each device maps to its DPs or to the exception its read
+                # raised; a device missing from the answer failed too.
+                results[index] = dps.get(
+                    str(batch[index].payload["devId"]),
+                    RuntimeError("Tuya status missing from the batch answer"),
+                )
+
+        async def read_calls() -> None:
+            responses = await mobile.call_many(
+                [(batch[index].action, batch[index].payload, batch[index].version) for index in calls]
+            )
+            for index, response in zip(calls, responses):
+                if isinstance(response, BaseException):
+                    results[index] = response
+                    continue
+                try:
+                    results[index] = batch[index].parse(response)
+                except Exception as err:  # noqa: BLE001 - fail only this read
+                    results[index] = err
+
+        await asyncio.gather(read_statuses(), read_calls())
+        return results
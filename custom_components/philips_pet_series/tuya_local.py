@@ -0,0 +1,493 @@
+"""Native asyncio client for the Tuya LAN protocol (3.3, 3.4 and 3.5).
+
+The feeders listen on TCP 6668 for the same commands the app sends through the
+cloud.  Talking to them directly takes a datapoint read or write from the
+cloud's round trip (seconds, and gone with the internet) to a few milliseconds.
+The previous local path was TinyTuya's blocking client run in a thread, and
+only for an address configured by hand.
+
+Sessions are opened from what ``BeaconListener`` learns: a feeder's beacon gives
+its current address and protocol version, and the coordinator's key inventory
+gives the ``localKey``.  Each session stays connected with a
+heartbeat, feeds status reports into the coordinator, and is dropped when the
+device stops announcing itself.
+
+Framing, per version:
+
+* 3.3: ``0x55AA`` frames, AES-ECB with the localKey, CRC32 trailer.
+* 3.4: ``0x55AA`` frames, AES-ECB with a negotiated session key, HMAC-SHA256
+  trailer.
+* 3.5: ``0x6699`` frames, AES-GCM with a negotiated session key, the frame
+  header as associated data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import hashlib
+import hmac
+import json
+import logging
+import os
+import struct
+import time
+from typing import Any
+import zlib
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from homeassistant.core import HomeAssistant, callback
+
+from .lanbeacon import Beacon, BeaconListener
+
+_LOGGER = logging.getLogger(__name__)
+
+LAN_PORT = 6668
+SUPPORTED_VERSIONS = ("3.3", "3.4", "3.5")
+
+_HEARTBEAT_INTERVAL = 10
+# Devices drop a session that has been silent for about 30 seconds.
+_READ_TIMEOUT = 30
+_REPLY_TIMEOUT = 5
+_BACKOFF_START = 2
+_BACKOFF_MAX = 60
+
+_PREFIX_55AA = 0x000055AA
+_SUFFIX_55AA = 0x0000AA55
+_PREFIX_6699 = 0x00006699
+_SUFFIX_6699 = 0x00009966
+
+SESS_KEY_NEG_START = 3
+SESS_KEY_NEG_RESP = 4
+SESS_KEY_NEG_FINISH = 5
+CONTROL = 7
+STATUS = 8
+HEART_BEAT = 9
+DP_QUERY = 10
+CONTROL_NEW = 13
+DP_QUERY_NEW = 16
+
+# Commands whose payload is sent without the "3.x" version header.
+_NO_VERSION_HEADER = frozenset(
+    {DP_QUERY, DP_QUERY_NEW, HEART_BEAT, SESS_KEY_NEG_START, SESS_KEY_NEG_RESP, SESS_KEY_NEG_FINISH}
+)
+
+
+class TuyaLocalError(Exception):
+    """The device refused us, or a frame could not be read."""
+
+
+class TuyaLocalNotSent(TuyaLocalError):
+    """A command was never put on the wire, so the device cannot have seen it."""
+
+
+class TuyaLocalKeyRejected(TuyaLocalError):
+    """The device does not hold the localKey we have for it."""
+
+
+def _pad(data: bytes) -> bytes:
+    length = 16 - len(data) % 16
+    return data + bytes([length]) * length
+
+
+def _unpad(data: bytes) -> bytes:
+    if data and 0 < data[-1] <= 16:
+        return data[: -data[-1]]
+    return data
+
+
+def _ecb(key: bytes, data: bytes, encrypt: bool) -> bytes:
+    cipher = Cipher(algorithms.AES(key), modes.ECB())
+    context = cipher.encryptor() if encrypt else cipher.decryptor()
+    return context.update(data) + context.finalize()
+
+
+class TuyaCodec:
+    """Packs and unpacks frames for one protocol version and key."""
+
+    def __init__(self, version: str, local_key: str) -> None:
+        if version not in SUPPORTED_VERSIONS:
+            raise TuyaLocalError(f"unsupported protocol version {version}")
+        self.version = version
+        self.local_key = local_key.encode()
+        self.key = self.local_key
+        self._seq = 0
+
+    @property
+    def negotiates(self) -> bool:
+        return self.version != "3.3"
+
+    def _header_prefix(self, cmd: int) -> bytes:
+        if cmd in _NO_VERSION_HEADER:
+            return b""
+        return self.version.encode() + b"\0" * 12
+
+    def pack(self, cmd: int, payload: bytes) -> bytes:
+        self._seq += 1
+        if self.version == "3.5":
+            plain = self._header_prefix(cmd) + payload
+            nonce = os.urandom(12)
+            length = 12 + len(plain) + 16
+            header = struct.pack(">IHIII", _PREFIX_6699, 0, self._seq, cmd, length)
+            sealed = AESGCM(self.key).encrypt(nonce, plain, header[4:])
+            return header + nonce + sealed + struct.pack(">I", _SUFFIX_6699)
+        if self.version == "3.4":
+            body = _ecb(self.key, _pad(self._header_prefix(cmd) + payload), True)
+            header = struct.pack(">4I", _PREFIX_55AA, self._seq, cmd, len(body) + 36)
+            digest = hmac.new(self.key, header + body, hashlib.sha256).digest()
+            return header + body + digest + struct.pack(">I", _SUFFIX_55AA)
+        body = self._header_prefix(cmd) + _ecb(self.key, _pad(payload), True)
+        header = struct.pack(">4I", _PREFIX_55AA, self._seq, cmd, len(body) + 8)
+        crc = zlib.crc32(header + body) & 0xFFFFFFFF
+        return header + body + struct.pack(">II", crc, _SUFFIX_55AA)
+
+    async def read(self, reader: asyncio.StreamReader) -> tuple[int, bytes]:
+        """Read one frame and return ``(cmd, decrypted payload)``."""
+        if self.version == "3.5":
+            header = await reader.readexactly(18)
+            prefix, _unused, _seq, cmd, length = struct.unpack(">IHIII", header)
+            if prefix != _PREFIX_6699:
+                raise TuyaLocalError("bad frame prefix")
+            body = await reader.readexactly(length + 4)
+            try:
+                plain = AESGCM(self.key).decrypt(body[:12], body[12:length], header[4:])
+            except Exception as err:
+                raise TuyaLocalError("frame failed authentication") from err
+            return cmd, self._strip(plain)
+        header = await reader.readexactly(16)
+        prefix, _seq, cmd, length = struct.unpack(">4I", header)
+        if prefix != _PREFIX_55AA:
+            raise TuyaLocalError("bad frame prefix")
+        body = await reader.readexactly(length)
+        if self.version == "3.4":
+            payload, digest = body[:-36], body[-36:-4]
+            expected = hmac.new(self.key, header + payload, hashlib.sha256).digest()
+            if not hmac.compare_digest(digest, expected):
+                raise TuyaLocalError("frame failed authentication")
+            payload = self._strip_retcode(payload)
+            if not payload:
+                return cmd, b""
+            return cmd, self._strip(_unpad(_ecb(self.key, payload, False)))
+        payload = self._strip_retcode(body[:-8])
+        if payload.startswith(b"3.3"):
+            payload = payload[15:]
+        if not payload:
+            return cmd, b""
+        return cmd, _unpad(_ecb(self.key, payload, False))
+
+    @staticmethod
+    def _strip_retcode(payload: bytes) -> bytes:
+        # Frames from the device lead with a 4-byte return code (0 or 1).
+        return payload[4:] if payload[:3] == b"\0\0\0" else payload
+
+    def _strip(self, plain: bytes) -> bytes:
+        plain = self._strip_retcode(plain)
+        if plain.startswith(self.version.encode()):
+            plain = plain[15:]
+        return plain
+
+
+def _json(payload: dict) -> bytes:
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _dps(message: dict) -> dict | None:
+    """The datapoints of a status or query reply, whichever shape it uses."""
+    dps = message.get("dps")
+    if dps is None and isinstance(message.get("data"), dict):
+        dps = message["data"].get("dps")
+    return dps if isinstance(dps, dict) and dps else None
+
+
+class LocalTuyaDevice:
+    """A persistent LAN session with one device."""
+
+    def __init__(
+        self,
+        tuya_id: str,
+        host: str,
+        version: str,
+        local_key: str,
+        on_dps: Callable[[dict], None],
+        on_key_rejected: Callable[[], None],
+    ) -> None:
+        self.tuya_id = tuya_id
+        self.host = host
+        self.version = version
+        self._local_key = local_key
+        self._on_dps = on_dps
+        self._on_key_rejected = on_key_rejected
+        self._codec: TuyaCodec | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._write_lock = asyncio.Lock()
+        # Reply waiters by the command they wait for, in the order sent: the
+        # device answers in order and its replies carry no request id.
+        self._replies: dict[int, deque[asyncio.Future[bytes]]] = {}
+        self._backoff = _BACKOFF_START
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def async_run(self, keep_running: Callable[[], bool]) -> None:
+        """Connect, and reconnect with backoff while ``keep_running()``."""
+        self._backoff = _BACKOFF_START
+        while keep_running():
+            try:
+                await self._async_session()
+            except asyncio.CancelledError:
+                raise
+            except TuyaLocalKeyRejected as err:
+                # Retrying with the same key cannot succeed; wait for a new one.
+                _LOGGER.debug("LAN session with %s at %s ended: %s", self.tuya_id, self.host, err)
+                self._on_key_rejected()
+                return
+            except (
+                OSError,
+                asyncio.IncompleteReadError,
+                asyncio.TimeoutError,
+                TuyaLocalError,
+                ValueError,
+            ) as err:
+                _LOGGER.debug("LAN session with %s at %s ended: %s", self.tuya_id, self.host, err)
+            finally:
+                self._close()
+            await asyncio.sleep(self._backoff)
+            self._backoff = min(self._backoff * 2, _BACKOFF_MAX)
+
+    async def _async_session(self) -> None:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, LAN_PORT), _REPLY_TIMEOUT
+        )
+        codec = TuyaCodec(self.version, self._local_key)
+        self._codec = codec
+        self._writer = writer
+        if codec.negotiates:
+            await self._negotiate(reader, writer, codec)
+        # A session only ever ends by raising, so the backoff is reset here,
+        # once the device has accepted us, rather than after it returns.
+        self._backoff = _BACKOFF_START
+        reading = asyncio.create_task(self._read_loop(reader, codec))
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            _LOGGER.debug("LAN session open with %s at %s (%s)", self.tuya_id, self.host, self.version)
+            await self.async_query()
+            done, _pending = await asyncio.wait(
+                (reading, heartbeat), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+        finally:
+            reading.cancel()
+            heartbeat.cancel()
+
+    @staticmethod
+    async def _negotiate(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter, codec: TuyaCodec
+    ) -> None:
+        """Agree the per-session key used by protocols 3.4 and 3.5."""
+        local_nonce = os.urandom(16)
+        writer.write(codec.pack(SESS_KEY_NEG_START, local_nonce))
+        await writer.drain()
+        cmd, reply = await asyncio.wait_for(codec.read(reader), _REPLY_TIMEOUT)
+        if cmd != SESS_KEY_NEG_RESP or len(reply) < 48:
+            raise TuyaLocalError("session key negotiation refused")
+        remote_nonce, proof = reply[:16], reply[16:48]
+        expected = hmac.new(codec.local_key, local_nonce, hashlib.sha256).digest()
+        if not hmac.compare_digest(proof, expected):
+            raise TuyaLocalKeyRejected("device does not hold this localKey")
+        writer.write(
+            codec.pack(
+                SESS_KEY_NEG_FINISH,
+                hmac.new(codec.local_key, remote_nonce, hashlib.sha256).digest(),
+            )
+        )
+        await writer.drain()
+        mixed = bytes(a ^ b for a, b in zip(local_nonce, remote_nonce))
+        if codec.version == "3.5":
+            codec.key = AESGCM(codec.local_key).encrypt(local_nonce[:12], mixed, None)[:16]
+        else:
+            codec.key = _ecb(codec.local_key, mixed, True)
+
+    async def _read_loop(self, reader: asyncio.StreamReader, codec: TuyaCodec) -> None:
+        while True:
+            cmd, payload = await asyncio.wait_for(codec.read(reader), _READ_TIMEOUT)
+            waiters = self._replies.get(cmd)
+            while waiters:
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    waiter.set_result(payload)
+                    break
+            if not payload.startswith(b"{"):
+                continue
+            try:
+                message = json.loads(payload)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and (dps := _dps(message)):
+                self._on_dps(dps)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(_HEARTBEAT_INTERVAL)
+            payload = {"gwId": self.tuya_id, "devId": self.tuya_id} if self.version == "3.3" else {}
+            await self._send(HEART_BEAT, payload)
+
+    async def _send(self, cmd: int, payload: dict, reply_cmd: int | None = None) -> bytes | None:
+        """Send a command; with ``reply_cmd``, wait for the device's answer."""
+        writer, codec = self._writer, self._codec
+        if writer is None or codec is None:
+            raise TuyaLocalNotSent("not connected")
+        waiter = None
+        try:
+            async with self._write_lock:
+                if reply_cmd is not None:
+                    # Queued under the lock, so waiters line up in frame order.
+                    waiter = asyncio.get_running_loop().create_future()
+                    self._replies.setdefault(reply_cmd, deque()).append(waiter)
+                writer.write(codec.pack(cmd, _json(payload)))
+                await writer.drain()
+            if waiter is None:
+                return None
+            return await asyncio.wait_for(waiter, _REPLY_TIMEOUT)
+        finally:
+            # Only this request's waiter: the others are still owed replies.
+            waiters = self._replies.get(reply_cmd)
+            if waiters is not None and waiter in waiters:
+                waiters.remove(waiter)
+
+    async def async_query(self) -> None:
+        """Ask for every datapoint; the answer arrives through ``on_dps``."""
+        if self.version == "3.3":
+            now = str(int(time.time()))
+            payload = {"gwId": self.tuya_id, "devId": self.tuya_id, "uid": self.tuya_id, "t": now}
+            await self._send(DP_QUERY, payload)
+        else:
+            await self._send(DP_QUERY_NEW, {})
+
+    async def async_set_dps(self, dps: dict) -> None:
+        """Write datapoints and wait for the device to acknowledge them.
+
+        ``TuyaLocalNotSent`` means nothing was sent.  Any other failure means
+        the frame may have gone out unconfirmed: the device may well have acted
+        on it.
+        """
+        now = int(time.time())
+        dps = {str(key): value for key, value in dps.items()}
+        if self.version == "3.3":
+            payload = {"devId": self.tuya_id, "uid": self.tuya_id, "t": str(now), "dps": dps}
+            await self._send(CONTROL, payload, CONTROL)
+        else:
+            payload = {"protocol": 5, "t": now, "data": {"dps": dps}}
+            await self._send(CONTROL_NEW, payload, CONTROL_NEW)
+
+    def _close(self) -> None:
+        for waiters in self._replies.values():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(TuyaLocalError("connection closed"))
+        self._replies.clear()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._codec = None
+
+
+class LocalTuyaManager:
+    """Open a LAN session with each device that announces itself.
+
+    A session is started when a device with a known localKey is seen on the
+    network (or moves address) and ends once its beacon goes stale.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: Any, beacons: BeaconListener) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.beacons = beacons
+        self._devices: dict[str, LocalTuyaDevice] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._unsubscribers: list[Callable[[], None]] = []
+        # The key each device last refused, not to be tried on it again.
+        self._rejected: dict[str, str] = {}
+
+    def device(self, device_id: str) -> LocalTuyaDevice | None:
+        """The connected LAN session for a Philips device, if there is one."""
+        for tuya_id, (known_id, _key) in self.coordinator.local_keys().items():
+            if known_id == device_id:
+                session = self._devices.get(tuya_id)
+                return session if session is not None and session.connected else None
+        return None
+
+    def async_start(self) -> None:
+        self._unsubscribers = [
+            self.beacons.add_listener(self._async_beacon),
+            self.coordinator.async_add_listener(self._async_reconcile),
+        ]
+        self._async_reconcile()
+
+    async def async_stop(self) -> None:
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers = []
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._devices.clear()
+
+    @callback
+    def _async_beacon(self, tuya_id: str, beacon: Beacon) -> None:
+        self._async_connect(tuya_id, beacon)
+
+    @callback
+    def _async_reconcile(self) -> None:
+        # A definition fetched after the beacon was first seen brings the key.
+        for tuya_id in self.coordinator.local_keys():
+            beacon = self.beacons.seen(tuya_id)
+            if beacon is not None:
+                self._async_connect(tuya_id, beacon)
+
+    @callback
+    def _async_key_rejected(self, tuya_id: str, local_key: str) -> None:
+        self._rejected[tuya_id] = local_key
+        self.coordinator.async_local_key_rejected(tuya_id)
+
+    @callback
+    def _async_connect(self, tuya_id: str, beacon: Beacon) -> None:
+        known = self.coordinator.local_keys().get(tuya_id)
+        if known is None:
+            return
+        device_id, local_key = known
+        if self._rejected.get(tuya_id) == local_key:
+            return
+        version = beacon.protocol or "3.3"
+        if version not in SUPPORTED_VERSIONS:
+            _LOGGER.debug("%s speaks LAN protocol %s; not connecting", tuya_id, version)
+            return
+        current = self._devices.get(tuya_id)
+        task = self._tasks.get(tuya_id)
+        if (
+            current is not None
+            and task is not None
+            and not task.done()
+            and (current.host, current.version) == (beacon.ip, version)
+        ):
+            return
+        if task is not None:
+            task.cancel()
+        session = LocalTuyaDevice(
+            tuya_id,
+            beacon.ip,
+            version,
+            local_key,
+            lambda dps: self.coordinator.async_apply_dps(device_id, dps),
+            lambda: self._async_key_rejected(tuya_id, local_key),
+        )
+        self._devices[tuya_id] = session
+        self._tasks[tuya_id] = self.hass.async_create_background_task(
+            session.async_run(lambda: self.beacons.seen(tuya_id) is not None),
+            name=f"philips-pet-series-lan-{tuya_id}",
+        )
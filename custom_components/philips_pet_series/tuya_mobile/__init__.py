@@ -12,7 +12,7 @@ from .signer import (
     PurePythonTuyaSigner,
     colon_hex,
 )
-from .client import TuyaMobileClient, canonical_string
+from .client import TuyaMobileClient, canonical_string, status_dps
 from .mqtt_auth import mqtt_client_id, mqtt_credentials, mqtt_password, mqtt_username
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "colon_hex",
     "TuyaMobileClient",
     "canonical_string",
+    "status_dps",
     "mqtt_credentials",
     "mqtt_client_id",
     "mqtt_username",
@@ -16,7 +16,7 @@ import logging
 import os
 import time
 import uuid
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import aiohttp
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
@@ -72,11 +72,34 @@ def _walk(value: Any) -> Iterable[Dict[str, Any]]:
             yield from _walk(child)
 
 
+def status_dps(response: Dict[str, Any]) -> Dict[str, Any]:
+    """The DPs in an ``s.m.dev.dp.get`` response.
+
+    Raises if the response reports a failure or carries no ``result``, so an
+    error body is never read as datapoints.
+    """
+    result = response.get("result") if isinstance(response, dict) else None
+    if (
+        not isinstance(result, dict)
+        or response.get("success") is False
+        or response.get("errorCode")
+    ):
+        error = response if isinstance(response, dict) else {}
+        raise RuntimeError(
+            "Tuya status request failed: "
+            f"{error.get('errorCode') or 'unknown'} {error.get('errorMsg') or ''}".strip()
+        )
+    dps = result.get("dps", result)
+    return dps if isinstance(dps, dict) else {}
+
+
 class TuyaMobileClient:
     """Call the encrypted Tuya mobile endpoints used by Tuya Android apps."""
 
     BASE_URL = "https://a1.tuyaeu.com/api.json"
     APP_VERSION = "2.2.1"
+    # Local keys only change when a device is re-paired.
+    LOCAL_KEYS_TTL = 24 * 3600
 
     def __init__(
         self,
@@ -95,32 +118,56 @@ class TuyaMobileClient:
         self.ecode: Optional[str] = None
         self.uid: Optional[str] = None
         self.mobile_url = self.BASE_URL
+        self._ch_key: Optional[str] = None
+        self._base_params: Optional[Dict[str, str]] = None
+        self._group_ids: Optional[List[Any]] = None
+        self._local_keys: Optional[List[Dict[str, Any]]] = None
+        self._local_keys_at = 0.0
         # Tuya validates a stable installation ID; supply the captured value.
         self.device_id = device_id or os.environ.get("PETSERIES_TUYA_DEVICE_ID", "")
 
-    async def _call(self, action: str, payload: Dict[str, Any], *, version: str = "1.0") -> Dict[str, Any]:
-        request_id = str(uuid.uuid4())
-        key = await asyncio.to_thread(self.signer.derive_key, request_id, self.ecode)
+    def _channel_key(self) -> str:
+        # Account/app-global; an out-of-process signer is asked only once.
+        if self._ch_key is None:
+            self._ch_key = self.signer.channel_key()
+        return self._ch_key
+
+    def _static_params(self) -> Dict[str, str]:
+        # The request fields that are the same for every call.
+        if self._base_params is None:
+            self._base_params = {
+                "clientId": self.app_id,
+                "os": "Android",
+                "appVersion": self.APP_VERSION,
+                "channel": "sdk",
+                "osSystem": "14",
+                "sdkVersion": "6.7.0",
+                "deviceCoreVersion": "6.7.0",
+                "platform": "Pixel 7",
+                "timeZoneId": os.environ.get("PETSERIES_TUYA_TIMEZONE") or "UTC",
+                "cp": "gzip",
+                "nd": "1",
+                "bizDM": "ipc",
+                "lang": os.environ.get("PETSERIES_TUYA_LANG") or "en",
+                "ttid": "android",
+                "et": "3",
+            }
+        return self._base_params
+
+    def _prepare(
+        self, request_id: str, action: str, payload: Dict[str, Any], version: str
+    ) -> tuple[bytes, Dict[str, str]]:
+        """Derive the request key, encrypt the payload and sign the request.
+
+        Blocks for as long as the signer does; see ``_call``.
+        """
+        key = self.signer.derive_key(request_id, self.ecode)
         encrypted = _encrypt(key, payload)
         params: Dict[str, str] = {
             "a": action,
             "v": version,
-            "clientId": self.app_id,
-            "os": "Android",
-            "appVersion": self.APP_VERSION,
-            "channel": "sdk",
-            "osSystem": "14",
-            "sdkVersion": "6.7.0",
-            "deviceCoreVersion": "6.7.0",
-            "platform": "Pixel 7",
-            "timeZoneId": os.environ.get("PETSERIES_TUYA_TIMEZONE") or "UTC",
-            "cp": "gzip",
-            "nd": "1",
-            "bizDM": "ipc",
-            "lang": os.environ.get("PETSERIES_TUYA_LANG") or "en",
-            "ttid": "android",
-            "et": "3",
-            "chKey": await asyncio.to_thread(self.signer.channel_key),
+            **self._static_params(),
+            "chKey": self._channel_key(),
             "deviceId": self.device_id or self.uid or "",
             "time": str(int(time.time())),
             "requestId": request_id,
@@ -128,7 +175,15 @@ class TuyaMobileClient:
         }
         if self.sid:
             params["sid"] = self.sid
-        params["sign"] = await asyncio.to_thread(self.signer.sign, canonical_string(params))
+        params["sign"] = self.signer.sign(canonical_string(params))
+        return key, params
+
+    def _prepare_all(
+        self, requests: Sequence[Tuple[str, str, Dict[str, Any], str]]
+    ) -> List[tuple[bytes, Dict[str, str]]]:
+        return [self._prepare(*request) for request in requests]
+
+    async def _post(self, action: str, key: bytes, params: Dict[str, str]) -> Dict[str, Any]:
         async with self.session.post(self.mobile_url, data=params) as response:
             envelope = await response.json(content_type=None)
         if "result" not in envelope:
@@ -137,6 +192,59 @@ class TuyaMobileClient:
             raise RuntimeError(f"Tuya mobile API request {action} failed: {error_code} {error_msg}")
         return _decrypt(key, envelope["result"])
 
+    async def _call(self, action: str, payload: Dict[str, Any], *, version: str = "1.0") -> Dict[str, Any]:
+        request_id = str(uuid.uuid4())
+        # An in-process signer costs microseconds of HMAC, less than a thread
+        # hop; an external one is given a single executor call for the key,
+        # the chKey and the signature together.
+        if getattr(self.signer, "in_process", False):
+            key, params = self._prepare(request_id, action, payload, version)
+        else:
+            key, params = await asyncio.to_thread(
+                self._prepare, request_id, action, payload, version
+            )
+        return await self._post(action, key, params)
+
+    async def call_many(
+        self,
+        calls: Sequence[Tuple[str, Dict[str, Any], str]],
+        *,
+        concurrency: int = 4,
+    ) -> List[Any]:
+        """Run several ``(action, payload, version)`` calls at once.
+
+        Every request is prepared in one pass (a single executor call for an
+        external signer, rather than one per request) and then posted at most
+        ``concurrency`` at a time over the session's keep-alive connections.
+        Returns one entry per call, in order: its result, or the exception it
+        raised.
+        """
+        if not calls:
+            return []
+        requests = [
+            (str(uuid.uuid4()), action, payload, version)
+            for action, payload, version in calls
+        ]
+        if getattr(self.signer, "in_process", False):
+            prepared = self._prepare_all(requests)
+        else:
+            prepared = await asyncio.to_thread(self._prepare_all, requests)
+        limit = asyncio.Semaphore(max(1, concurrency))
+
+        async def post(action: str, key: bytes, params: Dict[str, str]) -> Dict[str, Any]:
+            async with limit:
+                return await self._post(action, key, params)
+
+        return await asyncio.gather(
+            *(
+                post(action, key, params)
+                for (_request_id, action, _payload, _version), (key, params) in zip(
+                    requests, prepared
+                )
+            ),
+            return_exceptions=True,
+        )
+
     async def login_with_jwt(self, id_token: str, country_code: str = "",
                              platform: str = "PhilipsDA") -> Dict[str, Any]:
         """Third-party (JWT) login. ``platform`` is the app's third-party tag."""
@@ -156,6 +264,7 @@ class TuyaMobileClient:
         self.sid = data.get("sid") or data.get("session") or data.get("sessionId")
         self.ecode = data.get("ecode") or data.get("eCode") or data.get("encryptCode")
         self.uid = data.get("uid") or data.get("userId")
+        self._group_ids = None
         if data.get("success") is False or data.get("errorCode") or data.get("errorMsg"):
             raise RuntimeError(
                 "Tuya third-party login failed: "
@@ -173,29 +282,101 @@ class TuyaMobileClient:
     # Back-compat alias (petsseries historically called this name).
     login_with_philips_token = login_with_jwt
 
-    async def get_local_keys(self, device_ids: List[str]) -> List[Dict[str, Any]]:
-        homes = await self._call("m.life.home.space.list", {})
-        wanted = set(device_ids)
-        records = []
-        gids = {
-            obj.get("gid") or obj.get("groupId") or obj.get("homeId")
-            for obj in _walk(homes)
-            if obj.get("gid") or obj.get("groupId") or obj.get("homeId")
-        }
-        for gid in gids:
-            response = await self._call("m.life.my.group.device.list", {"gid": gid}, version="2.2")
-            for obj in _walk(response):
+    async def group_ids(self) -> List[Any]:
+        """The account's home (group) IDs, listed once per session."""
+        if self._group_ids is None:
+            homes = await self._call("m.life.home.space.list", {})
+            self._group_ids = list(dict.fromkeys(
+                obj.get("gid") or obj.get("groupId") or obj.get("homeId")
+                for obj in _walk(homes)
+                if obj.get("gid") or obj.get("groupId") or obj.get("homeId")
+            ))
+        return list(self._group_ids)
+
+    async def get_group_devices(self) -> List[Dict[str, Any]]:
+        """Every device record in every home, one request per home."""
+        responses = await self.call_many(
+            [("m.life.my.group.device.list", {"gid": gid}, "2.2") for gid in await self.group_ids()]
+        )
+        devices = []
+        for response in responses:
+            if isinstance(response, BaseException):
+                raise response
+            devices.extend(
+                obj for obj in _walk(response)
+                if obj.get("devId") or obj.get("deviceId") or obj.get("id")
+            )
+        return devices
+
+    async def get_local_keys(
+        self, device_ids: List[str], *, refresh: bool = False
+    ) -> List[Dict[str, Any]]:
+        """LAN credentials (localKey, gwId, uuid, ip) for the account's devices.
+
+        The inventory walk is kept for ``LOCAL_KEYS_TTL``, since keys only
+        change when a device is re-paired; pass ``refresh`` or call
+        :meth:`invalidate_local_keys` when a key turns out to be wrong.
+        """
+        if (
+            refresh
+            or self._local_keys is None
+            or time.monotonic() - self._local_keys_at > self.LOCAL_KEYS_TTL
+        ):
+            records = []
+            for obj in await self.get_group_devices():
                 local_key = obj.get("localKey") or obj.get("local_key")
                 device_id = obj.get("devId") or obj.get("deviceId") or obj.get("id")
-                if local_key and (not wanted or str(device_id) in wanted):
+                if local_key:
                     records.append({
                         "device_id": device_id, "local_key": local_key,
+                        "gw_id": obj.get("gwId") or obj.get("parentId") or device_id,
                         "ip": obj.get("ip") or obj.get("lanIp"), "name": obj.get("name"),
                         "uuid": obj.get("uuid"),
                         "is_online": obj.get("isOnline", obj.get("cloudOnline")),
                     })
-        unique = {(str(i.get("device_id")), str(i.get("local_key"))): i for i in records}
-        return list(unique.values())
+            unique = {(str(i.get("device_id")), str(i.get("local_key"))): i for i in records}
+            self._local_keys = list(unique.values())
+            self._local_keys_at = time.monotonic()
+        wanted = set(device_ids)
+        return [
+            record for record in self._local_keys
+            if not wanted or str(record.get("device_id")) in wanted
+        ]
+
+    def invalidate_local_keys(self) -> None:
+        """Forget the cached inventory; the next lookup walks it again."""
+        self._local_keys = None
+
+    async def get_devices_dps(self, device_ids: Iterable[str]) -> Dict[str, Any]:
+        """Current DPs of several devices, mapped by devId.
+
+        Read from the homes' device lists -- one request per home however many
+        devices it holds -- with ``s.m.dev.dp.get`` for any device the lists do
+        not carry.  A device whose DPs could not be read maps to the exception.
+        """
+        wanted = [str(device_id) for device_id in dict.fromkeys(device_ids)]
+        found: Dict[str, Any] = {}
+        try:
+            devices = await self.get_group_devices()
+        except Exception as err:  # noqa: BLE001 - fall back to per-device reads
+            _LOGGER.debug("Tuya device lists unavailable, reading DPs per device: %s", err)
+            devices = []
+        for obj in devices:
+            device_id = str(obj.get("devId") or obj.get("deviceId") or obj.get("id"))
+            if device_id in wanted and isinstance(obj.get("dps"), dict):
+                found[device_id] = obj["dps"]
+        missing = [device_id for device_id in wanted if device_id not in found]
+        results = await self.call_many(
+            [("s.m.dev.dp.get", {"devId": device_id, "gwId": device_id}, "1.0") for device_id in missing]
+        )
+        for device_id, result in zip(missing, results):
+            if not isinstance(result, BaseException):
+                try:
+                    result = status_dps(result)
+                except RuntimeError as err:
+                    result = err
+            found[device_id] = result
+        return found
 
     async def get_device_status(self, device_id: str, gateway_id: str = "") -> Dict[str, Any]:
         result = await self._call("s.m.dev.dp.get", {"devId": device_id, "gwId": gateway_id})
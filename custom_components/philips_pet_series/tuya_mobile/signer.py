@@ -26,12 +26,26 @@ from __future__ import annotations
 
 import hashlib
 import hmac
+import http.client
+import itertools
 import json
+import logging
 import os
+import queue
 import subprocess
-import urllib.request
+import threading
+import weakref
 from pathlib import Path
 from typing import Optional
+from urllib.parse import urlsplit
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to wait for one answer from an external signer.
+_PROCESS_TIMEOUT = 20
+_HTTP_TIMEOUT = 25
+# Keep-alive connections held open to a signer service.
+_HTTP_POOL_SIZE = 4
 
 
 class NativeSignerError(RuntimeError):
@@ -45,7 +59,16 @@ def colon_hex(cert_sha256_hex: str) -> str:
 
 
 class PurePythonTuyaSigner:
-    """Drop-in ``thing_security`` signer implemented in pure Python."""
+    """Drop-in ``thing_security`` signer implemented in pure Python.
+
+    Everything derived from the app credentials alone (G, the signing key, the
+    chKey) is computed once here; the credentials are fixed for the signer's
+    lifetime.  Signing a request is then one HMAC over the canonical string,
+    started from a prepared HMAC state.
+    """
+
+    # Cheap and non-blocking: clients may call it on the event loop.
+    in_process = True
 
     def __init__(
         self,
@@ -60,39 +83,230 @@ class PurePythonTuyaSigner:
         self.cert_sha256_hex = cert_sha256_hex
         self.app_key = app_key
         self.package = package
+        self._cert_msg = f"{package}_{colon_hex(cert_sha256_hex)}"
+        self._global_material = f"{self._cert_msg}_{app_key}_{app_secret}"
+        self._global_bytes = self._global_material.encode()
+        self._signing_key_bytes = hashlib.sha256(self._global_bytes).digest()
+        self._sign_hmac = hmac.new(self._signing_key_bytes, digestmod=hashlib.sha256)
+        self._channel_key = hmac.new(
+            app_id.encode(), self._cert_msg.encode(), hashlib.sha256
+        ).hexdigest()[8:16]
+        # derive_key's message for the current session's ecode.
+        self._key_message: tuple[Optional[str], bytes] = (None, self._global_bytes)
 
     # -- internal helpers ------------------------------------------------
     def cert_msg(self) -> str:
-        return f"{self.package}_{colon_hex(self.cert_sha256_hex)}"
+        return self._cert_msg
 
     def global_material(self) -> str:
         """The shared "global key material" string G."""
-        return f"{self.cert_msg()}_{self.app_key}_{self.app_secret}"
+        return self._global_material
 
     def _signing_key(self) -> bytes:
-        return hashlib.sha256(self.global_material().encode()).digest()
+        return self._signing_key_bytes
 
     # -- public interface ------------------------------------------------
     def sign(self, canonical: str) -> str:
         """Sign a canonical request string -> lowercase hex HMAC-SHA256."""
-        return hmac.new(
-            self._signing_key(), canonical.encode(), hashlib.sha256
-        ).hexdigest()
+        mac = self._sign_hmac.copy()
+        mac.update(canonical.encode())
+        return mac.hexdigest()
 
     def derive_key(self, request_id: str, ecode: Optional[str]) -> bytes:
         """Return the 16-byte per-request AES key."""
-        g = self.global_material()
-        message = g if not ecode else f"{g}_{ecode}"
-        digest = hmac.new(
-            request_id.encode(), message.encode(), hashlib.sha256
-        ).hexdigest()
+        cached_ecode, message = self._key_message
+        if ecode != cached_ecode:
+            message = self._global_bytes if not ecode else f"{self._global_material}_{ecode}".encode()
+            self._key_message = (ecode, message)
+        digest = hmac.new(request_id.encode(), message, hashlib.sha256).hexdigest()
         return digest[:16].encode()
 
     def channel_key(self) -> str:
         """Return the account/app-global channel key (chKey)."""
-        return hmac.new(
-            self.app_id.encode(), self.cert_msg().encode(), hashlib.sha256
-        ).hexdigest()[8:16]
+        return self._channel_key
+
+
+class _Pending:
+    """One request to a signer worker, waiting for its answer."""
+
+    __slots__ = ("process", "done", "result", "error")
+
+    def __init__(self, process: subprocess.Popen) -> None:
+        self.process = process
+        self.done = threading.Event()
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+
+
+class _SignerWorker:
+    """A long-lived ``<command> serve`` process answering pipelined requests.
+
+    Requests and answers are single JSON lines on stdin/stdout, matched by
+    ``id``, so several threads can have requests in flight at once.  A worker
+    that dies, or stops answering, is restarted on the next request; one that
+    exits before ever answering is taken not to support ``serve`` at all
+    (``unsupported``).
+    """
+
+    def __init__(self, argv: list[str], env: dict) -> None:
+        self._argv = argv
+        self._env = env
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._pending: dict[int, _Pending] = {}
+        self._process: Optional[subprocess.Popen] = None
+        self._served = False
+        self.unsupported = False
+
+    def _ensure_started(self) -> subprocess.Popen:
+        process = self._process
+        if process is not None and process.poll() is None:
+            return process
+        try:
+            process = subprocess.Popen(
+                self._argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                env=self._env,
+            )
+        except OSError as exc:
+            raise NativeSignerError(f"Unable to execute signer: {exc}") from exc
+        self._process = process
+        threading.Thread(
+            target=self._read, args=(process,), name="tuya-signer-worker", daemon=True
+        ).start()
+        return process
+
+    def request(self, payload: dict) -> dict:
+        with self._lock:
+            process = self._ensure_started()
+            request_id = next(self._ids)
+            pending = self._pending[request_id] = _Pending(process)
+            try:
+                process.stdin.write(json.dumps({**payload, "id": request_id}) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                self._pending.pop(request_id, None)
+                raise NativeSignerError(f"Signer worker is not accepting requests: {exc}") from exc
+        if not pending.done.wait(_PROCESS_TIMEOUT):
+            with self._lock:
+                self._pending.pop(request_id, None)
+                stuck = self._process is process
+                if stuck:
+                    self._process = None
+            # A worker that stopped answering would hold every later request
+            # for the full timeout; replace it rather than reuse it.
+            if stuck:
+                _stop(process)
+            raise NativeSignerError("Signer worker did not answer in time")
+        if pending.error is not None:
+            raise NativeSignerError(pending.error)
+        return pending.result
+
+    def _read(self, process: subprocess.Popen) -> None:
+        for line in process.stdout:
+            try:
+                answer = json.loads(line)
+                request_id = int(answer["id"])
+            except (ValueError, KeyError, TypeError):
+                continue
+            with self._lock:
+                pending = self._pending.pop(request_id, None)
+                self._served = True
+            if pending is not None:
+                pending.result = answer
+                pending.done.set()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            if not self._served:
+                self.unsupported = True
+            orphans = [
+                request_id
+                for request_id, pending in self._pending.items()
+                if pending.process is process
+            ]
+            for request_id in orphans:
+                pending = self._pending.pop(request_id)
+                pending.error = "Signer worker exited"
+                pending.done.set()
+        _stop(process)
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+        if process is not None:
+            _stop(process)
+
+
+def _stop(process: subprocess.Popen) -> None:
+    """Terminate a worker process, if still running, and reap it."""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+class _SignerService:
+    """Keep-alive connections to an HTTP signer service, reused across calls."""
+
+    def __init__(self, url: str, token: str) -> None:
+        parts = urlsplit(url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._path = parts.path or "/"
+        if parts.query:
+            self._path += f"?{parts.query}"
+        self._headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {token}",
+        }
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=_HTTP_POOL_SIZE)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            factory = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            return factory(self._host, self._port, timeout=_HTTP_TIMEOUT)
+
+    def request(self, payload: dict) -> dict:
+        body = json.dumps(payload).encode()
+        for attempt in range(2):
+            connection = self._connection()
+            try:
+                connection.request("POST", self._path, body=body, headers=self._headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as exc:
+                connection.close()
+                # An idle keep-alive connection the server already closed fails
+                # on first use; signing is idempotent, so retry once on a new one.
+                if attempt:
+                    raise NativeSignerError(f"Signer service request failed: {exc}") from exc
+                continue
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    self._idle.put_nowait(connection)
+                except queue.Full:
+                    connection.close()
+            if response.status >= 400:
+                raise NativeSignerError(f"Signer service request failed: HTTP {response.status}")
+            try:
+                return json.loads(data)
+            except ValueError as exc:
+                raise NativeSignerError("Signer service returned invalid JSON") from exc
+        raise NativeSignerError("Signer service request failed")
 
 
 class NativeTuyaSigner:
@@ -104,8 +318,20 @@ class NativeTuyaSigner:
 
     The command must implement: ``sign`` (canonical on stdin -> hex),
     ``key <request_id> <ecode>`` (-> hex AES key), ``chkey`` (-> channel key).
+
+    With ``daemon`` (or ``TUYA_SIGNER_DAEMON=1``) the command is instead started
+    once as ``<command> serve`` and sent one JSON line per operation -- the same
+    ``operation``/``arguments``/``canonical`` fields the HTTP service takes,
+    plus an ``id`` echoed back in the answer -- rather than spawning a process
+    per operation.  A command that does not support ``serve`` falls back to one
+    process per operation.  The HTTP service variant always reuses keep-alive
+    connections.  The worker is stopped by :meth:`close`, or at the latest
+    when the signer is garbage collected or the interpreter exits.
     """
 
+    # Every operation blocks on a subprocess or HTTP call.
+    in_process = False
+
     def __init__(
         self,
         command: "str | os.PathLike[str]",
@@ -116,6 +342,7 @@ class NativeTuyaSigner:
         key_global: Optional[str] = None,
         android_root: "Optional[str | os.PathLike[str]]" = None,
         service_token: str = "",
+        daemon: Optional[bool] = None,
     ) -> None:
         raw = str(command)
         self.command = raw if raw.startswith(("http://", "https://")) else str(Path(raw).expanduser())
@@ -127,39 +354,55 @@ class NativeTuyaSigner:
         )
         if key_global:
             self.environment["TUYA_KEY_GLOBAL"] = key_global
+        if self.android_root:
+            self.environment["PETSERIES_TUYA_ANDROID_ROOT"] = self.android_root
+        if daemon is None:
+            daemon = os.environ.get("TUYA_SIGNER_DAEMON", "").lower() in ("1", "true", "yes")
+        self._service: Optional[_SignerService] = None
+        self._worker: Optional[_SignerWorker] = None
+        if self.command.startswith(("http://", "https://")):
+            self._service = _SignerService(self.command, self.service_token)
+        elif daemon:
+            self._worker = _SignerWorker([self.command, "serve"], self.environment)
+            # Callers that drop a signer without closing it (a session replaced
+            # on re-login) must not leave its worker running.
+            self._finalizer = weakref.finalize(self, self._worker.close)
+
+    @staticmethod
+    def _value(operation: str, result: dict) -> str:
+        if not result.get("ok"):
+            raise NativeSignerError(result.get("error", "Signer service failed"))
+        value = str(result.get("value", "")).strip()
+        if not value:
+            raise NativeSignerError(f"Signer op {operation!r} returned no output")
+        return value
 
     def _run(self, operation: str, *arguments: str, stdin: Optional[str] = None,
              extra_env: Optional[dict] = None) -> str:
-        if self.command.startswith(("http://", "https://")):
-            payload = {
-                "operation": operation, "arguments": list(arguments),
-                "stdin": stdin or "", "canonical": (extra_env or {}).get("TUYA_CANONICAL_STRING", ""),
-            }
-            req = urllib.request.Request(
-                self.command, data=json.dumps(payload).encode(),
-                headers={"Content-Type": "application/json",
-                         "Authorization": f"Bearer {self.service_token}"},
-                method="POST",
-            )
+        payload = {
+            "operation": operation, "arguments": list(arguments),
+            "stdin": stdin or "", "canonical": (extra_env or {}).get("TUYA_CANONICAL_STRING", ""),
+        }
+        if self._service is not None:
+            return self._value(operation, self._service.request(payload))
+        worker = self._worker
+        if worker is not None and not worker.unsupported:
             try:
-                with urllib.request.urlopen(req, timeout=25) as resp:
-                    result = json.loads(resp.read())
-            except Exception as exc:
-                raise NativeSignerError(f"Signer service request failed: {exc}") from exc
-            if not result.get("ok"):
-                raise NativeSignerError(result.get("error", "Signer service failed"))
-            value = str(result.get("value", "")).strip()
-            if not value:
-                raise NativeSignerError(f"Signer op {operation!r} returned no output")
-            return value
+                return self._value(operation, worker.request(payload))
+            except NativeSignerError:
+                if not worker.unsupported:
+                    raise
+                _LOGGER.warning(
+                    "Signer %s does not support 'serve'; spawning it per operation",
+                    self.command,
+                )
         env = self.environment.copy()
         if extra_env:
             env.update(extra_env)
-        if self.android_root:
-            env["PETSERIES_TUYA_ANDROID_ROOT"] = self.android_root
         try:
             done = subprocess.run([self.command, operation, *arguments], input=stdin,
-                                  text=True, capture_output=True, check=False, env=env, timeout=20)
+                                  text=True, capture_output=True, check=False, env=env,
+                                  timeout=_PROCESS_TIMEOUT)
         except OSError as exc:
             raise NativeSignerError(f"Unable to execute signer: {exc}") from exc
         if done.returncode:
@@ -169,6 +412,11 @@ class NativeTuyaSigner:
             raise NativeSignerError(f"Signer op {operation!r} returned no output")
         return value
 
+    def close(self) -> None:
+        """Stop the worker process, if one was started."""
+        if self._worker is not None:
+            self._finalizer()
+
     def sign(self, canonical: str) -> str:
         return self._run("sign", extra_env={"TUYA_CANONICAL_STRING": canonical})
 
@@ -0,0 +1,100 @@
+"""The Tuya mobile session, kept across restarts.
+
+Every start used to log in to the Tuya mobile API -- a signed, encrypted round
+trip that also rediscovers the regional API endpoint -- before the first cloud
+DP read, DP write or camera credential could be made.  The session (sid,
+ecode, uid and the regional mobile API URL) is saved here whenever it changes
+and put back on the client at the next start without a request.
+
+It is not checked up front: the first call made with it is the check.  A
+session the cloud no longer accepts fails that call, and both
+``PetsSeriesClient`` and ``TuyaCloudReader`` then log in again once, as they
+do for any expired session.
+
+The session grants API access on the account's behalf, so it is stored
+sealed with the entry's ``EntryCipher``.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from petsseries import PetsSeriesClient
+from petsseries.native_signer import NativeTuyaSigner
+from tuya_mobile import TuyaMobileClient
+
+from .const import DOMAIN
+from .entry_cipher import EntryCipher
+from .tuya_cloud import release_signer
+
+_LOGGER = logging.getLogger(__name__)
+
+_FIELDS = ("sid", "ecode", "uid", "mobile_url")
+
+
+def storage_key(entry_id: str) -> str:
+    return f"{DOMAIN}.tuya_session.{entry_id}"
+
+
+class TuyaSessionStore:
+    """One config entry's saved Tuya mobile session."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self.hass = hass
+        self._store = Store(hass, 1, storage_key(entry_id))
+        self._cipher = EntryCipher(hass, entry_id)
+        self._saved: tuple[str, ...] | None = None
+
+    @staticmethod
+    def _values(mobile: Any) -> tuple[str, ...] | None:
+        if mobile is None or not mobile.sid or not mobile.ecode:
+            return None
+        return (mobile.sid, mobile.ecode, mobile.uid or "", mobile.mobile_url)
+
+    async def async_restore(self, client: PetsSeriesClient) -> bool:
+        """Put the saved session on ``client``, unless it already has one."""
+        if client._tuya_mobile is not None or not client.auth.id_token:
+            return False
+        stored = await self._store.async_load()
+        if not isinstance(stored, dict):
+            return False
+        await self._cipher.async_setup()
+        try:
+            session = self._cipher.unseal(stored["session"])
+            values = tuple(str(session[name] or "") for name in _FIELDS)
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Saved Tuya session is unusable; logging in afresh: %s", err)
+            return False
+        sid, ecode, uid, mobile_url = values
+        if not sid or not ecode or not mobile_url:
+            return False
+
+        http = aiohttp.ClientSession()
+        mobile = TuyaMobileClient(NativeTuyaSigner.from_environment(), http)
+        mobile.sid, mobile.ecode, mobile.uid, mobile.mobile_url = sid, ecode, uid or None, mobile_url
+        async with client._tuya_lock:
+            if client._tuya_mobile is not None:
+                # Something logged in while the store was read.
+                await http.close()
+                release_signer(mobile)
+                return False
+            client._tuya_mobile_session = http
+            client._tuya_mobile = mobile
+        self._saved = values
+        _LOGGER.debug("Reusing the saved Tuya mobile session")
+        return True
+
+    async def async_capture(self, client: PetsSeriesClient) -> None:
+        """Save the client's current session if it changed since it was saved."""
+        values = self._values(client._tuya_mobile)
+        if values is None or values == self._saved:
+            return
+        await self._cipher.async_setup()
+        await self._store.async_save(
+            {"session": self._cipher.seal(dict(zip(_FIELDS, values)))}
+        )
+        self._saved = values
@@ -0,0 +1 @@
+"""Tests for the Philips Pet Series integration."""
@@ -0,0 +1,185 @@
+"""Tests for routing datapoint writes."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.philips_pet_series import commands as commands_module
+from custom_components.philips_pet_series.commands import (
+    ROUTE_CLOUD,
+    ROUTE_LAN,
+    CommandRouter,
+)
+from custom_components.philips_pet_series.tuya_local import TuyaLocalNotSent
+
+DEVICE = SimpleNamespace(id="dev-1")
+FEED = {"201": 1}
+VOLUME = {"231": 80}
+
+
+class FakeSession:
+    """A LAN session whose writes succeed or raise ``error``."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.sent: list[dict] = []
+
+    async def async_set_dps(self, dps: dict) -> None:
+        self.sent.append(dps)
+        if self.error is not None:
+            raise self.error
+
+
+class FakeClient:
+    def __init__(self, authorised: bool = True) -> None:
+        self.auth = SimpleNamespace(id_token="token" if authorised else None)
+        self.authorised = authorised
+        self.sent: list[tuple[str, dict]] = []
+
+    async def publish_cloud_dps(self, tuya_id: str, dps: dict) -> bool:
+        if self.authorised:
+            self.sent.append((tuya_id, dps))
+        return self.authorised
+
+
+class FakeCoordinator:
+    def __init__(self, hass, live: bool = False) -> None:
+        self.hass = hass
+        self.live = live
+        self.applied: list[tuple[str, dict]] = []
+        self.refreshes: list[str] = []
+
+    def tuya_device_id(self, device) -> str:
+        return f"tuya-{device.id}"
+
+    def async_apply_dps(self, device_id: str, dps: dict) -> None:
+        self.applied.append((device_id, dps))
+
+    def async_schedule_device_refresh(self, device_id: str) -> None:
+        self.refreshes.append(device_id)
+
+
+def router(hass, session=None, client=None, live=False):
+    client = client or FakeClient()
+    coordinator = FakeCoordinator(hass, live)
+    local = SimpleNamespace(device=lambda device_id: session)
+    return CommandRouter(client, coordinator, local), client, coordinator
+
+
+async def test_lan_write_is_applied_without_a_read_back(hass) -> None:
+    session = FakeSession()
+    commands, client, coordinator = router(hass, session)
+
+    assert await commands.async_publish(DEVICE, FEED) == ROUTE_LAN
+    assert session.sent == [FEED]
+    assert client.sent == []
+    assert coordinator.applied == [("dev-1", FEED)]
+    assert coordinator.refreshes == []
+
+
+async def test_feed_sent_over_lan_without_a_reply_is_not_resent(hass) -> None:
+    # The frame went out, so the device may already have dispensed.
+    session = FakeSession(TimeoutError())
+    commands, client, coordinator = router(hass, session)
+
+    with pytest.raises(RuntimeError, match="not retrying"):
+        await commands.async_publish(DEVICE, FEED)
+    assert session.sent == [FEED]
+    assert client.sent == []
+    assert coordinator.applied == []
+
+
+async def test_feed_not_sent_over_lan_falls_back_to_the_cloud(hass) -> None:
+    session = FakeSession(TuyaLocalNotSent("not connected"))
+    commands, client, coordinator = router(hass, session)
+
+    assert await commands.async_publish(DEVICE, FEED) == ROUTE_CLOUD
+    assert client.sent == [("tuya-dev-1", FEED)]
+    assert coordinator.applied == [("dev-1", FEED)]
+    assert coordinator.refreshes == ["dev-1"]
+
+
+async def test_other_datapoints_fall_back_to_the_cloud_on_any_lan_failure(hass) -> None:
+    session = FakeSession(TimeoutError())
+    commands, client, coordinator = router(hass, session)
+
+    assert await commands.async_publish(DEVICE, VOLUME) == ROUTE_CLOUD
+    assert session.sent == [VOLUME]
+    assert client.sent == [("tuya-dev-1", VOLUME)]
+    assert coordinator.applied == [("dev-1", VOLUME)]
+
+
+async def test_without_a_lan_session_writes_go_to_the_cloud(hass) -> None:
+    commands, client, coordinator = router(hass, live=True)
+
+    assert await commands.async_publish(DEVICE, FEED) == ROUTE_CLOUD
+    assert client.sent == [("tuya-dev-1", FEED)]
+    # A live MQTT channel will push the device's own report.
+    assert coordinator.refreshes == []
+
+
+async def test_no_route_raises_and_applies_nothing(hass) -> None:
+    commands, _client, coordinator = router(hass, client=FakeClient(authorised=False))
+
+    assert not commands.available(DEVICE)
+    with pytest.raises(RuntimeError):
+        await commands.async_publish(DEVICE, FEED)
+    assert coordinator.applied == []
+
+
+async def test_burst_of_writes_is_sent_as_one_merged_write(hass) -> None:
+    session = FakeSession()
+    commands, _client, coordinator = router(hass, session)
+
+    routes = await asyncio.gather(
+        commands.async_publish(DEVICE, {"231": 50}),
+        commands.async_publish(DEVICE, {"105": True}),
+        # A later value for the same datapoint supersedes the queued one.
+        commands.async_publish(DEVICE, {"231": 80}),
+    )
+
+    assert routes == [ROUTE_LAN] * 3
+    assert session.sent == [{"231": 80, "105": True}]
+    assert coordinator.applied == [("dev-1", {"231": 80, "105": True})]
+
+
+async def test_writes_outside_the_window_are_sent_separately(hass, monkeypatch) -> None:
+    monkeypatch.setattr(commands_module, "COALESCE_WINDOW", 0.01)
+    session = FakeSession()
+    commands, _client, _coordinator = router(hass, session)
+
+    await commands.async_publish(DEVICE, {"231": 50})
+    await commands.async_publish(DEVICE, {"231": 80})
+
+    assert session.sent == [{"231": 50}, {"231": 80}]
+
+
+async def test_feeds_are_never_merged(hass) -> None:
+    session = FakeSession()
+    commands, _client, _coordinator = router(hass, session)
+
+    await asyncio.gather(
+        commands.async_publish(DEVICE, VOLUME),
+        commands.async_publish(DEVICE, FEED),
+        commands.async_publish(DEVICE, FEED),
+    )
+
+    # Each feed goes out on its own, straight away; only the other write waits.
+    assert session.sent == [FEED, FEED, VOLUME]
+
+
+async def test_a_failed_merged_write_fails_every_caller(hass) -> None:
+    session = FakeSession(TimeoutError())
+    commands, _client, _coordinator = router(hass, session, client=FakeClient(authorised=False))
+
+    results = await asyncio.gather(
+        commands.async_publish(DEVICE, {"231": 50}),
+        commands.async_publish(DEVICE, {"105": True}),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [RuntimeError, RuntimeError]
+    assert session.sent == [{"231": 50, "105": True}]
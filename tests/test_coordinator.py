@@ -0,0 +1,98 @@
+"""Tests for the coordinator's targeted single-device refresh."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.util import dt as dt_util
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.philips_pet_series import (
+    CONFIRM_DELAY,
+    FEED_EVENT_DELAY,
+    PhilipsPetsSeriesDataUpdateCoordinator,
+)
+
+FEED_EVENT = "meal_dispensed"
+
+
+@pytest.fixture
+def coordinator(hass) -> PhilipsPetsSeriesDataUpdateCoordinator:
+    return PhilipsPetsSeriesDataUpdateCoordinator(hass, SimpleNamespace())
+
+
+@pytest.fixture
+def refreshes(coordinator, monkeypatch) -> list[tuple[str, str | None]]:
+    calls = []
+
+    async def record(device_id, event_type=None):
+        calls.append((device_id, event_type))
+
+    monkeypatch.setattr(coordinator, "async_refresh_device", record)
+    return calls
+
+
+async def advance(hass, seconds: float) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=seconds))
+    await hass.async_block_till_done()
+
+
+async def test_burst_of_writes_is_confirmed_by_one_read(hass, coordinator, refreshes) -> None:
+    for _ in range(3):
+        coordinator.async_schedule_device_refresh("dev-1")
+    await advance(hass, CONFIRM_DELAY.total_seconds() + 1)
+    assert refreshes == [("dev-1", None)]
+
+
+async def test_devices_are_refreshed_separately(hass, coordinator, refreshes) -> None:
+    coordinator.async_schedule_device_refresh("dev-1")
+    coordinator.async_schedule_device_refresh("dev-2")
+    await advance(hass, CONFIRM_DELAY.total_seconds() + 1)
+    assert sorted(refreshes) == [("dev-1", None), ("dev-2", None)]
+
+
+async def test_merge_keeps_the_feed_event_delay(hass, coordinator, refreshes) -> None:
+    coordinator.async_schedule_device_refresh("dev-1", FEED_EVENT, FEED_EVENT_DELAY)
+    # A write right after the feed must not pull the event fetch forward.
+    coordinator.async_schedule_device_refresh("dev-1")
+
+    await advance(hass, CONFIRM_DELAY.total_seconds() + 1)
+    assert refreshes == []
+    await advance(hass, FEED_EVENT_DELAY.total_seconds() + 1)
+    assert refreshes == [("dev-1", FEED_EVENT)]
+
+
+async def test_merge_keeps_a_later_write_delay(hass, coordinator, refreshes) -> None:
+    coordinator.async_schedule_device_refresh("dev-1", delay=timedelta(seconds=1))
+    coordinator.async_schedule_device_refresh("dev-1", FEED_EVENT, FEED_EVENT_DELAY)
+
+    await advance(hass, 2)
+    assert refreshes == []
+    await advance(hass, FEED_EVENT_DELAY.total_seconds() + 1)
+    assert refreshes == [("dev-1", FEED_EVENT)]
+
+
+async def test_refresh_errors_are_logged_not_raised(coordinator, monkeypatch, caplog) -> None:
+    monkeypatch.setattr(
+        coordinator, "_async_refresh_device", AsyncMock(side_effect=RuntimeError("boom"))
+    )
+    with caplog.at_level(logging.ERROR):
+        await coordinator.async_refresh_device("dev-1")
+    assert "Error refreshing device dev-1" in caplog.text
+
+
+async def test_refresh_auth_failure_requests_a_full_refresh(coordinator, monkeypatch) -> None:
+    monkeypatch.setattr(
+        coordinator, "_async_refresh_device", AsyncMock(side_effect=ConfigEntryAuthFailed)
+    )
+    request = AsyncMock()
+    monkeypatch.setattr(coordinator, "async_request_refresh", request)
+
+    await coordinator.async_refresh_device("dev-1")
+
+    request.assert_awaited_once()
@@ -0,0 +1,94 @@
+"""Tests for the datapoint status decoder."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.philips_pet_series.datapoints import (
+    EMPTY_STATUS,
+    SCHEMA,
+    feed_datapoint,
+)
+
+
+def test_numeric_ids_and_dp_codes_read_the_same_slot() -> None:
+    status = SCHEMA.decode({"231": 80})
+    assert status["231"] == 80
+    assert status["device_volume"] == 80
+    assert status.at(SCHEMA.slot("device_volume")) == 80
+    assert SCHEMA.reported(status, "231")
+    assert not SCHEMA.reported(status, "privacy_mode")
+
+
+def test_unreported_datapoints_are_missing_not_defaulted() -> None:
+    status = SCHEMA.decode({"231": 80})
+    assert "105" not in status
+    assert status.get("privacy_mode") is None
+    assert status.at(SCHEMA.slot("privacy_mode"), "unset") == "unset"
+    with pytest.raises(KeyError):
+        status["privacy_mode"]
+
+
+def test_numeric_id_wins_over_its_dp_code() -> None:
+    status = SCHEMA.decode({"device_volume": 10, "231": 80})
+    assert status["device_volume"] == 80
+
+
+def test_nested_dps_as_dict_or_json_string() -> None:
+    assert SCHEMA.decode({"dps": {"105": True}})["privacy_mode"] is True
+    assert SCHEMA.decode({"dps": json.dumps({"105": True})})["privacy_mode"] is True
+    with pytest.raises(ValueError):
+        SCHEMA.decode({"dps": "{not json"})
+
+
+def test_lan_list_shape() -> None:
+    status = SCHEMA.decode([{"code": "nightvision", "value": "2"}, {"value": "ignored"}])
+    assert status["108"] == "2"
+
+
+def test_unknown_datapoints_are_kept_as_extras() -> None:
+    status = SCHEMA.decode({"231": 80, "999": "x"})
+    assert status["999"] == "x"
+    assert dict(status.extras) == {"999": "x"}
+    assert dict(status) == {"231": 80, "device_volume": 80, "999": "x"}
+    assert len(status) == 3
+
+
+def test_empty_payloads_decode_to_the_shared_empty_status() -> None:
+    assert SCHEMA.decode({}) is EMPTY_STATUS
+    assert SCHEMA.decode(None) is EMPTY_STATUS
+    assert len(EMPTY_STATUS) == 0
+
+
+def test_dp101_feeders_report_quick_feed_as_feed_num() -> None:
+    assert SCHEMA.decode({"101": 3}, "PAW3300")["feed_num"] == 3
+    assert "feed_num" not in SCHEMA.decode({"101": 3}, "PAW5320")
+    assert feed_datapoint("PAW3320") == "101"
+    assert feed_datapoint("PAW5320") == "201"
+    assert feed_datapoint(None) == "201"
+
+
+def test_apply_lays_a_partial_report_on_top() -> None:
+    status = SCHEMA.decode({"231": 80, "105": False, "999": "x"})
+    updated = SCHEMA.apply(status, {"105": True, "998": "y"})
+
+    assert updated["device_volume"] == 80
+    assert updated["privacy_mode"] is True
+    assert dict(updated.extras) == {"999": "x", "998": "y"}
+    assert status["privacy_mode"] is False
+
+
+def test_equality_compares_values_and_extras() -> None:
+    assert SCHEMA.decode({"231": 80}) == SCHEMA.decode({"device_volume": 80})
+    assert SCHEMA.decode({"231": 80}) != SCHEMA.decode({"231": 81})
+    assert SCHEMA.decode({"231": 80}) == {"231": 80, "device_volume": 80}
+
+
+def test_payload_round_trip() -> None:
+    status = SCHEMA.decode({"231": 80, "105": True, "999": "x"})
+    payload = status.as_payload()
+
+    assert payload == {"device_volume": 80, "privacy_mode": True, "999": "x"}
+    assert SCHEMA.decode(payload) == status
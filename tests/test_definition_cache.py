@@ -0,0 +1,70 @@
+"""Tests for the device definition cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.philips_pet_series.definition_cache import (
+    DEFINITION_TTL,
+    DefinitionCache,
+    firmware_signal,
+    storage_key,
+)
+
+DEFINITION = {"name": "Feeder", "schema": "[]", "localKey": "key-1"}
+
+
+def test_firmware_signal_is_independent_of_order() -> None:
+    device = [{"type": 9, "currentVersion": "1.2"}]
+    product = [{"type": 0, "current_version": "2.0"}, {"type": 1}]
+
+    assert firmware_signal(device, product) == "0:2.0,9:1.2"
+    assert firmware_signal(product, device) == "0:2.0,9:1.2"
+    assert firmware_signal([], None, [{"type": 1}]) is None
+
+
+async def test_a_firmware_change_drops_the_definition(hass) -> None:
+    cache = DefinitionCache(hass)
+    cache.store("tuya-1", DEFINITION, "9:1.2")
+
+    assert not cache.check_signal("tuya-1", "9:1.2")
+    assert not cache.check_signal("tuya-1", None)
+    assert cache.get("tuya-1") == DEFINITION
+
+    assert cache.check_signal("tuya-1", "9:1.3")
+    assert cache.get("tuya-1") is None
+
+
+async def test_a_definition_without_a_signal_adopts_the_first_one(hass) -> None:
+    cache = DefinitionCache(hass)
+    cache.store("tuya-1", DEFINITION, None)
+
+    assert not cache.check_signal("tuya-1", "9:1.2")
+    assert cache.check_signal("tuya-1", "9:1.3")
+
+
+async def test_definitions_expire(hass, freezer) -> None:
+    cache = DefinitionCache(hass)
+    cache.store("tuya-1", DEFINITION, "9:1.2")
+
+    freezer.tick(DEFINITION_TTL + timedelta(minutes=1))
+
+    assert cache.get("tuya-1") is None
+
+
+async def test_stored_definitions_leave_out_the_local_key(hass, hass_storage) -> None:
+    cache = DefinitionCache(hass, "entry-1")
+    cache.store("tuya-1", DEFINITION, "9:1.2")
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=1))
+    await hass.async_block_till_done()
+
+    stored = hass_storage[storage_key("entry-1")]["data"]
+    assert "localKey" not in stored["tuya-1"]["definition"]
+
+    restored = DefinitionCache(hass, "entry-1")
+    await restored.async_load()
+    assert restored.get("tuya-1") == {"name": "Feeder", "schema": "[]"}
+    assert not restored.check_signal("tuya-1", "9:1.2")
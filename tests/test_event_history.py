@@ -0,0 +1,217 @@
+"""Tests for the retained event history."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from homeassistant.helpers.storage import Store
+
+from custom_components.philips_pet_series.event_history import (
+    EventHistory,
+    EventIndex,
+    async_remove_journal,
+    storage_key,
+)
+
+HOME = "home-1"
+RETAIN_FROM = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def at(hours: float) -> datetime:
+    return RETAIN_FROM + timedelta(hours=hours)
+
+
+def event(event_id: str, hours: float, type_: str = "meal_dispensed", device_id=None) -> dict:
+    return {
+        "id": event_id,
+        "type": type_,
+        "time": at(hours).isoformat(),
+        "device_id": device_id,
+    }
+
+
+def ids(history: EventHistory, type_: str = "meal_dispensed") -> list[str]:
+    return [record.id for record in history.events_by_type(HOME, [type_])[type_]]
+
+
+def test_first_fetch_starts_at_the_retention_window() -> None:
+    history = EventHistory(None)
+    assert history.window_start(HOME, RETAIN_FROM) == RETAIN_FROM
+
+
+def test_next_fetch_starts_an_overlap_before_the_high_water_mark() -> None:
+    history = EventHistory(None, overlap=timedelta(hours=1))
+    history.merge(HOME, [event("a", 2)], RETAIN_FROM, at(10), RETAIN_FROM)
+
+    assert history.high_water(HOME) == at(10)
+    assert history.window_start(HOME, RETAIN_FROM) == at(9)
+    # Never before the retention window.
+    assert history.window_start(HOME, at(9.5)) == at(9.5)
+
+
+def test_fetched_window_replaces_what_was_cached_for_it() -> None:
+    history = EventHistory(None)
+    history.merge(
+        HOME, [event("old", 1), event("cancelled", 8)], RETAIN_FROM, at(10), RETAIN_FROM
+    )
+    history.merge(HOME, [event("new", 9)], at(5), at(12), RETAIN_FROM)
+
+    # "old" predates the fetched window and is kept; "cancelled" fell inside
+    # it and is gone upstream, so it is gone here too.
+    assert ids(history) == ["old", "new"]
+
+
+def test_events_older_than_the_retention_window_are_dropped() -> None:
+    history = EventHistory(None)
+    history.merge(HOME, [event("a", 1), event("b", 30)], RETAIN_FROM, at(31), RETAIN_FROM)
+    history.merge(HOME, [], at(31), at(32), retain_from=at(24))
+    assert ids(history) == ["b"]
+
+
+def test_type_limited_fetch_keeps_other_types_and_the_mark() -> None:
+    history = EventHistory(None)
+    history.merge(
+        HOME,
+        [event("meal", 2), event("motion", 3, "motion_detected")],
+        RETAIN_FROM,
+        at(10),
+        RETAIN_FROM,
+    )
+    history.merge(HOME, [], at(1), at(11), RETAIN_FROM, types={"motion_detected"})
+
+    assert ids(history) == ["meal"]
+    assert ids(history, "motion_detected") == []
+    assert history.high_water(HOME) == at(10)
+
+
+def test_events_by_type_is_oldest_first() -> None:
+    history = EventHistory(None)
+    history.merge(
+        HOME, [event("late", 5), event("early", 1), event("mid", 3)], RETAIN_FROM, at(6), RETAIN_FROM
+    )
+    assert ids(history) == ["early", "mid", "late"]
+
+
+def test_retain_homes_drops_other_homes_and_their_marks() -> None:
+    history = EventHistory(None)
+    history.merge(HOME, [event("a", 1)], RETAIN_FROM, at(2), RETAIN_FROM)
+    history.merge("home-2", [event("b", 1)], RETAIN_FROM, at(2), RETAIN_FROM)
+
+    history.retain_homes({HOME})
+
+    assert ids(history) == ["a"]
+    assert history.high_water("home-2") is None
+    assert history.events_by_type("home-2", ["meal_dispensed"]) == {"meal_dispensed": []}
+
+
+async def test_journal_round_trip(hass) -> None:
+    history = EventHistory(hass, "entry-1")
+    history.merge(HOME, [event("a", 1), event("b", 30)], RETAIN_FROM, at(31), RETAIN_FROM)
+    await history.async_save()
+
+    restored = EventHistory(hass, "entry-1")
+    await restored.async_load()
+    assert ids(restored) == ["a", "b"]
+    assert restored.high_water(HOME) == at(31)
+
+
+async def test_journals_are_kept_per_entry(hass) -> None:
+    first = EventHistory(hass, "entry-1")
+    first.merge(HOME, [event("a", 1)], RETAIN_FROM, at(2), RETAIN_FROM)
+    await first.async_save()
+    second = EventHistory(hass, "entry-2")
+    second.merge("home-2", [event("b", 1)], RETAIN_FROM, at(2), RETAIN_FROM)
+    second.retain_homes({"home-2"})
+    await second.async_save()
+
+    restored = EventHistory(hass, "entry-1")
+    await restored.async_load()
+    assert ids(restored) == ["a"]
+    assert restored.high_water(HOME) == at(2)
+
+
+async def test_merge_during_a_save_reaches_the_journal(hass, monkeypatch) -> None:
+    history = EventHistory(hass, "entry-1")
+    history.merge(HOME, [event("a", 1)], RETAIN_FROM, at(2), RETAIN_FROM)
+
+    gate = asyncio.Event()
+    save = Store.async_save
+
+    async def held_save(self, data):
+        await gate.wait()
+        await save(self, data)
+
+    monkeypatch.setattr(Store, "async_save", held_save)
+    saving = asyncio.create_task(history.async_save())
+    await asyncio.sleep(0)
+    # A new day's segment turns up while the first save waits on disk.
+    history.merge(HOME, [event("b", 30)], at(20), at(31), RETAIN_FROM)
+    gate.set()
+    await saving
+    await history.async_save()
+
+    restored = EventHistory(hass, "entry-1")
+    await restored.async_load()
+    assert ids(restored) == ["a", "b"]
+    assert restored.high_water(HOME) == at(31)
+
+
+async def test_remove_journal_deletes_segments_and_manifest(hass, hass_storage) -> None:
+    history = EventHistory(hass, "entry-1")
+    history.merge(HOME, [event("a", 1), event("b", 30)], RETAIN_FROM, at(31), RETAIN_FROM)
+    await history.async_save()
+    assert any(key.startswith(storage_key("entry-1")) for key in hass_storage)
+
+    await async_remove_journal(hass, "entry-1")
+
+    assert not any(key.startswith(storage_key("entry-1")) for key in hass_storage)
+
+
+def build_index(records_by_type: dict, device_ids=("dev-1", "dev-2")) -> EventIndex:
+    history = EventHistory(None)
+    history.merge(
+        HOME,
+        [record for records in records_by_type.values() for record in records],
+        RETAIN_FROM,
+        at(48),
+        RETAIN_FROM,
+    )
+    devices = [SimpleNamespace(id=device_id) for device_id in device_ids]
+    return EventIndex.build(
+        {HOME: history.events_by_type(HOME, list(records_by_type))}, {HOME: devices}
+    )
+
+
+def test_index_files_events_by_device() -> None:
+    index = build_index(
+        {"meal_dispensed": [event("a", 1, device_id="dev-1"), event("b", 2, device_id="dev-2")]}
+    )
+    assert [record.id for record in index.events(HOME, "meal_dispensed", "dev-1")] == ["a"]
+    assert index.latest(HOME, "meal_dispensed", "dev-2").id == "b"
+    assert index.latest_time(HOME, "meal_dispensed", "dev-2") == at(2)
+    assert index.latest(HOME, "motion_detected", "dev-1") is None
+
+
+def test_index_shares_deviceless_events_across_the_home() -> None:
+    index = build_index(
+        {"meal_dispensed": [event("own", 1, device_id="dev-1"), event("shared", 2)]}
+    )
+    assert [record.id for record in index.events(HOME, "meal_dispensed", "dev-1")] == [
+        "own",
+        "shared",
+    ]
+    assert index.latest(HOME, "meal_dispensed", "dev-2").id == "shared"
+
+
+def test_index_changes_names_the_changed_types_per_device() -> None:
+    before = build_index({"meal_dispensed": [event("a", 1, device_id="dev-1")]})
+    after = build_index(
+        {
+            "meal_dispensed": [event("a", 1, device_id="dev-1")],
+            "motion_detected": [event("m", 2, "motion_detected", device_id="dev-2")],
+        }
+    )
+    assert after.changes(before) == {"dev-2": {"motion_detected"}}
+    assert after.changes(after) == {}
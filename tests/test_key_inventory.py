@@ -0,0 +1,93 @@
+"""Tests for the local key inventory."""
+
+from __future__ import annotations
+
+import json
+
+from custom_components.philips_pet_series.key_inventory import KeyInventory, storage_key
+
+RECORDS = [
+    {"device_id": "tuya-1", "local_key": "key-1", "gw_id": "tuya-1", "ip": "192.0.2.1"},
+    {"device_id": "tuya-2", "local_key": "key-2"},
+    {"device_id": "camera", "local_key": ""},
+]
+
+
+class FakeReader:
+    """Answers ``local_keys`` with ``records``, or raises ``error``."""
+
+    def __init__(self, records=RECORDS) -> None:
+        self.records = records
+        self.error: Exception | None = None
+        self.walks = 0
+
+    async def local_keys(self, refresh: bool = False) -> list[dict]:
+        self.walks += 1
+        if self.error is not None:
+            raise self.error
+        return self.records
+
+
+async def test_a_covering_inventory_is_not_walked_again(hass) -> None:
+    reader = FakeReader()
+    inventory = KeyInventory(hass, reader)
+
+    assert await inventory.async_ensure(["tuya-1", "tuya-2", "camera"])
+    assert not await inventory.async_ensure(["tuya-1", "camera"])
+
+    assert reader.walks == 1
+    assert inventory.get("tuya-1").local_key == "key-1"
+    assert inventory.get("camera") is None
+
+
+async def test_an_unknown_device_walks_again(hass) -> None:
+    reader = FakeReader()
+    inventory = KeyInventory(hass, reader)
+    await inventory.async_ensure(["tuya-1"])
+
+    assert await inventory.async_ensure(["tuya-3"])
+    assert reader.walks == 2
+
+
+async def test_a_rejected_key_walks_again(hass) -> None:
+    reader = FakeReader()
+    inventory = KeyInventory(hass, reader)
+    await inventory.async_ensure(["tuya-1"])
+
+    inventory.invalidate("tuya-1")
+
+    assert inventory.get("tuya-1") is None
+    assert await inventory.async_ensure(["tuya-1"])
+    assert inventory.get("tuya-1").local_key == "key-1"
+
+
+async def test_a_failed_walk_keeps_the_known_keys(hass) -> None:
+    reader = FakeReader()
+    inventory = KeyInventory(hass, reader)
+    await inventory.async_ensure(["tuya-1"])
+    reader.error = RuntimeError("offline")
+
+    assert not await inventory.async_ensure(["tuya-3"])
+    assert inventory.get("tuya-1").local_key == "key-1"
+
+
+async def test_the_stored_inventory_is_sealed_and_restored(hass, hass_storage) -> None:
+    await KeyInventory(hass, FakeReader(), "entry-1").async_ensure(["tuya-1", "camera"])
+
+    stored = json.dumps(hass_storage[storage_key("entry-1")]["data"])
+    assert "key-1" not in stored
+
+    reader = FakeReader()
+    restored = KeyInventory(hass, reader, "entry-1")
+    assert not await restored.async_ensure(["tuya-1", "camera"])
+    assert reader.walks == 0
+    assert restored.get("tuya-1").ip == "192.0.2.1"
+
+
+async def test_another_entry_cannot_open_the_inventory(hass, hass_storage) -> None:
+    await KeyInventory(hass, FakeReader(), "entry-1").async_ensure(["tuya-1"])
+    hass_storage[storage_key("entry-2")] = hass_storage[storage_key("entry-1")]
+
+    reader = FakeReader()
+    assert await KeyInventory(hass, reader, "entry-2").async_ensure(["tuya-1"])
+    assert reader.walks == 1
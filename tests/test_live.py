@@ -0,0 +1,127 @@
+"""Tests for live datapoint updates over the mobile MQTT channel."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+import pytest
+
+from custom_components.philips_pet_series import live
+from custom_components.philips_pet_series.live import LiveUpdates, decode_message, report_dps
+
+LOCAL_KEY = "0123456789abcdef"
+REPORT = {"protocol": 4, "data": {"devId": "tuya-1", "dps": {"231": 80}}}
+
+
+class FakeCoordinator:
+    def __init__(self) -> None:
+        self.keys: dict[str, tuple[str, str]] = {}
+        self.listeners: list = []
+        self.applied: list[tuple[str, dict]] = []
+        self.live: list[bool] = []
+
+    def local_keys(self) -> dict[str, tuple[str, str]]:
+        return self.keys
+
+    def async_add_listener(self, listener):
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def async_set_live(self, live: bool) -> None:
+        self.live.append(live)
+
+    def async_apply_dps(self, device_id: str, dps: dict) -> None:
+        self.applied.append((device_id, dps))
+
+    def update(self) -> None:
+        for listener in list(self.listeners):
+            listener()
+
+
+def _encrypt(plain: bytes) -> bytes:
+    padding = 16 - len(plain) % 16
+    encryptor = Cipher(algorithms.AES(LOCAL_KEY.encode()), modes.ECB()).encryptor()
+    return encryptor.update(plain + bytes([padding]) * padding) + encryptor.finalize()
+
+
+@pytest.fixture
+def coordinator() -> FakeCoordinator:
+    return FakeCoordinator()
+
+
+@pytest.fixture
+def sessions(monkeypatch) -> list[list[str]]:
+    attempts = []
+
+    async def refused(self, topics) -> None:
+        attempts.append(topics)
+        raise OSError("connection refused")
+
+    monkeypatch.setattr(LiveUpdates, "_async_session", refused)
+    return attempts
+
+
+async def _until(condition, timeout: float = 1.0) -> None:
+    async with asyncio.timeout(timeout):
+        while not condition():
+            await asyncio.sleep(0.01)
+
+
+def test_decodes_plain_and_encrypted_reports() -> None:
+    body = json.dumps(REPORT).encode()
+    framed = b"2.2" + bytes(12) + _encrypt(body)
+
+    assert decode_message(body, None) == REPORT
+    assert decode_message(framed, LOCAL_KEY) == REPORT
+    assert decode_message(framed, None) is None
+    assert decode_message(framed, "fedcba9876543210") is None
+
+
+def test_only_dp_reports_are_read() -> None:
+    assert report_dps(REPORT) == ("tuya-1", {"231": 80})
+    assert report_dps({"protocol": 5, "data": REPORT["data"]}) is None
+    assert report_dps({"protocol": 4, "data": {"devId": "tuya-1"}}) is None
+
+
+async def test_reports_are_applied_to_their_device(hass, coordinator) -> None:
+    coordinator.keys = {"tuya-1": ("dev-1", LOCAL_KEY), "tuya-2": ("dev-2", LOCAL_KEY)}
+    updates = LiveUpdates(hass, None, coordinator)
+    body = json.dumps(REPORT).encode()
+
+    updates._handle_message("smart/mb/in/tuya-1", body)
+    updates._handle_message("smart/mb/in/tuya-2", body)
+    updates._handle_message("smart/mb/in/unknown", body)
+
+    assert coordinator.applied == [("dev-1", {"231": 80})]
+
+
+async def test_no_keys_waits_without_backing_off(hass, coordinator, sessions) -> None:
+    updates = LiveUpdates(hass, None, coordinator)
+    updates.async_start()
+    try:
+        coordinator.update()
+        await asyncio.sleep(0.05)
+        assert sessions == []
+        assert updates._backoff == live._BACKOFF_START
+
+        coordinator.keys = {"tuya-1": ("dev-1", LOCAL_KEY)}
+        coordinator.update()
+        await _until(lambda: sessions)
+        assert sessions == [["smart/mb/in/tuya-1"]]
+    finally:
+        await updates.async_stop()
+
+
+async def test_failed_sessions_back_off(hass, coordinator, sessions) -> None:
+    coordinator.keys = {"tuya-1": ("dev-1", LOCAL_KEY)}
+    updates = LiveUpdates(hass, None, coordinator)
+    updates._backoff = 0.01
+    updates.async_start()
+    try:
+        await _until(lambda: len(sessions) >= 3)
+        assert updates._backoff >= 0.04
+        assert coordinator.live[:2] == [False, False]
+    finally:
+        await updates.async_stop()
@@ -0,0 +1,94 @@
+"""Tests for the per-dataset refresh tiers."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+from custom_components.philips_pet_series.schedule import (
+    DEFAULT_TIERS,
+    TIER_EVENTS,
+    TIER_FIRMWARE,
+    TIER_STATUS,
+    RefreshSchedule,
+)
+
+TIERS = {
+    TIER_STATUS: (timedelta(minutes=5), timedelta(minutes=30)),
+    TIER_EVENTS: (timedelta(minutes=15), timedelta(hours=1)),
+    TIER_FIRMWARE: (timedelta(hours=6), timedelta(days=2)),
+}
+
+
+def test_default_base_interval_keeps_the_five_minute_poll() -> None:
+    assert RefreshSchedule().base_interval == timedelta(minutes=5)
+    assert set(RefreshSchedule().tiers) == set(DEFAULT_TIERS)
+
+
+def test_everything_is_due_before_the_first_fetch() -> None:
+    schedule = RefreshSchedule(TIERS)
+    assert schedule.due(0) == set(TIERS)
+    assert schedule.expired(TIER_STATUS, 0)
+
+
+def test_tiers_come_due_on_their_own_interval() -> None:
+    schedule = RefreshSchedule(TIERS)
+    for name in TIERS:
+        schedule.mark_success(name, 0)
+
+    assert schedule.due(60) == set()
+    assert schedule.due(300) == {TIER_STATUS}
+    assert schedule.due(900) == {TIER_STATUS, TIER_EVENTS}
+    # A few seconds of timer jitter must not skip a whole cycle.
+    assert schedule.due(298) == {TIER_STATUS}
+
+
+def test_staleness_budget() -> None:
+    schedule = RefreshSchedule(TIERS)
+    schedule.mark_success(TIER_STATUS, 0)
+    assert not schedule.expired(TIER_STATUS, 30 * 60)
+    assert schedule.expired(TIER_STATUS, 30 * 60 + 1)
+
+
+def test_request_makes_a_tier_due_but_keeps_its_budget() -> None:
+    schedule = RefreshSchedule(TIERS)
+    schedule.mark_success(TIER_FIRMWARE, 0)
+    schedule.request(TIER_FIRMWARE)
+
+    assert TIER_FIRMWARE in schedule.due(1)
+    assert not schedule.expired(TIER_FIRMWARE, 1)
+
+    schedule.mark_success(TIER_FIRMWARE, 2)
+    assert TIER_FIRMWARE not in schedule.due(3)
+
+
+def test_request_without_names_requests_every_tier() -> None:
+    schedule = RefreshSchedule(TIERS)
+    for name in TIERS:
+        schedule.mark_success(name, 0)
+    schedule.request()
+    assert schedule.due(1) == set(TIERS)
+
+
+def test_restore_backdates_the_tier_and_keeps_it_due() -> None:
+    schedule = RefreshSchedule(TIERS)
+    schedule.restore(TIER_STATUS, age=20 * 60)
+    now = time.monotonic()
+
+    assert TIER_STATUS in schedule.due(now)
+    assert not schedule.expired(TIER_STATUS, now)
+    assert schedule.expired(TIER_STATUS, now + 11 * 60)
+
+
+def test_retune_changes_timing_and_restores_the_default() -> None:
+    schedule = RefreshSchedule(TIERS)
+    schedule.mark_success(TIER_STATUS, 0)
+
+    schedule.retune(TIER_STATUS, (timedelta(minutes=15), timedelta(hours=1)))
+    assert schedule.base_interval == timedelta(minutes=15)
+    assert TIER_STATUS not in schedule.due(300)
+    assert not schedule.expired(TIER_STATUS, 45 * 60)
+
+    schedule.retune(TIER_STATUS)
+    assert schedule.base_interval == timedelta(minutes=5)
+    assert TIER_STATUS in schedule.due(300)
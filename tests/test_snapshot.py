@@ -0,0 +1,106 @@
+"""Tests for the per-refresh snapshot."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from custom_components.philips_pet_series.datapoints import EMPTY_STATUS, SCHEMA
+from custom_components.philips_pet_series.event_history import EventIndex
+from custom_components.philips_pet_series.snapshot import (
+    ALL_CHANGED,
+    EMPTY_SNAPSHOT,
+    Snapshot,
+)
+
+HOME = SimpleNamespace(id="home-1", name="Home")
+FEEDER = SimpleNamespace(id="dev-1", name="Feeder", product_ctn="PAW5320")
+CAMERA = SimpleNamespace(id="dev-2", name="Camera", product_ctn="PAW3300")
+
+
+def build(device_data=None, devices=(FEEDER, CAMERA), meals=(), homes=(HOME,)) -> Snapshot:
+    return Snapshot.build(
+        homes=list(homes),
+        home_devices={HOME.id: list(devices)},
+        device_data=device_data or {},
+        meals=list(meals),
+        invites={},
+        events=EventIndex(),
+        event_types=["meal_dispensed"],
+        local_status=None,
+        discovery_config=None,
+    )
+
+
+def test_build_reaches_each_device_by_id() -> None:
+    snapshot = build(
+        {
+            FEEDER.id: {"status": {"feed_num": 2}, "settings": {"tuya_status": {}}},
+        },
+        meals=[SimpleNamespace(id="m1", device_id=FEEDER.id)],
+    )
+
+    feeder = snapshot.device(FEEDER.id)
+    assert feeder.home is HOME
+    assert feeder.device is FEEDER
+    assert feeder.status["feed_num"] == 2
+    assert [meal.id for meal in feeder.meals] == ["m1"]
+    assert snapshot.devices == (FEEDER, CAMERA)
+    assert snapshot.device("missing") is None
+
+
+def test_absent_device_data_is_empty_not_made_up() -> None:
+    camera = build().device(CAMERA.id)
+    assert camera.status is EMPTY_STATUS
+    assert dict(camera.settings) == {}
+    assert camera.definition is None
+    assert camera.ota_records == ()
+
+
+def test_raw_status_that_does_not_decode_reads_as_empty() -> None:
+    snapshot = build({FEEDER.id: {"status": {"dps": "{not json"}}})
+    assert snapshot.device(FEEDER.id).status is EMPTY_STATUS
+
+
+def test_no_previous_snapshot_changes_everything() -> None:
+    assert build().changes(None) is ALL_CHANGED
+    assert build().changes(EMPTY_SNAPSHOT) is ALL_CHANGED
+
+
+def test_device_list_change_changes_everything() -> None:
+    assert build(devices=(FEEDER,)).changes(build()) is ALL_CHANGED
+
+
+def test_identical_refresh_changes_nothing() -> None:
+    data = {FEEDER.id: {"status": {"feed_num": 2}, "settings": {"a": 1}}}
+    assert build(data).changes(build(data)).devices == {}
+
+
+def test_changes_name_the_changed_datapoints() -> None:
+    before = build({FEEDER.id: {"status": {"201": 2, "231": 50}}})
+    after = build({FEEDER.id: {"status": {"201": 3, "231": 50}}})
+
+    changes = after.changes(before)
+    change = changes.device(FEEDER.id)
+    assert not changes.everything
+    assert change.parts == {"status"}
+    # A datapoint answers to both its numeric id and its dpCode.
+    assert change.dps == {"201", "feed_num"}
+    assert changes.device(CAMERA.id) is None
+
+
+def test_changes_name_other_changed_fields() -> None:
+    before = build({FEEDER.id: {"settings": {"a": 1}}})
+    after = build({FEEDER.id: {"settings": {"a": 2}}})
+    assert after.changes(before).device(FEEDER.id).parts == {"settings"}
+
+
+def test_with_status_replaces_one_device() -> None:
+    snapshot = build({FEEDER.id: {"status": {"201": 2}}})
+    updated = snapshot.with_status(
+        FEEDER.id, SCHEMA.apply(snapshot.device(FEEDER.id).status, {"201": 4})
+    )
+
+    assert updated.device(FEEDER.id).status["feed_num"] == 4
+    assert snapshot.device(FEEDER.id).status["feed_num"] == 2
+    assert updated.device(CAMERA.id) is snapshot.device(CAMERA.id)
+    assert updated.changes(snapshot).device(FEEDER.id).dps == {"201", "feed_num"}
@@ -0,0 +1,95 @@
+"""Tests for the stored snapshot a restart sets entities up from."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import json
+
+import pytest
+
+from custom_components.philips_pet_series.datapoints import SCHEMA
+from custom_components.philips_pet_series.schedule import (
+    TIER_FIRMWARE,
+    TIER_INVENTORY,
+    TIER_MEALS,
+    TIER_SETTINGS,
+    TIER_STATUS,
+)
+# Through the integration, which registers the ``tuya_mobile`` package that
+# petsseries imports.
+from custom_components.philips_pet_series.snapshot_store import (
+    RESTORED_TIERS,
+    Device,
+    Home,
+    Meal,
+    dump_datasets,
+    restore_datasets,
+)
+
+HOME = Home(id="home-1", name="Home")
+FEEDER = Device(id="dev-1", name="Feeder", product_ctn="PAW5320")
+MEAL = Meal(
+    id="meal-1",
+    name="Breakfast",
+    portion_amount=2,
+    feed_time="07:30",
+    repeat_days=[1, 2, 3],
+    device_id=FEEDER.id,
+    enabled=True,
+    url="https://example.invalid/meal-1",
+)
+
+
+def datasets() -> dict[str, dict]:
+    return {
+        TIER_INVENTORY: {"homes": [HOME], ("devices", HOME.id): [FEEDER]},
+        TIER_STATUS: {FEEDER.id: SCHEMA.decode({"231": 80}, FEEDER.product_ctn)},
+        TIER_SETTINGS: {("settings", FEEDER.id): {"volume": 80}, ("full", FEEDER.id): {}},
+        TIER_FIRMWARE: {FEEDER.id: ([{"currentVersion": "1.2"}], [])},
+        TIER_MEALS: {HOME.id: [MEAL]},
+    }
+
+
+def round_trip(source: dict[str, dict]) -> tuple[dict[str, dict], float]:
+    stored = json.loads(json.dumps(dump_datasets(source)))
+    restored = {tier: {} for tier in RESTORED_TIERS}
+    return restored, restore_datasets(stored, restored)
+
+
+def test_a_snapshot_restores_what_it_dumped() -> None:
+    restored, _ = round_trip(datasets())
+
+    assert restored[TIER_INVENTORY] == datasets()[TIER_INVENTORY]
+    assert restored[TIER_STATUS][FEEDER.id].as_payload() == (
+        datasets()[TIER_STATUS][FEEDER.id].as_payload()
+    )
+    assert restored[TIER_SETTINGS] == {("settings", FEEDER.id): {"volume": 80}}
+    assert restored[TIER_FIRMWARE] == datasets()[TIER_FIRMWARE]
+    assert restored[TIER_MEALS] == {HOME.id: [MEAL]}
+
+
+def test_restore_reports_the_snapshot_age(freezer) -> None:
+    stored = json.loads(json.dumps(dump_datasets(datasets())))
+    freezer.tick(timedelta(minutes=5))
+
+    assert restore_datasets(stored, {tier: {} for tier in RESTORED_TIERS}) == 300
+
+
+def test_unknown_model_fields_are_ignored() -> None:
+    stored = json.loads(json.dumps(dump_datasets(datasets())))
+    stored["homes"][0]["added_later"] = True
+    restored = {tier: {} for tier in RESTORED_TIERS}
+
+    restore_datasets(stored, restored)
+
+    assert restored[TIER_INVENTORY]["homes"] == [HOME]
+
+
+def test_a_malformed_snapshot_restores_nothing() -> None:
+    stored = json.loads(json.dumps(dump_datasets(datasets())))
+    del stored["meals"]
+    restored = {tier: {} for tier in RESTORED_TIERS}
+
+    with pytest.raises(KeyError):
+        restore_datasets(stored, restored)
+    assert all(not values for values in restored.values())
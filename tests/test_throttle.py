@@ -0,0 +1,109 @@
+"""Tests for the fetch budget."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.philips_pet_series import throttle
+from custom_components.philips_pet_series.throttle import FetchBudget, TokenBucket
+
+
+class FakeClock:
+    """A monotonic clock that only the bucket's sleeps move forward."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        self.hold = False
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        if self.hold:
+            await asyncio.Event().wait()
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    # Only the throttle module's view of time and sleep is replaced; the event
+    # loop keeps the real ones.
+    fake = FakeClock()
+    monkeypatch.setattr(throttle, "time", SimpleNamespace(monotonic=fake.monotonic))
+    monkeypatch.setattr(
+        throttle,
+        "asyncio",
+        SimpleNamespace(Lock=asyncio.Lock, Semaphore=asyncio.Semaphore, sleep=fake.sleep),
+    )
+    return fake
+
+
+def test_rate_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(0, 1)
+
+
+async def test_burst_is_free_then_paced(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=4.0, burst=3)
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+    await bucket.acquire()
+    await bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.25)]
+
+
+async def test_tokens_refill_while_idle_up_to_burst(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=2.0, burst=2)
+    await bucket.acquire()
+    await bucket.acquire()
+    clock.now += 10
+    await bucket.acquire()
+    await bucket.acquire()
+    assert clock.sleeps == []
+    await bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+
+async def test_budget_caps_concurrency() -> None:
+    budget = FetchBudget(concurrency=2, rate=1000.0, burst=100)
+    running = 0
+    peak = 0
+
+    async def fetch() -> None:
+        nonlocal running, peak
+        async with budget:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(fetch() for _ in range(6)))
+    assert peak == 2
+
+
+async def test_budget_frees_slot_when_cancelled_waiting_for_token(
+    clock: FakeClock,
+) -> None:
+    budget = FetchBudget(concurrency=1, rate=1.0, burst=1)
+    async with budget:
+        pass
+
+    clock.hold = True
+    waiting = asyncio.ensure_future(budget.__aenter__())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    clock.hold = False
+    clock.now += 1
+    # The slot taken before the cancelled token wait is free again.
+    await asyncio.wait_for(budget.__aenter__(), 1)
+    await budget.__aexit__(None, None, None)
@@ -0,0 +1,220 @@
+"""Tests for batching and sharing per-device Tuya cloud reads."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.philips_pet_series.throttle import FetchBudget
+from custom_components.philips_pet_series.tuya_cloud import BATCH_WINDOW, TuyaCloudReader
+
+DEFINITION = "thing.m.device.get"
+FIRMWARE = "thing.m.device.upgrade.info"
+
+
+class FakeMobile:
+    """A mobile session answering from ``responses`` and recording each call."""
+
+    def __init__(self, responses: dict | None = None, dps: dict | None = None) -> None:
+        self.responses = responses or {}
+        self.dps = dps or {}
+        self.calls: list[list[tuple]] = []
+        self.status_reads: list[list[str]] = []
+
+    async def call_many(self, calls) -> list:
+        calls = list(calls)
+        self.calls.append(calls)
+        return [self.responses.get((action, payload["devId"])) for action, payload, _ in calls]
+
+    async def get_devices_dps(self, device_ids) -> dict:
+        device_ids = list(device_ids)
+        self.status_reads.append(device_ids)
+        return {device_id: self.dps[device_id] for device_id in device_ids if device_id in self.dps}
+
+
+class FakeClient:
+    """The session half of ``PetsSeriesClient`` the reader shares."""
+
+    def __init__(self, *sessions: FakeMobile) -> None:
+        self.auth = SimpleNamespace(id_token="token")
+        self._tuya_lock = asyncio.Lock()
+        self._tuya_mobile = None
+        self._sessions = list(sessions)
+        self.logins: list[bool] = []
+
+    async def _tuya_login(self, force: bool = False) -> None:
+        self.logins.append(force)
+        self._tuya_mobile = self._sessions.pop(0)
+
+
+def reader(hass, *sessions: FakeMobile) -> tuple[TuyaCloudReader, FakeClient]:
+    client = FakeClient(*sessions)
+    return TuyaCloudReader(hass, client, FetchBudget(4, 100, 10)), client
+
+
+async def test_reads_within_the_window_go_out_as_one_batch(hass) -> None:
+    mobile = FakeMobile(
+        {
+            (DEFINITION, "a"): {"result": {"name": "a"}},
+            (FIRMWARE, "a"): {"result": [{"version": "1.0"}]},
+            (DEFINITION, "b"): {"result": {"name": "b"}},
+        }
+    )
+    cloud, client = reader(hass, mobile)
+
+    results = await asyncio.gather(
+        cloud.device_definition("a"), cloud.firmware_info("a"), cloud.device_definition("b")
+    )
+
+    assert results == [{"name": "a"}, [{"version": "1.0"}], {"name": "b"}]
+    assert [[action for action, _, _ in calls] for calls in mobile.calls] == [
+        [DEFINITION, FIRMWARE, DEFINITION]
+    ]
+    assert client.logins == [False]
+
+
+async def test_statuses_for_several_devices_are_read_from_the_device_lists(hass) -> None:
+    mobile = FakeMobile(
+        {(DEFINITION, "a"): {"result": {"name": "a"}}},
+        dps={"a": {"1": True}, "b": {"1": False}},
+    )
+    cloud, _ = reader(hass, mobile)
+
+    results = await asyncio.gather(
+        cloud.device_status("a"), cloud.device_status("b"), cloud.device_definition("a")
+    )
+
+    assert results == [{"1": True}, {"1": False}, {"name": "a"}]
+    assert mobile.status_reads == [["a", "b"]]
+    assert [[action for action, _, _ in calls] for calls in mobile.calls] == [[DEFINITION]]
+
+
+async def test_a_single_status_is_read_on_its_own(hass) -> None:
+    mobile = FakeMobile({("s.m.dev.dp.get", "a"): {"result": {"dps": {"1": True}}}})
+    cloud, _ = reader(hass, mobile)
+
+    assert await cloud.device_status("a") == {"1": True}
+    assert mobile.status_reads == []
+    assert len(mobile.calls) == 1
+
+
+async def test_a_failed_read_fails_only_its_caller(hass) -> None:
+    mobile = FakeMobile(
+        {
+            (DEFINITION, "a"): {"result": {"name": "a"}},
+            (FIRMWARE, "a"): RuntimeError("no such device"),
+        },
+        dps={"a": {"1": True}},
+    )
+    cloud, _ = reader(hass, mobile)
+
+    definition, firmware, status, missing = await asyncio.gather(
+        cloud.device_definition("a"),
+        cloud.firmware_info("a"),
+        cloud.device_status("a"),
+        cloud.device_status("b"),
+        return_exceptions=True,
+    )
+
+    assert definition == {"name": "a"}
+    assert isinstance(firmware, RuntimeError)
+    assert status == {"1": True}
+    assert isinstance(missing, RuntimeError)
+
+
+async def test_a_failed_batch_logs_in_again_once(hass) -> None:
+    expired = FakeMobile()
+    expired.call_many = _failing("session expired")
+    fresh = FakeMobile({(DEFINITION, "a"): {"result": {"name": "a"}}})
+    cloud, client = reader(hass, expired, fresh)
+
+    assert await cloud.device_definition("a") == {"name": "a"}
+    assert client.logins == [False, True]
+
+
+async def test_a_rate_limited_batch_is_not_retried(hass) -> None:
+    limited = FakeMobile()
+    limited.call_many = _failing("API_LIMIT exceeded")
+    cloud, client = reader(hass, limited, FakeMobile())
+
+    with pytest.raises(RuntimeError, match="LIMIT"):
+        await cloud.device_definition("a")
+    assert client.logins == [False]
+
+
+async def test_identical_reads_share_one_request(hass) -> None:
+    mobile = FakeMobile({(DEFINITION, "a"): {"result": {"name": "a"}}})
+    cloud, _ = reader(hass, mobile)
+
+    first, second = await asyncio.gather(cloud.device_definition("a"), cloud.device_definition("a"))
+
+    assert first == second == {"name": "a"}
+    assert len(mobile.calls) == 1 and len(mobile.calls[0]) == 1
+
+
+async def test_definitions_are_cached_until_forgotten(hass) -> None:
+    mobile = FakeMobile({(DEFINITION, "a"): {"result": {"name": "a"}}})
+    cloud, _ = reader(hass, mobile)
+
+    await cloud.device_definition("a")
+    await cloud.device_definition("a")
+    assert len(mobile.calls) == 1
+
+    cloud.forget("a")
+    await cloud.device_definition("a")
+    assert len(mobile.calls) == 2
+
+
+async def test_webrtc_config_is_shared_in_flight_but_not_cached(hass) -> None:
+    mobile = FakeMobile({("thing.m.ipc.rtc.config.get", "a"): {"result": {"token": "t"}}})
+    cloud, _ = reader(hass, mobile)
+
+    await asyncio.gather(cloud.device_webrtc_config("a"), cloud.device_webrtc_config("a"))
+    await cloud.device_webrtc_config("a")
+
+    assert len(mobile.calls) == 2
+
+
+async def test_a_status_read_does_not_join_one_already_sent(hass) -> None:
+    gate = asyncio.Event()
+    mobile = FakeMobile({("s.m.dev.dp.get", "a"): {"result": {"dps": {"1": True}}}})
+    answer = mobile.call_many
+
+    async def held(calls) -> list:
+        await gate.wait()
+        return await answer(calls)
+
+    mobile.call_many = held
+    cloud, _ = reader(hass, mobile)
+
+    first = asyncio.ensure_future(cloud.device_status("a"))
+    # Let the first read's batch go out and hold it on the wire.
+    await asyncio.sleep(BATCH_WINDOW * 2)
+    second = asyncio.ensure_future(cloud.device_status("a"))
+    await asyncio.sleep(BATCH_WINDOW * 2)
+    gate.set()
+
+    assert await first == await second == {"1": True}
+    assert len(mobile.calls) == 2
+
+
+async def test_one_caller_giving_up_leaves_the_read_for_the_others(hass) -> None:
+    mobile = FakeMobile({(DEFINITION, "a"): {"result": {"name": "a"}}})
+    cloud, _ = reader(hass, mobile)
+
+    impatient = asyncio.ensure_future(cloud.device_definition("a"))
+    patient = asyncio.ensure_future(cloud.device_definition("a"))
+    await asyncio.sleep(0)
+    impatient.cancel()
+
+    assert await patient == {"name": "a"}
+    assert impatient.cancelled()
+
+
+def _failing(message: str):
+    async def call_many(calls) -> list:
+        return [RuntimeError(message) for _ in calls]
+
+    return call_many
@@ -0,0 +1,143 @@
+"""Tests for the Tuya LAN protocol framing and reply matching."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import struct
+import zlib
+
+import pytest
+
+from custom_components.philips_pet_series.tuya_local import (
+    CONTROL,
+    DP_QUERY,
+    STATUS,
+    LocalTuyaDevice,
+    TuyaCodec,
+    TuyaLocalError,
+    _ecb,
+    _pad,
+)
+
+KEY = "0123456789abcdef"
+PAYLOAD = b'{"devId":"abc","dps":{"201":1}}'
+
+
+def reader_for(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.mark.parametrize("version", ["3.3", "3.4", "3.5"])
+@pytest.mark.parametrize("cmd", [CONTROL, DP_QUERY])
+async def test_frames_round_trip(version: str, cmd: int) -> None:
+    frame = TuyaCodec(version, KEY).pack(cmd, PAYLOAD)
+    assert await TuyaCodec(version, KEY).read(reader_for(frame)) == (cmd, PAYLOAD)
+
+
+@pytest.mark.parametrize("version", ["3.3", "3.4", "3.5"])
+async def test_consecutive_frames_on_one_stream(version: str) -> None:
+    codec = TuyaCodec(version, KEY)
+    reader = reader_for(codec.pack(CONTROL, b"{}") + codec.pack(DP_QUERY, PAYLOAD))
+    peer = TuyaCodec(version, KEY)
+    assert await peer.read(reader) == (CONTROL, b"{}")
+    assert await peer.read(reader) == (DP_QUERY, PAYLOAD)
+
+
+def test_sequence_numbers_increase() -> None:
+    codec = TuyaCodec("3.3", KEY)
+    first, second = codec.pack(CONTROL, b"{}"), codec.pack(CONTROL, b"{}")
+    assert struct.unpack_from(">I", first, 4)[0] == 1
+    assert struct.unpack_from(">I", second, 4)[0] == 2
+
+
+async def test_device_frame_return_code_is_stripped() -> None:
+    # Frames from the device lead with a 4-byte return code.
+    body = b"\0\0\0\0" + _ecb(KEY.encode(), _pad(PAYLOAD), True)
+    header = struct.pack(">4I", 0x55AA, 7, STATUS, len(body) + 8)
+    crc = zlib.crc32(header + body) & 0xFFFFFFFF
+    frame = header + body + struct.pack(">II", crc, 0xAA55)
+
+    assert await TuyaCodec("3.3", KEY).read(reader_for(frame)) == (STATUS, PAYLOAD)
+
+
+@pytest.mark.parametrize("version", ["3.4", "3.5"])
+async def test_tampered_frames_fail_authentication(version: str) -> None:
+    frame = bytearray(TuyaCodec(version, KEY).pack(CONTROL, PAYLOAD))
+    frame[24] ^= 0x01
+    with pytest.raises(TuyaLocalError):
+        await TuyaCodec(version, KEY).read(reader_for(bytes(frame)))
+
+
+@pytest.mark.parametrize("version", ["3.4", "3.5"])
+async def test_wrong_key_fails_authentication(version: str) -> None:
+    frame = TuyaCodec(version, KEY).pack(CONTROL, PAYLOAD)
+    with pytest.raises(TuyaLocalError):
+        await TuyaCodec(version, "fedcba9876543210").read(reader_for(frame))
+
+
+@pytest.mark.parametrize("version", ["3.3", "3.5"])
+async def test_bad_prefix_is_rejected(version: str) -> None:
+    frame = b"\xff" * 4 + TuyaCodec(version, KEY).pack(CONTROL, PAYLOAD)[4:]
+    with pytest.raises(TuyaLocalError):
+        await TuyaCodec(version, KEY).read(reader_for(frame))
+
+
+def test_unsupported_version() -> None:
+    with pytest.raises(TuyaLocalError):
+        TuyaCodec("3.1", KEY)
+
+
+class FakeWriter:
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.frames.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def connected_device() -> LocalTuyaDevice:
+    device = LocalTuyaDevice("abc", "192.0.2.1", "3.3", KEY, lambda dps: None, lambda: None)
+    device._codec = TuyaCodec("3.3", KEY)
+    device._writer = FakeWriter()
+    return device
+
+
+async def test_concurrent_requests_get_their_replies_in_order() -> None:
+    device = connected_device()
+    first = asyncio.create_task(device._send(CONTROL, {"dps": {"1": 1}}, CONTROL))
+    second = asyncio.create_task(device._send(CONTROL, {"dps": {"2": 2}}, CONTROL))
+    await asyncio.sleep(0)
+
+    peer = TuyaCodec("3.3", KEY)
+    reader = reader_for(peer.pack(CONTROL, b'{"n":1}') + peer.pack(CONTROL, b'{"n":2}'))
+    reading = asyncio.create_task(device._read_loop(reader, device._codec))
+    try:
+        assert await first == b'{"n":1}'
+        assert await second == b'{"n":2}'
+    finally:
+        reading.cancel()
+    assert device._replies[CONTROL] == deque()
+
+
+async def test_closing_fails_every_waiting_request() -> None:
+    device = connected_device()
+    requests = [
+        asyncio.create_task(device._send(CONTROL, {"dps": {"1": n}}, CONTROL)) for n in range(2)
+    ]
+    await asyncio.sleep(0)
+
+    device._close()
+
+    for request in requests:
+        with pytest.raises(TuyaLocalError, match="connection closed"):
+            await request
@@ -0,0 +1,90 @@
+"""Tests for keeping the Tuya mobile session across restarts."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.philips_pet_series.tuya_cloud import release_signer
+from custom_components.philips_pet_series.tuya_session import TuyaSessionStore, storage_key
+
+SESSION = SimpleNamespace(
+    sid="sid-1", ecode="ecode-1", uid="uid-1", mobile_url="https://a1.tuyaeu.com"
+)
+
+
+def client(mobile=None, id_token: str | None = "token") -> SimpleNamespace:
+    return SimpleNamespace(
+        auth=SimpleNamespace(id_token=id_token),
+        _tuya_lock=asyncio.Lock(),
+        _tuya_mobile=mobile,
+        _tuya_mobile_session=None,
+    )
+
+
+@pytest.fixture
+async def saved(hass, hass_storage) -> dict:
+    await TuyaSessionStore(hass, "entry-1").async_capture(client(SESSION))
+    return hass_storage
+
+
+async def test_the_session_is_saved_sealed(saved) -> None:
+    stored = json.dumps(saved[storage_key("entry-1")]["data"])
+
+    assert "sid-1" not in stored
+    assert "ecode-1" not in stored
+
+
+async def test_an_unchanged_session_is_not_saved_again(hass, hass_storage) -> None:
+    store = TuyaSessionStore(hass, "entry-1")
+    await store.async_capture(client(SESSION))
+    del hass_storage[storage_key("entry-1")]
+
+    await store.async_capture(client(SESSION))
+    assert storage_key("entry-1") not in hass_storage
+
+    await store.async_capture(client(SimpleNamespace(**{**vars(SESSION), "sid": "sid-2"})))
+    assert storage_key("entry-1") in hass_storage
+
+
+async def test_the_saved_session_is_put_back_on_the_client(hass, saved) -> None:
+    restored = client()
+
+    assert await TuyaSessionStore(hass, "entry-1").async_restore(restored)
+    try:
+        mobile = restored._tuya_mobile
+        assert (mobile.sid, mobile.ecode, mobile.uid, mobile.mobile_url) == (
+            SESSION.sid,
+            SESSION.ecode,
+            SESSION.uid,
+            SESSION.mobile_url,
+        )
+    finally:
+        await restored._tuya_mobile_session.close()
+        release_signer(restored._tuya_mobile)
+
+
+async def test_a_client_with_a_session_keeps_it(hass, saved) -> None:
+    current = SimpleNamespace(sid="sid-2")
+    logged_in = client(current)
+
+    assert not await TuyaSessionStore(hass, "entry-1").async_restore(logged_in)
+    assert logged_in._tuya_mobile is current
+
+
+async def test_a_signed_out_client_is_not_restored(hass, saved) -> None:
+    signed_out = client(id_token=None)
+
+    assert not await TuyaSessionStore(hass, "entry-1").async_restore(signed_out)
+    assert signed_out._tuya_mobile is None
+
+
+async def test_another_entry_cannot_open_the_session(hass, saved) -> None:
+    saved[storage_key("entry-2")] = saved[storage_key("entry-1")]
+    other = client()
+
+    assert not await TuyaSessionStore(hass, "entry-2").async_restore(other)
+    assert other._tuya_mobile is None
@@ -0,0 +1,102 @@
+"""Tests for applying config entry updates without a full reload."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.philips_pet_series import _async_update_listener, _entry_settings
+from custom_components.philips_pet_series.bridge import (
+    CAMERA_MODE_ALWAYS,
+    CAMERA_MODE_DISABLED,
+    CAMERA_MODE_ON_DEMAND,
+)
+from custom_components.philips_pet_series.const import (
+    CONF_CAMERA_MODE,
+    CONF_ID_TOKEN,
+    CONF_IDLE_TIMEOUT,
+    DOMAIN,
+)
+
+DATA = {
+    "access_token": "access-1",
+    "refresh_token": "refresh-1",
+    CONF_ID_TOKEN: "id-1",
+    "country": "NL",
+}
+OPTIONS = {CONF_CAMERA_MODE: CAMERA_MODE_ON_DEMAND, CONF_IDLE_TIMEOUT: 5}
+
+
+@pytest.fixture
+def entry(hass) -> MockConfigEntry:
+    entry = MockConfigEntry(domain=DOMAIN, data=DATA, options=OPTIONS)
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+def bridge(hass, entry) -> AsyncMock:
+    bridge = AsyncMock()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+        "settings": _entry_settings(entry),
+        "bridge": bridge,
+    }
+    return bridge
+
+
+@pytest.fixture
+def reload(hass, monkeypatch) -> AsyncMock:
+    reload = AsyncMock()
+    monkeypatch.setattr(hass.config_entries, "async_reload", reload)
+    return reload
+
+
+async def update(hass, entry, **changes) -> None:
+    hass.config_entries.async_update_entry(entry, **changes)
+    await _async_update_listener(hass, entry)
+
+
+async def test_token_refresh_is_left_alone(hass, entry, bridge, reload) -> None:
+    tokens = {"access_token": "access-2", "refresh_token": "refresh-2", CONF_ID_TOKEN: "id-2"}
+
+    await update(hass, entry, data={**DATA, **tokens})
+
+    reload.assert_not_awaited()
+    bridge.async_restart.assert_not_awaited()
+
+
+async def test_camera_options_restart_only_the_bridge(hass, entry, bridge, reload) -> None:
+    await update(hass, entry, options={CONF_CAMERA_MODE: CAMERA_MODE_ALWAYS, CONF_IDLE_TIMEOUT: 10})
+
+    bridge.async_restart.assert_awaited_once()
+    reload.assert_not_awaited()
+
+
+async def test_turning_the_camera_off_reloads(hass, entry, bridge, reload) -> None:
+    await update(hass, entry, options={**OPTIONS, CONF_CAMERA_MODE: CAMERA_MODE_DISABLED})
+
+    bridge.async_restart.assert_not_awaited()
+    reload.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_a_failed_bridge_restart_reloads(hass, entry, bridge, reload) -> None:
+    bridge.async_restart.side_effect = RuntimeError("port in use")
+
+    await update(hass, entry, options={**OPTIONS, CONF_IDLE_TIMEOUT: 10})
+
+    reload.assert_awaited_once_with(entry.entry_id)
+
+
+async def test_other_settings_reload(hass, entry, bridge, reload) -> None:
+    await update(hass, entry, data={**DATA, "country": "BE"})
+
+    reload.assert_awaited_once_with(entry.entry_id)
+    assert hass.data[DOMAIN][entry.entry_id]["settings"]["country"] == "BE"
+
+
+async def test_an_entry_that_is_not_set_up_reloads(hass, entry, reload) -> None:
+    await update(hass, entry, data={**DATA, "access_token": "access-2"})
+
+    reload.assert_awaited_once_with(entry.entry_id)